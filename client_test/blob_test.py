@@ -1,12 +1,21 @@
 # Copyright Modal Labs 2022
+import os
+
+import aiohttp.web
 import pytest
 
-from modal._blob_utils import blob_download, blob_upload
+import modal._blob_utils
+from modal._blob_cache import LocalBlobCache, blob_download_cache, blob_upload_cache
+from modal._blob_utils import _download_ranged, blob_download, blob_iter, blob_upload, blob_upload_file
 from modal.exception import ExecutionError
 from modal_utils.async_utils import synchronize_apis
+from modal_utils.http_utils import run_temporary_http_server
 
 _, aio_blob_upload = synchronize_apis(blob_upload)
+_, aio_blob_upload_file = synchronize_apis(blob_upload_file)
 _, aio_blob_download = synchronize_apis(blob_download)
+_, aio_blob_iter = synchronize_apis(blob_iter)
+_, aio_download_ranged = synchronize_apis(_download_ranged)
 
 
 @pytest.mark.asyncio
@@ -44,3 +53,170 @@ async def test_blob_multipart(servicer, blob_server, aio_client):
     data = b"*" * 10_000_020
     blob_id = await aio_blob_upload(data, aio_client.stub)
     assert await aio_blob_download(blob_id, aio_client.stub) == data
+
+
+@pytest.mark.asyncio
+async def test_blob_many_small_transfers_reuse_connections(servicer, blob_server, aio_client):
+    n_transfers = 50
+    peers = set()
+
+    async def download(request):
+        peers.add(request.transport.get_extra_info("peername"))
+        return aiohttp.web.Response(body=b"x" * 100)
+
+    app = aiohttp.web.Application()
+    app.add_routes([aiohttp.web.get("/download", download)])
+    async with run_temporary_http_server(app) as host:
+        for _ in range(n_transfers):
+            assert await aio_download_ranged(f"{host}/download", 1024, 1) == b"x" * 100
+
+    # All sequential transfers go through the same pooled keep-alive connection
+    assert len(peers) == 1
+
+    # Round trips through the blob server also work with the shared session
+    for i in range(n_transfers):
+        blob_id = await aio_blob_upload(b"small %d" % i, aio_client.stub)
+        assert await aio_blob_download(blob_id, aio_client.stub) == b"small %d" % i
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [0, 1, 999, 1000, 10_050])
+async def test_blob_download_ranged(servicer, blob_server, aio_client, size):
+    data = bytes(i % 251 for i in range(size))
+    blob_id = await aio_blob_upload(data, aio_client.stub)
+    assert await aio_blob_download(blob_id, aio_client.stub, part_size=1000, parallelism=3) == data
+
+    chunks = [chunk async for chunk in aio_blob_iter(blob_id, aio_client.stub, part_size=1000, parallelism=3)]
+    assert all(len(chunk) <= 1000 for chunk in chunks)
+    assert b"".join(chunks) == data
+
+
+@pytest.mark.asyncio
+async def test_blob_download_ranged_retries_part(servicer, aio_client):
+    data = bytes(i % 251 for i in range(10_000))
+    failed_ranges = set()
+
+    async def download(request):
+        byte_range = request.http_range
+        if byte_range.start == 5000 and byte_range.start not in failed_ranges:
+            # Fail each part once
+            failed_ranges.add(byte_range.start)
+            return aiohttp.web.Response(status=500)
+        stop = min(byte_range.stop, len(data))
+        headers = {"Content-Range": f"bytes {byte_range.start}-{stop - 1}/{len(data)}"}
+        return aiohttp.web.Response(status=206, body=data[byte_range.start : stop], headers=headers)
+
+    app = aiohttp.web.Application()
+    app.add_routes([aiohttp.web.get("/download", download)])
+    async with run_temporary_http_server(app) as host:
+        assert await aio_download_ranged(f"{host}/download", 1000, 4) == data
+    assert failed_ranges == {5000}
+
+
+@pytest.mark.asyncio
+async def test_blob_multipart_file(servicer, blob_server, aio_client, tmp_path):
+    servicer.blob_multipart_threshold = 1_000_000
+    data = bytes(i % 251 for i in range(10_000_020))
+    path = tmp_path / "large.bin"
+    path.write_bytes(data)
+    with open(path, "rb") as fp:
+        fp.seek(20)  # uploads start at the current position of the file
+        blob_id = await aio_blob_upload_file(fp, aio_client.stub)
+    assert await aio_blob_download(blob_id, aio_client.stub) == data[20:]
+
+
+@pytest.mark.asyncio
+async def test_blob_multipart_resume(servicer, blob_server, blob_server_faults, aio_client, monkeypatch):
+    # Don't retry failed parts, so the first upload attempt fails quickly
+    monkeypatch.setattr(modal._blob_utils, "_upload_to_s3_url", modal._blob_utils._upload_to_s3_url.__wrapped__)
+    # Upload parts one at a time, so it's deterministic which ones made it before the failure
+    monkeypatch.setattr(modal._blob_utils, "MULTIPART_UPLOAD_PARALLELISM", 1)
+    servicer.blob_multipart_threshold = 1_000_000
+    data = bytes(i % 251 for i in range(5_500_000))
+
+    blob_server_faults["fail_parts"].add(3)
+    with pytest.raises(ExecutionError):
+        await aio_blob_upload(data, aio_client.stub)
+    assert servicer.n_blobs == 1
+    first_attempt_parts = {part for _, part in blob_server_faults["uploaded_parts"]}
+    assert first_attempt_parts == {0, 1, 2}
+
+    # The retry reuses the same blob and only uploads the missing parts
+    blob_server_faults["fail_parts"].clear()
+    blob_server_faults["uploaded_parts"].clear()
+    blob_id = await aio_blob_upload(data, aio_client.stub)
+    assert blob_id == "bl-1"
+    assert servicer.n_blobs == 1
+    retried_parts = {part for _, part in blob_server_faults["uploaded_parts"]}
+    assert retried_parts == {3, 4, 5}
+    assert await aio_blob_download(blob_id, aio_client.stub) == data
+
+    # Once completed, the state is removed and new uploads start from scratch
+    blob_upload_cache.clear()
+    blob_server_faults["uploaded_parts"].clear()
+    await aio_blob_upload(data, aio_client.stub)
+    assert servicer.n_blobs == 2
+    assert len(blob_server_faults["uploaded_parts"]) == 6
+
+
+@pytest.mark.asyncio
+async def test_blob_multipart_resume_expired(servicer, blob_server, blob_server_faults, aio_client, monkeypatch):
+    monkeypatch.setattr(modal._blob_utils, "_upload_to_s3_url", modal._blob_utils._upload_to_s3_url.__wrapped__)
+    servicer.blob_multipart_threshold = 1_000_000
+    data = bytes(i % 251 for i in range(2_500_000))
+
+    blob_server_faults["fail_parts"].add(1)
+    with pytest.raises(ExecutionError):
+        await aio_blob_upload(data, aio_client.stub)
+
+    blob_server_faults["fail_parts"].clear()
+    monkeypatch.setattr(modal._blob_utils, "MULTIPART_UPLOAD_STATE_TTL", -1)
+    blob_id = await aio_blob_upload(data, aio_client.stub)
+    assert blob_id == "bl-2"
+    assert await aio_blob_download(blob_id, aio_client.stub) == data
+
+
+@pytest.mark.asyncio
+async def test_blob_upload_cache(servicer, blob_server, aio_client, monkeypatch):
+    blob_id = await aio_blob_upload(b"some large model", aio_client.stub)
+    assert await aio_blob_upload(b"some large model", aio_client.stub) == blob_id
+    assert servicer.n_blobs == 1
+
+    assert await aio_blob_upload(b"some other model", aio_client.stub) != blob_id
+    assert servicer.n_blobs == 2
+
+    # Entries expire, since the server eventually deletes blobs
+    monkeypatch.setattr(blob_upload_cache, "_ttl", -1)
+    assert await aio_blob_upload(b"some large model", aio_client.stub) != blob_id
+    assert servicer.n_blobs == 3
+
+
+@pytest.mark.asyncio
+async def test_blob_download_cache(servicer, blob_server, aio_client):
+    _, blobs = blob_server
+    blob_id = await aio_blob_upload(b"Hello, world", aio_client.stub)
+    assert await aio_blob_download(blob_id, aio_client.stub) == b"Hello, world"
+
+    # Served from the local cache, without hitting the blob server
+    del blobs[blob_id]
+    assert await aio_blob_download(blob_id, aio_client.stub) == b"Hello, world"
+    assert blob_download_cache.get(blob_id) == b"Hello, world"
+
+
+def test_local_blob_cache_eviction():
+    cache = LocalBlobCache("test", max_bytes=25)
+    cache.put("a", b"a" * 10)
+    cache.put("b", b"b" * 10)
+    # Reading an entry marks it as recently used
+    os.utime(cache._path("a"), (0, 0))
+    os.utime(cache._path("b"), (1, 1))
+    assert cache.get("a") == b"a" * 10
+
+    cache.put("c", b"c" * 10)
+    assert cache.get("a") == b"a" * 10
+    assert cache.get("b") is None
+    assert cache.get("c") == b"c" * 10
+
+    # Entries larger than the cache are never stored
+    cache.put("d", b"d" * 30)
+    assert cache.get("d") is None
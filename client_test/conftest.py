@@ -5,9 +5,11 @@ import asyncio
 import contextlib
 import hashlib
 import inspect
+import io
 import os
 import shutil
 import sys
+import tarfile
 import tempfile
 import traceback
 from collections import defaultdict
@@ -73,6 +75,12 @@ class MockClientServicer(api_grpc.ModalClientBase):
         self.n_queues = 0
         self.files_name2sha = {}
         self.files_sha2data = {}
+        self.n_mount_get_missing_files = 0
+        self.n_mount_put_file = 0
+        self.n_mount_put_archive = 0
+        self.mount_get_missing_files_unimplemented = False
+        self.n_mount_build = 0
+        self.mount_manifests: Dict[str, str] = {}
         self.client_calls = {}
         self.function_is_running = False
         self.n_functions = 0
@@ -429,8 +437,31 @@ class MockClientServicer(api_grpc.ModalClientBase):
 
     ### Mount
 
+    async def MountGetMissingFiles(self, stream):
+        request: api_pb2.MountGetMissingFilesRequest = await stream.recv_message()
+        if self.mount_get_missing_files_unimplemented:
+            raise GRPCError(Status.UNIMPLEMENTED)
+        self.n_mount_get_missing_files += 1
+        missing = [sha256_hex for sha256_hex in request.sha256_hexes if sha256_hex not in self.files_sha2data]
+        await stream.send_message(api_pb2.MountGetMissingFilesResponse(missing_sha256_hexes=missing))
+
+    async def MountPutArchive(self, stream):
+        request: api_pb2.MountPutArchiveRequest = await stream.recv_message()
+        self.n_mount_put_archive += 1
+        if request.WhichOneof("data_oneof") == "data_blob_id":
+            archive = self.blobs[request.data_blob_id]
+        else:
+            archive = request.data
+        with tarfile.open(fileobj=io.BytesIO(archive), mode="r:gz") as tar:
+            for member in tar.getmembers():
+                data = tar.extractfile(member).read()
+                assert hashlib.sha256(data).hexdigest() == member.name
+                self.files_sha2data[member.name] = {"data": data, "data_blob_id": ""}
+        await stream.send_message(api_pb2.MountPutArchiveResponse())
+
     async def MountPutFile(self, stream):
         request: api_pb2.MountPutFileRequest = await stream.recv_message()
+        self.n_mount_put_file += 1
         if request.WhichOneof("data_oneof") is not None:
             self.files_sha2data[request.sha256_hex] = {"data": request.data, "data_blob_id": request.data_blob_id}
             await stream.send_message(api_pb2.MountPutFileResponse(exists=True))
@@ -439,10 +470,17 @@ class MockClientServicer(api_grpc.ModalClientBase):
 
     async def MountBuild(self, stream):
         request: api_pb2.MountBuildRequest = await stream.recv_message()
+        self.n_mount_build += 1
         for file in request.files:
             self.files_name2sha[file.filename] = file.sha256_hex
+        self.mount_manifests["mo-123"] = request.manifest_sha256_hex
         await stream.send_message(api_pb2.MountBuildResponse(mount_id="mo-123"))
 
+    async def MountReuse(self, stream):
+        request: api_pb2.MountReuseRequest = await stream.recv_message()
+        reused = self.mount_manifests.get(request.mount_id) == request.manifest_sha256_hex
+        await stream.send_message(api_pb2.MountReuseResponse(reused=reused))
+
     ### Queue
 
     async def QueueCreate(self, stream):
@@ -505,8 +543,14 @@ class MockClientServicer(api_grpc.ModalClientBase):
         )
 
 
+@pytest.fixture
+def blob_server_faults():
+    """Fault injection for the blob server: part numbers to reject, and a log of all accepted part uploads"""
+    return {"fail_parts": set(), "uploaded_parts": []}
+
+
 @pytest_asyncio.fixture
-async def blob_server():
+async def blob_server(blob_server_faults):
     blobs = {}
     blob_parts: Dict[str, Dict[int, bytes]] = defaultdict(dict)
 
@@ -519,6 +563,9 @@ async def blob_server():
         etag = f'"{content_md5}"'
         if "part_number" in request.query:
             part_number = int(request.query["part_number"])
+            if part_number in blob_server_faults["fail_parts"]:
+                return aiohttp.web.Response(status=500)
+            blob_server_faults["uploaded_parts"].append((blob_id, part_number))
             blob_parts[blob_id][part_number] = content
         else:
             blobs[blob_id] = content
@@ -543,7 +590,16 @@ async def blob_server():
         blob_id = request.query["blob_id"]
         if blob_id == "bl-failure":
             return aiohttp.web.Response(status=500)
-        return aiohttp.web.Response(body=blobs[blob_id])
+        blob = blobs[blob_id]
+        byte_range = request.http_range
+        if byte_range.start is None:
+            return aiohttp.web.Response(body=blob)
+        start = byte_range.start
+        stop = len(blob) if byte_range.stop is None else min(byte_range.stop, len(blob))
+        if start >= len(blob):
+            return aiohttp.web.Response(status=416)
+        headers = {"Content-Range": f"bytes {start}-{stop - 1}/{len(blob)}"}
+        return aiohttp.web.Response(status=206, body=blob[start:stop], headers=headers)
 
     app = aiohttp.web.Application()
     app.add_routes([aiohttp.web.put("/upload", upload)])
@@ -666,6 +722,14 @@ def mock_dir_factory():
     return mock_dir
 
 
+@pytest.fixture(autouse=True)
+def modal_cache_dir(tmp_path_factory, monkeypatch):
+    # Don't let local caches leak between tests, or into the user's cache dir
+    cache_dir = tmp_path_factory.mktemp("modal_cache")
+    monkeypatch.setenv("MODAL_CACHE_DIR", str(cache_dir))
+    yield cache_dir
+
+
 @pytest.fixture(autouse=True)
 def reset_sys_modules():
     # Needed since some tests will import dynamic modules
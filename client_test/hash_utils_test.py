@@ -0,0 +1,49 @@
+# Copyright Modal Labs 2023
+import base64
+import hashlib
+import io
+import time
+
+from modal._blob_utils import LARGE_FILE_LIMIT, get_file_upload_spec
+from modal_utils.hash_utils import HASH_CHUNK_SIZE, get_sha256_hex, get_upload_hashes
+
+
+def test_upload_hashes():
+    data = bytes(i % 251 for i in range(3 * HASH_CHUNK_SIZE + 17))
+    expected_md5 = base64.b64encode(hashlib.md5(data).digest()).decode("ascii")
+    expected_sha256 = hashlib.sha256(data).hexdigest()
+
+    for source in [data, io.BytesIO(data)]:
+        hashes = get_upload_hashes(source)
+        assert hashes.md5_base64 == expected_md5
+        assert hashes.sha256_hex() == expected_sha256
+
+    # File objects are hashed from the current position, which is restored afterwards
+    fp = io.BytesIO(b"skip" + data)
+    fp.seek(4)
+    assert get_sha256_hex(fp) == expected_sha256
+    assert fp.tell() == 4
+
+
+def test_file_upload_spec_reuses_hashes(tmp_path):
+    data = b"x" * LARGE_FILE_LIMIT
+    path = tmp_path / "large.bin"
+    path.write_bytes(data)
+    spec = get_file_upload_spec(str(path), "/large.bin")
+    assert spec.use_blob
+    assert spec.sha256_hex == hashlib.sha256(data).hexdigest()
+    assert spec.upload_hashes == get_upload_hashes(data)
+
+    path.write_bytes(b"small")
+    spec = get_file_upload_spec(str(path), "/small.bin")
+    assert not spec.use_blob
+    assert spec.upload_hashes is None
+
+
+def test_upload_hashes_throughput():
+    # Guards against regressing to small reads: hashing should run well above this rate
+    data = io.BytesIO(b"\0" * 64 * 1024 * 1024)
+    t0 = time.monotonic()
+    get_upload_hashes(data)
+    elapsed = time.monotonic() - t0
+    assert 64 / elapsed > 50  # MB/s
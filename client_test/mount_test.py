@@ -143,3 +143,130 @@ def test_create_package_mounts_missing_module(servicer, client, test_dir):
 
     with pytest.raises(NotFoundError):
         stub.function(dummy, mounts=create_package_mounts(["nonexistent_package"]))
+
+
+@pytest.mark.asyncio
+async def test_get_files_hash_cache(servicer, aio_client, tmp_path):
+    n_files = 200
+    for i in range(n_files):
+        path = tmp_path / f"{i}.py"
+        path.write_text(f"x = {i}\n")
+        os.utime(path, (1_600_000_000, 1_600_000_000))  # old enough to be cached
+    m = AioMount.from_local_dir(tmp_path, remote_path="/")
+
+    async def get_files():
+        return {spec.mount_filename: spec async for spec in m._get_files()}
+
+    # Cold: every file is read and hashed
+    cold_files = await get_files()
+    assert all(spec.content is not None for spec in cold_files.values())
+
+    # Warm: hashes come from the cache without reading the files
+    warm_files = await get_files()
+    assert all(spec.content is None for spec in warm_files.values())
+    assert {name: spec.sha256_hex for name, spec in warm_files.items()} == {
+        name: spec.sha256_hex for name, spec in cold_files.items()
+    }
+
+    # Changing a file invalidates its entry
+    (tmp_path / "0.py").write_text("x = 'changed'\n")
+    os.utime(tmp_path / "0.py", (1_600_000_001, 1_600_000_001))
+    warm_files = await get_files()
+    assert warm_files["/0.py"].content == b"x = 'changed'\n"
+    assert warm_files["/0.py"].sha256_hex == hashlib.sha256(b"x = 'changed'\n").hexdigest()
+    assert warm_files["/1.py"].content is None
+
+    # Files are read when they need to be uploaded
+    await AioApp._create_one_object(aio_client, m)
+    assert len(servicer.files_name2sha) == n_files
+    for name, sha256_hex in servicer.files_name2sha.items():
+        assert servicer.files_sha2data[sha256_hex]["data"] == (tmp_path / name.lstrip("/")).read_bytes()
+
+
+@pytest.mark.asyncio
+async def test_hash_cache_stale_entry(servicer, aio_client, tmp_path):
+    path = tmp_path / "a.py"
+    path.write_text("x = 1\n")
+    os.utime(path, (1_600_000_000, 1_600_000_000))
+    m = AioMount.from_local_dir(tmp_path, remote_path="/")
+    [spec async for spec in m._get_files()]
+
+    # Same size, mtime and inode, but different content: the upload notices that the cached hash is stale
+    with open(path, "r+") as f:
+        f.write("x = 2\n")
+    os.utime(path, (1_600_000_000, 1_600_000_000))
+    await AioApp._create_one_object(aio_client, m)
+    assert servicer.files_name2sha["/a.py"] == hashlib.sha256(b"x = 2\n").hexdigest()
+    assert servicer.files_sha2data[hashlib.sha256(b"x = 2\n").hexdigest()]["data"] == b"x = 2\n"
+
+
+@pytest.mark.parametrize("batch_check_supported", [True, False])
+def test_mount_existence_check(servicer, client, tmp_path, batch_check_supported):
+    servicer.mount_get_missing_files_unimplemented = not batch_check_supported
+    for i in range(20):
+        (tmp_path / f"{i}.py").write_text(f"x = {i % 10}\n")  # every file has a duplicate
+    m = Mount.from_local_dir(tmp_path, remote_path="/")
+
+    App._create_one_object(client, m)
+    assert len(servicer.files_name2sha) == 20
+    assert len(servicer.files_sha2data) == 10
+
+    # Nothing is uploaded the second time
+    servicer.n_mount_put_file = 0
+    servicer.n_mount_get_missing_files = 0
+    App._create_one_object(client, m)
+    if batch_check_supported:
+        assert servicer.n_mount_put_file == 0
+        assert servicer.n_mount_get_missing_files == 1
+    else:
+        assert servicer.n_mount_put_file >= 20  # one existence check per file
+        assert servicer.n_mount_get_missing_files == 0
+
+
+def test_mount_manifest_cache(servicer, client, tmp_path):
+    for i in range(5):
+        (tmp_path / f"{i}.py").write_text(f"x = {i}\n")
+    m = Mount.from_local_dir(tmp_path, remote_path="/")
+
+    obj, _ = App._create_one_object(client, m)
+    assert servicer.n_mount_build == 1
+
+    # Unchanged contents: the mount from the previous run is reused
+    obj2, _ = App._create_one_object(client, m)
+    assert obj2.object_id == obj.object_id
+    assert servicer.n_mount_build == 1
+
+    # Changed contents
+    (tmp_path / "0.py").write_text("x = 'changed'\n")
+    App._create_one_object(client, m)
+    assert servicer.n_mount_build == 2
+
+    # The server no longer has the mount
+    servicer.mount_manifests.clear()
+    App._create_one_object(client, m)
+    assert servicer.n_mount_build == 3
+
+
+@pytest.mark.parametrize("archive_supported", [True, False])
+def test_mount_archive(servicer, client, tmp_path, monkeypatch, archive_supported):
+    monkeypatch.setattr("modal.mount.MOUNT_ARCHIVE_MAX_BYTES", 3000)
+    if not archive_supported:
+        monkeypatch.delattr(type(servicer), "MountPutArchive")
+    for i in range(100):
+        (tmp_path / f"{i}.py").write_text(f"x = {i}\n" * 10)
+    (tmp_path / "large.bin").write_bytes(b"a" * (LARGE_FILE_LIMIT + 1))
+    m = Mount.from_local_dir(tmp_path, remote_path="/")
+
+    App._create_one_object(client, m)
+    assert len(servicer.files_name2sha) == 101
+    for name, sha256_hex in servicer.files_name2sha.items():
+        data = servicer.files_sha2data[sha256_hex]
+        if name == "/large.bin":
+            assert data["data_blob_id"]
+        else:
+            assert data["data"] == (tmp_path / name.lstrip("/")).read_bytes()
+    if archive_supported:
+        assert 1 < servicer.n_mount_put_archive < 10
+        assert servicer.n_mount_put_file == 1  # only the large file
+    else:
+        assert servicer.n_mount_put_file == 101
@@ -0,0 +1,132 @@
+# Copyright Modal Labs 2023
+import contextlib
+import os
+import shutil
+import time
+from typing import Iterator, List, Optional, Tuple
+
+from modal_utils.logger import logger
+
+from .config import config
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore
+
+# Uploaded blobs are only reused for a limited time, since the server eventually expires them
+BLOB_UPLOAD_CACHE_TTL = 15 * 60
+BLOB_UPLOAD_CACHE_MAX_BYTES = 16 * 1024 * 1024  # entries are just blob ids, so this is a lot of them
+
+MOUNT_MANIFEST_CACHE_TTL = 7 * 24 * 3600  # mounts are validated on reuse, this just bounds stale entries
+MOUNT_MANIFEST_CACHE_MAX_BYTES = 1024 * 1024
+
+BLOB_DOWNLOAD_CACHE_MAX_BYTES = 1024 * 1024 * 1024  # 1GiB
+# Larger blobs aren't cached, so a single download can't flush the whole cache
+BLOB_DOWNLOAD_CACHE_MAX_ENTRY_BYTES = BLOB_DOWNLOAD_CACHE_MAX_BYTES // 4
+
+
+class LocalBlobCache:
+    """Size-bounded on-disk cache with LRU eviction, safe to share between processes.
+
+    Each entry is a file in `cache_dir/name`, written atomically with a rename, so readers never
+    need a lock. Writers take an exclusive file lock while evicting entries. Entries are ordered by
+    their mtime, which is bumped when an entry is read unless the cache has a `ttl`, in which case
+    the mtime is the creation time the ttl is measured from.
+    """
+
+    def __init__(self, name: str, max_bytes: int, ttl: Optional[float] = None):
+        self._name = name
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+
+    @property
+    def root(self) -> str:
+        # Resolved on every access since the config can change at runtime (e.g. in tests)
+        return os.path.join(config["cache_dir"], self._name)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, key)
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            if self._ttl is not None and time.time() - os.stat(path).st_mtime > self._ttl:
+                self._remove(path)
+                return None
+            with open(path, "rb") as f:
+                data = f.read()
+            if self._ttl is None:
+                os.utime(path)
+            return data
+        except OSError:
+            return None
+
+    def put(self, key: str, data: bytes):
+        if len(data) > self._max_bytes:
+            return
+        path = self._path(key)
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            with self._lock():
+                self._evict()
+        except OSError as exc:
+            logger.debug(f"Failed to write {path} to the blob cache: {exc}")
+
+    def clear(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        entries = []
+        for entry in os.scandir(self.root):
+            if entry.name.startswith(".") or entry.name.endswith(".tmp"):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue  # removed by another process
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _evict(self):
+        entries = self._entries()
+        total_bytes = sum(size for _, size, _ in entries)
+        now = time.time()
+        for mtime, size, path in sorted(entries):
+            expired = self._ttl is not None and now - mtime > self._ttl
+            if total_bytes <= self._max_bytes and not expired:
+                break
+            self._remove(path)
+            total_bytes -= size
+
+    def _remove(self, path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    @contextlib.contextmanager
+    def _lock(self) -> Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+        with open(os.path.join(self.root, ".lock"), "w") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+# Maps sha256 of uploaded content to the id of the blob it was uploaded as
+blob_upload_cache = LocalBlobCache("blob_upload", BLOB_UPLOAD_CACHE_MAX_BYTES, ttl=BLOB_UPLOAD_CACHE_TTL)
+
+# Maps blob ids to their downloaded content
+blob_download_cache = LocalBlobCache("blob_download", BLOB_DOWNLOAD_CACHE_MAX_BYTES)
+
+# Maps digests of mount manifests to the id of the mount that was built from them
+mount_manifest_cache = LocalBlobCache("mount_manifests", MOUNT_MANIFEST_CACHE_MAX_BYTES, ttl=MOUNT_MANIFEST_CACHE_TTL)
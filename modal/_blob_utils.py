@@ -1,24 +1,32 @@
 # Copyright Modal Labs 2022
 import asyncio
+import base64
+import collections
 import dataclasses
 import hashlib
 import io
+import json
 import os
+import time
 from contextlib import contextmanager
-from typing import AsyncIterator, BinaryIO, Optional, Union, List
+from typing import AsyncIterator, BinaryIO, Callable, Deque, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 from aiohttp import BytesIOPayload
 from aiohttp.abc import AbstractStreamWriter
 
+from modal.config import config
 from modal.exception import ExecutionError
 from modal_proto import api_pb2
-from modal_utils.async_utils import retry
+from modal_utils.async_utils import asyncify, retry
 from modal_utils.grpc_utils import retry_transient_errors
 from modal_utils.hash_utils import get_sha256_hex, get_upload_hashes, UploadHashes
-from modal_utils.http_utils import http_client_with_tls
+from modal_utils.http_utils import shared_http_session
 from modal_utils.logger import logger
 
+from ._blob_cache import BLOB_DOWNLOAD_CACHE_MAX_ENTRY_BYTES, blob_download_cache, blob_upload_cache
+from ._file_hash_cache import FileHashCache
+
 # Max size for function inputs and outputs.
 MAX_OBJECT_SIZE_BYTES = 1024 * 1024  # 1MB
 
@@ -29,15 +37,31 @@ LARGE_FILE_LIMIT = 1024 * 1024  # 1MB
 # Max parallelism during map calls
 BLOB_MAX_PARALLELISM = 10
 
+# Blobs are downloaded as concurrent HTTP range requests of this size
+BLOB_DOWNLOAD_PART_SIZE = 16 * 1024 * 1024  # 16MiB
+
+# Max number of concurrent range requests per blob download
+BLOB_DOWNLOAD_PARALLELISM = 8
+
+# Max number of parts of a multipart upload that are sent concurrently
+MULTIPART_UPLOAD_PARALLELISM = 8
+
+# Progress of interrupted multipart uploads is discarded after this many seconds,
+# since the presigned upload urls it refers to expire
+MULTIPART_UPLOAD_STATE_TTL = 60 * 60
+
 
 class BytesIOSegmentPayload(BytesIOPayload):
     """Modified bytes payload for concurrent sends of chunks from the same file
 
     Adds:
     * read limit using remaining_bytes, in order to split files across streams
-    * read lock to prevent file object seeks by concurrent parts
+    * positional reads (`os.pread` on the file descriptor, or slices of the underlying
+      buffer for BytesIO objects) so concurrent parts don't contend on a shared file position
+    * read lock to prevent file object seeks by concurrent parts, for file-like objects
+      that support neither of the above
     * larger read chunk (to prevent excessive read contention between parts)
-    * calculates an md5 for the segment
+    * calculates an md5 for the segment in the same executor call that reads the chunk
 
     Feels like this should be in some standard lib...
     """
@@ -60,6 +84,7 @@ class BytesIOSegmentPayload(BytesIOPayload):
         assert self.segment_length <= super().size
         self.read_lock = read_lock
         self.chunk_size = chunk_size
+        self._fileno = _get_pread_fileno(bytes_io)
         self.reset_state()
 
     def reset_state(self):
@@ -81,20 +106,35 @@ class BytesIOSegmentPayload(BytesIOPayload):
     def md5_checksum(self):
         return self._md5_checksum
 
+    def _read_chunk(self, offset: int, num_bytes: int) -> bytes:
+        # Runs in a thread: both the read and the md5 update release the GIL for large chunks
+        if self._fileno is not None:
+            chunk = os.pread(self._fileno, num_bytes, offset)
+        elif isinstance(self._value, io.BytesIO):
+            with self._value.getbuffer() as buf:
+                chunk = bytes(buf[offset : offset + num_bytes])
+        else:
+            pos = self._value.tell()
+            self._value.seek(offset)
+            chunk = self._value.read(num_bytes)
+            self._value.seek(pos)
+        self._md5_checksum.update(chunk)
+        return chunk
+
     async def write(self, writer: AbstractStreamWriter):
         loop = asyncio.get_event_loop()
 
         async def safe_read():
-            # concurrency safe reading from same file object
-            async with self.read_lock:
-                pos = self._value.tell()
-                read_start = self.initial_seek_pos + self.segment_start + self.num_bytes_read
-                self._value.seek(read_start)
-                num_bytes = min(self.chunk_size, self.remaining_bytes())
-                chunk = await loop.run_in_executor(None, self._value.read, num_bytes)
-                self._value.seek(pos)
-
-            await loop.run_in_executor(None, self._md5_checksum.update, chunk)
+            read_start = self.initial_seek_pos + self.segment_start + self.num_bytes_read
+            num_bytes = min(self.chunk_size, self.remaining_bytes())
+            if self._fileno is not None or isinstance(self._value, io.BytesIO):
+                # positional reads don't touch the shared file position, so no locking is needed
+                chunk = await loop.run_in_executor(None, self._read_chunk, read_start, num_bytes)
+            else:
+                # concurrency safe reading from same file object
+                async with self.read_lock:
+                    chunk = await loop.run_in_executor(None, self._read_chunk, read_start, num_bytes)
+
             self.num_bytes_read += len(chunk)
             return chunk
 
@@ -109,6 +149,21 @@ class BytesIOSegmentPayload(BytesIOPayload):
         return self.segment_length - self.num_bytes_read
 
 
+def _get_pread_fileno(data: BinaryIO) -> Optional[int]:
+    """Returns a file descriptor that supports `os.pread`, if the file object is backed by one."""
+    if not hasattr(os, "pread"):
+        return None  # e.g. Windows
+    try:
+        fileno = data.fileno()
+    except (AttributeError, OSError):
+        return None  # io.UnsupportedOperation is an OSError
+    try:
+        os.pread(fileno, 0, 0)
+    except OSError:
+        return None  # pipes and sockets don't support positional reads
+    return fileno
+
+
 @retry(n_attempts=5, base_delay=0.5, timeout=None)
 async def _upload_to_s3_url(
     upload_url,
@@ -118,47 +173,45 @@ async def _upload_to_s3_url(
 ) -> str:
     """Returns etag of s3 object which is a md5 hex checksum of the uploaded content"""
     with payload.reset_on_error():  # ensure retries read the same data
-        async with http_client_with_tls(timeout=None) as session:
-            headers = {}
-            if content_md5_b64 and use_md5(upload_url):
-                headers["Content-MD5"] = content_md5_b64
-            if content_type:
-                headers["Content-Type"] = content_type
-
-            async with session.put(
-                upload_url,
-                data=payload,
-                headers=headers,
-                skip_auto_headers=["content-type"] if content_type is None else [],
-            ) as resp:
-                # S3 signal to slow down request rate.
-                if resp.status == 503:
-                    logger.warning("Received SlowDown signal from S3, sleeping for 1 second before retrying.")
-                    await asyncio.sleep(1)
-
-                if resp.status != 200:
-                    try:
-                        text = await resp.text()
-                    except Exception:
-                        text = "<no body>"
-                    raise ExecutionError(f"Put to url {upload_url} failed with status {resp.status}: {text}")
-
-                # client side ETag checksum verification
-                # the s3 ETag of a single part upload is a quoted md5 hex of the uploaded content
-                etag = resp.headers["ETag"].strip()
-                if etag.startswith(("W/", "w/")):  # see https://www.rfc-editor.org/rfc/rfc7232#section-2.3
-                    etag = etag[2:]
-                if etag[0] == '"' and etag[-1] == '"':
-                    etag = etag[1:-1]
-                remote_md5 = etag
-
-                local_md5_hex = payload.md5_checksum().hexdigest()
-                if local_md5_hex != remote_md5:
-                    raise ExecutionError(
-                        f"Local data and remote data checksum mismatch ({local_md5_hex} vs {remote_md5})"
-                    )
-
-                return remote_md5
+        session = shared_http_session()
+        headers = {}
+        if content_md5_b64 and use_md5(upload_url):
+            headers["Content-MD5"] = content_md5_b64
+        if content_type:
+            headers["Content-Type"] = content_type
+
+        async with session.put(
+            upload_url,
+            data=payload,
+            headers=headers,
+            skip_auto_headers=["content-type"] if content_type is None else [],
+        ) as resp:
+            # S3 signal to slow down request rate.
+            if resp.status == 503:
+                logger.warning("Received SlowDown signal from S3, sleeping for 1 second before retrying.")
+                await asyncio.sleep(1)
+
+            if resp.status != 200:
+                try:
+                    text = await resp.text()
+                except Exception:
+                    text = "<no body>"
+                raise ExecutionError(f"Put to url {upload_url} failed with status {resp.status}: {text}")
+
+            # client side ETag checksum verification
+            # the s3 ETag of a single part upload is a quoted md5 hex of the uploaded content
+            etag = resp.headers["ETag"].strip()
+            if etag.startswith(("W/", "w/")):  # see https://www.rfc-editor.org/rfc/rfc7232#section-2.3
+                etag = etag[2:]
+            if etag[0] == '"' and etag[-1] == '"':
+                etag = etag[1:-1]
+            remote_md5 = etag
+
+            local_md5_hex = payload.md5_checksum().hexdigest()
+            if local_md5_hex != remote_md5:
+                raise ExecutionError(f"Local data and remote data checksum mismatch ({local_md5_hex} vs {remote_md5})")
+
+            return remote_md5
 
 
 async def perform_multipart_upload(
@@ -168,22 +221,39 @@ async def perform_multipart_upload(
     max_part_size: int,
     part_urls: List[str],
     completion_url: str,
+    uploaded_part_etags: Dict[int, str] = {},  # etags of parts that were uploaded by a previous attempt
+    on_part_uploaded: Optional[Callable[[int, str], None]] = None,
 ):
     upload_coros = []
     file_read_lock = asyncio.Lock()
+    upload_semaphore = asyncio.Semaphore(MULTIPART_UPLOAD_PARALLELISM)
     file_offset = 0
     num_bytes_left = content_length
 
+    async def upload_part(part_number: int, part_url: str, part_payload: BytesIOSegmentPayload) -> str:
+        if part_number in uploaded_part_etags:
+            return uploaded_part_etags[part_number]
+        async with upload_semaphore:
+            etag = await _upload_to_s3_url(part_url, payload=part_payload, content_type=None)
+        if on_part_uploaded is not None:
+            on_part_uploaded(part_number, etag)
+        return etag
+
     for part_number, part_url in enumerate(part_urls, start=1):
         part_length_bytes = min(num_bytes_left, max_part_size)
         part_payload = BytesIOSegmentPayload(
             data_file, file_read_lock, segment_start=file_offset, segment_length=part_length_bytes
         )
-        upload_coros.append(_upload_to_s3_url(part_url, payload=part_payload, content_type=None))
+        upload_coros.append(upload_part(part_number, part_url, part_payload))
         num_bytes_left -= part_length_bytes
         file_offset += part_length_bytes
 
-    part_etags = await asyncio.gather(*upload_coros)
+    upload_tasks = [asyncio.create_task(coro) for coro in upload_coros]
+    try:
+        part_etags = await asyncio.gather(*upload_tasks)
+    finally:
+        for task in upload_tasks:
+            task.cancel()
 
     # The body of the complete_multipart_upload command needs some data in xml format:
     completion_body = "<CompleteMultipartUpload>\n"
@@ -195,10 +265,10 @@ async def perform_multipart_upload(
     bin_hash_parts = [bytes.fromhex(etag) for etag in part_etags]
 
     expected_multipart_etag = hashlib.md5(b"".join(bin_hash_parts)).hexdigest() + f"-{len(part_etags)}"
-    async with http_client_with_tls(timeout=None) as session:
-        resp = await session.post(
-            completion_url, data=completion_body.encode("ascii"), skip_auto_headers=["content-type"]
-        )
+    session = shared_http_session()
+    async with session.post(
+        completion_url, data=completion_body.encode("ascii"), skip_auto_headers=["content-type"]
+    ) as resp:
         if resp.status != 200:
             try:
                 msg = await resp.text()
@@ -213,6 +283,84 @@ async def perform_multipart_upload(
                 )
 
 
+@dataclasses.dataclass
+class _MultipartUploadState:
+    """Progress of a multipart upload, persisted so a failed upload of the same content can be resumed.
+
+    Stored as a JSON file under the cache dir, keyed by the sha256 and length of the content.
+    """
+
+    sha256_base64: str
+    content_length: int
+    blob_id: str
+    part_length: int
+    upload_urls: List[str]
+    completion_url: str
+    created_at: float
+    part_etags: Dict[int, str] = dataclasses.field(default_factory=dict)
+
+    @staticmethod
+    def _path(sha256_base64: str, content_length: int) -> str:
+        sha256_hex = base64.b64decode(sha256_base64).hex()
+        return os.path.join(config["cache_dir"], "multipart_uploads", f"{sha256_hex}-{content_length}.json")
+
+    @classmethod
+    def load(cls, sha256_base64: str, content_length: int) -> Optional["_MultipartUploadState"]:
+        path = cls._path(sha256_base64, content_length)
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            data["part_etags"] = {int(part_number): etag for part_number, etag in data["part_etags"].items()}
+            state = cls(**data)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError, KeyError) as exc:
+            logger.debug(f"Ignoring unreadable multipart upload state {path}: {exc}")
+            return None
+
+        if time.time() - state.created_at > MULTIPART_UPLOAD_STATE_TTL:
+            # The presigned upload urls have likely expired, so start over
+            state.delete()
+            return None
+        return state
+
+    def save(self):
+        path = self._path(self.sha256_base64, self.content_length)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temporary file first so a crash can't leave a partially written state file
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(dataclasses.asdict(self), f)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.debug(f"Failed to persist multipart upload state {path}: {exc}")
+
+    def delete(self):
+        try:
+            os.remove(self._path(self.sha256_base64, self.content_length))
+        except OSError:
+            pass
+
+
+async def _perform_resumable_multipart_upload(data: BinaryIO, content_length: int, state: _MultipartUploadState):
+    def on_part_uploaded(part_number: int, etag: str):
+        state.part_etags[part_number] = etag
+        state.save()
+
+    state.save()
+    await perform_multipart_upload(
+        data,
+        content_length=content_length,
+        max_part_size=state.part_length,
+        part_urls=state.upload_urls,
+        completion_url=state.completion_url,
+        uploaded_part_etags=dict(state.part_etags),
+        on_part_uploaded=on_part_uploaded,
+    )
+    state.delete()
+
+
 def get_content_length(data: BinaryIO):
     # *Remaining* length of file from current seek position
     pos = data.tell()
@@ -228,6 +376,25 @@ async def _blob_upload(upload_hashes: UploadHashes, data: Union[bytes, BinaryIO]
 
     content_length = get_content_length(data)
 
+    # Identical content that was uploaded recently can be referenced by the same blob
+    cache_key = f"{upload_hashes.sha256_hex()}-{content_length}"
+    cached_blob_id = blob_upload_cache.get(cache_key)
+    if cached_blob_id is not None:
+        logger.debug(f"Reusing recently uploaded blob {cached_blob_id.decode()}")
+        return cached_blob_id.decode()
+
+    blob_id = await _blob_upload_uncached(upload_hashes, data, content_length, stub)
+    blob_upload_cache.put(cache_key, blob_id.encode())
+    return blob_id
+
+
+async def _blob_upload_uncached(upload_hashes: UploadHashes, data: BinaryIO, content_length: int, stub) -> str:
+    state = _MultipartUploadState.load(upload_hashes.sha256_base64, content_length)
+    if state is not None:
+        logger.debug(f"Resuming upload of {state.blob_id} with {len(state.part_etags)} parts already uploaded")
+        await _perform_resumable_multipart_upload(data, content_length, state)
+        return state.blob_id
+
     req = api_pb2.BlobCreateRequest(
         content_md5=upload_hashes.md5_base64,
         content_sha256_base64=upload_hashes.sha256_base64,
@@ -238,13 +405,16 @@ async def _blob_upload(upload_hashes: UploadHashes, data: Union[bytes, BinaryIO]
     blob_id = resp.blob_id
 
     if resp.WhichOneof("upload_type_oneof") == "multipart":
-        await perform_multipart_upload(
-            data,
+        state = _MultipartUploadState(
+            sha256_base64=upload_hashes.sha256_base64,
             content_length=content_length,
-            max_part_size=resp.multipart.part_length,
-            part_urls=resp.multipart.upload_urls,
+            blob_id=blob_id,
+            part_length=resp.multipart.part_length,
+            upload_urls=list(resp.multipart.upload_urls),
             completion_url=resp.multipart.completion_url,
+            created_at=time.time(),
         )
+        await _perform_resumable_multipart_upload(data, content_length, state)
     else:
         lock = asyncio.Lock()  # not strictly necessary here
         payload = BytesIOSegmentPayload(data, lock, segment_start=0, segment_length=content_length)
@@ -262,55 +432,135 @@ async def blob_upload(payload: bytes, stub) -> str:
     if isinstance(payload, str):
         logger.warning("Blob uploading string, not bytes - auto-encoding as utf8")
         payload = payload.encode("utf8")
-    upload_hashes = get_upload_hashes(payload)
+    upload_hashes = await asyncify(get_upload_hashes)(payload)
     return await _blob_upload(upload_hashes, payload, stub)
 
 
-async def blob_upload_file(file_obj: BinaryIO, stub) -> str:
-    upload_hashes = get_upload_hashes(file_obj)
+async def blob_upload_file(file_obj: BinaryIO, stub, upload_hashes: Optional[UploadHashes] = None) -> str:
+    # Pass `upload_hashes` if they were already computed, to avoid reading the file an extra time
+    if upload_hashes is None:
+        upload_hashes = await asyncify(get_upload_hashes)(file_obj)
     return await _blob_upload(upload_hashes, file_obj, stub)
 
 
 @retry(n_attempts=5, base_delay=0.1, timeout=None)
-async def _download_from_url(download_url) -> bytes:
-    async with http_client_with_tls(timeout=None) as session:
-        async with session.get(download_url) as resp:
-            # S3 signal to slow down request rate.
-            if resp.status == 503:
-                logger.warning("Received SlowDown signal from S3, sleeping for 1 second before retrying.")
-                await asyncio.sleep(1)
-
-            if resp.status != 200:
-                text = await resp.text()
-                raise ExecutionError(f"Get from url failed with status {resp.status}: {text}")
-            return await resp.read()
-
+async def _download_range(download_url: str, start: int, end: int) -> Tuple[bytes, int]:
+    """Fetches bytes `[start, end)` of an object and returns them along with the total object size.
 
-async def blob_download(blob_id, stub) -> bytes:
+    Servers that don't support range requests respond with the full object, which is returned as-is.
+    """
+    session = shared_http_session()
+    async with session.get(download_url, headers={"Range": f"bytes={start}-{end - 1}"}) as resp:
+        # S3 signal to slow down request rate.
+        if resp.status == 503:
+            logger.warning("Received SlowDown signal from S3, sleeping for 1 second before retrying.")
+            await asyncio.sleep(1)
+
+        if resp.status == 200:
+            data = await resp.read()
+            return data, len(data)
+        elif resp.status == 416 and start == 0:
+            # Ranges are never satisfiable for empty objects
+            return b"", 0
+        elif resp.status != 206:
+            text = await resp.text()
+            raise ExecutionError(f"Get from url failed with status {resp.status}: {text}")
+
+        # Content-Range looks like "bytes 0-1023/146515"
+        total_size = int(resp.headers["Content-Range"].rsplit("/", 1)[1])
+        data = await resp.read()
+        expected_length = min(end, total_size) - start
+        if len(data) != expected_length:
+            raise ExecutionError(f"Got {len(data)} bytes for range {start}-{end - 1}, expected {expected_length}")
+        return data, total_size
+
+
+async def _download_ranged(download_url: str, part_size: int, parallelism: int) -> bytes:
+    first_part, total_size = await _download_range(download_url, 0, part_size)
+    if len(first_part) == total_size:
+        return first_part
+
+    buf = bytearray(total_size)
+    view = memoryview(buf)
+    view[: len(first_part)] = first_part
+    semaphore = asyncio.Semaphore(parallelism)
+
+    async def download_part(start: int):
+        async with semaphore:
+            data, _ = await _download_range(download_url, start, min(start + part_size, total_size))
+        view[start : start + len(data)] = data
+
+    tasks = [asyncio.create_task(download_part(start)) for start in range(len(first_part), total_size, part_size)]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+    return bytes(buf)
+
+
+async def _iter_ranged(download_url: str, part_size: int, parallelism: int) -> AsyncIterator[bytes]:
+    first_part, total_size = await _download_range(download_url, 0, part_size)
+    starts = iter(range(len(first_part), total_size, part_size))
+    pending: Deque[asyncio.Task] = collections.deque()
+
+    def schedule_parts():
+        # Keep a window of `parallelism` parts in flight, ahead of the consumer
+        while len(pending) < parallelism:
+            start = next(starts, None)
+            if start is None:
+                return
+            pending.append(
+                asyncio.create_task(_download_range(download_url, start, min(start + part_size, total_size)))
+            )
+
+    try:
+        schedule_parts()
+        if first_part:
+            yield first_part
+        while pending:
+            data, _ = await pending.popleft()
+            schedule_parts()
+            yield data
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def blob_download(
+    blob_id,
+    stub,
+    *,
+    part_size: int = BLOB_DOWNLOAD_PART_SIZE,
+    parallelism: int = BLOB_DOWNLOAD_PARALLELISM,
+) -> bytes:
     # convenience function reading all of the downloaded file into memory
+    cached_data = await asyncify(blob_download_cache.get)(blob_id)
+    if cached_data is not None:
+        return cached_data
+
     req = api_pb2.BlobGetRequest(blob_id=blob_id)
     resp = await retry_transient_errors(stub.BlobGet, req)
 
-    return await _download_from_url(resp.download_url)
+    data = await _download_ranged(resp.download_url, part_size, parallelism)
+    if len(data) <= BLOB_DOWNLOAD_CACHE_MAX_ENTRY_BYTES:
+        await asyncify(blob_download_cache.put)(blob_id, data)
+    return data
 
 
-async def blob_iter(blob_id, stub) -> AsyncIterator[bytes]:
+async def blob_iter(
+    blob_id,
+    stub,
+    *,
+    part_size: int = BLOB_DOWNLOAD_PART_SIZE,
+    parallelism: int = BLOB_DOWNLOAD_PARALLELISM,
+) -> AsyncIterator[bytes]:
+    # yields the blob in order, one part at a time, while fetching the following parts concurrently
     req = api_pb2.BlobGetRequest(blob_id=blob_id)
     resp = await retry_transient_errors(stub.BlobGet, req)
-    download_url = resp.download_url
-    async with http_client_with_tls(timeout=None) as session:
-        async with session.get(download_url) as resp:
-            # S3 signal to slow down request rate.
-            if resp.status == 503:
-                logger.warning("Received SlowDown signal from S3, sleeping for 1 second before retrying.")
-                await asyncio.sleep(1)
-
-            if resp.status != 200:
-                text = await resp.text()
-                raise ExecutionError(f"Get from url failed with status {resp.status}: {text}")
 
-            async for chunk in resp.content.iter_any():
-                yield chunk
+    async for data in _iter_ranged(resp.download_url, part_size, parallelism):
+        yield data
 
 
 @dataclasses.dataclass
@@ -319,29 +569,71 @@ class FileUploadSpec:
     mount_filename: str
 
     use_blob: bool
-    content: Optional[bytes]  # typically None if using blob, required otherwise
+    content: Optional[bytes]  # None if using blob, or if the hash came from a FileHashCache (see `load_content`)
     sha256_hex: str
     size: int
+    upload_hashes: Optional[UploadHashes] = None  # set if using blob, so the upload doesn't rehash the file
 
 
-def get_file_upload_spec(filename: str, mount_filename: str) -> FileUploadSpec:
+def get_file_upload_spec(
+    filename: str, mount_filename: str, hash_cache: Optional[FileHashCache] = None
+) -> FileUploadSpec:
     # Somewhat CPU intensive, so we run it in a thread/process
-    size = os.path.getsize(filename)
+    stat = os.stat(filename)
+    size = stat.st_size
+    cached = hash_cache.get(filename, stat) if hash_cache is not None else None
+    upload_hashes = None
     if size >= LARGE_FILE_LIMIT:
         use_blob = True
         content = None
-        with open(filename, "rb") as fp:
-            sha256_hex = get_sha256_hex(fp)
+        if cached is not None and cached.md5_base64 is not None:
+            sha256_base64 = base64.b64encode(bytes.fromhex(cached.sha256_hex)).decode("ascii")
+            upload_hashes = UploadHashes(md5_base64=cached.md5_base64, sha256_base64=sha256_base64)
+        else:
+            # Compute all hashes needed for the blob upload in a single pass over the file
+            with open(filename, "rb") as fp:
+                upload_hashes = get_upload_hashes(fp)
+            if hash_cache is not None:
+                hash_cache.put(filename, stat, upload_hashes.sha256_hex(), upload_hashes.md5_base64)
+        sha256_hex = upload_hashes.sha256_hex()
+    elif cached is not None:
+        # The content is only read if the server turns out not to have the file, see `load_content`
+        use_blob = False
+        content = None
+        sha256_hex = cached.sha256_hex
     else:
         use_blob = False
         with open(filename, "rb") as fp:
             content = fp.read()
         sha256_hex = get_sha256_hex(content)
+        if hash_cache is not None:
+            hash_cache.put(filename, stat, sha256_hex)
     return FileUploadSpec(
-        filename, mount_filename, use_blob=use_blob, content=content, sha256_hex=sha256_hex, size=size
+        filename,
+        mount_filename,
+        use_blob=use_blob,
+        content=content,
+        sha256_hex=sha256_hex,
+        size=size,
+        upload_hashes=upload_hashes,
     )
 
 
+def load_content(file_spec: FileUploadSpec) -> FileUploadSpec:
+    """Returns a spec that has the content of a small file, reading it if the spec was created from cached hashes.
+
+    If the file has changed since it was hashed, the returned spec is for the current content of the file.
+    """
+    if file_spec.use_blob or file_spec.content is not None:
+        return file_spec
+    with open(file_spec.filename, "rb") as fp:
+        content = fp.read()
+    if len(content) >= LARGE_FILE_LIMIT or get_sha256_hex(content) != file_spec.sha256_hex:
+        logger.debug(f"{file_spec.filename} changed since it was hashed")
+        return get_file_upload_spec(file_spec.filename, file_spec.mount_filename)
+    return dataclasses.replace(file_spec, content=content)
+
+
 def use_md5(url: str) -> bool:
     """This takes an upload URL in S3 and returns whether we should attach a checksum.
 
@@ -0,0 +1,130 @@
+# Copyright Modal Labs 2023
+import dataclasses
+import os
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from modal_utils.logger import logger
+
+from .config import config
+
+try:
+    import sqlite3
+except ImportError:  # Python can be built without sqlite
+    sqlite3 = None  # type: ignore
+
+# Files modified this recently aren't cached: a write within the same mtime tick
+# right after hashing would otherwise go unnoticed (the "racy git" problem)
+RACY_MTIME_INTERVAL = 2.0
+
+# Entries for files that haven't been seen for this long are removed
+ENTRY_TTL = 30 * 24 * 3600
+LAST_USED_RESOLUTION = 24 * 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS file_hashes (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    sha256_hex TEXT NOT NULL,
+    md5_base64 TEXT,
+    last_used REAL NOT NULL
+)
+"""
+
+
+@dataclasses.dataclass
+class CachedFileHashes:
+    sha256_hex: str
+    md5_base64: Optional[str]  # only stored for files that are uploaded as blobs
+
+
+class FileHashCache:
+    """Persistent cache of file hashes, stored in a SQLite database under the cache dir.
+
+    Entries are keyed on the absolute path of a file and are only valid as long as its
+    (size, mtime, inode) signature is unchanged, which avoids rehashing every file of a
+    mount on every run. Lookups and inserts can be made from multiple threads; inserts
+    are buffered in memory until `flush` is called.
+
+    Any error with the database (locked, corrupt, read-only file system...) disables the cache.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        self._db_path = db_path or os.path.join(config["cache_dir"], "file_hashes.sqlite3")
+        self._lock = threading.Lock()
+        self._conn = None
+        self._disabled = sqlite3 is None
+        self._pending: List[Tuple] = []
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self):
+        if self._conn is None and not self._disabled:
+            try:
+                os.makedirs(os.path.dirname(self._db_path), exist_ok=True)
+                self._conn = sqlite3.connect(self._db_path, timeout=5.0, check_same_thread=False)
+                self._conn.execute(_SCHEMA)
+            except (sqlite3.Error, OSError) as exc:
+                self._disable(exc)
+        return self._conn
+
+    def _disable(self, exc: Exception):
+        logger.debug(f"Disabling file hash cache {self._db_path}: {exc}")
+        self._disabled = True
+        self._conn = None
+
+    def get(self, filename: str, stat: os.stat_result) -> Optional[CachedFileHashes]:
+        path = os.path.abspath(filename)
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT size, mtime_ns, inode, sha256_hex, md5_base64, last_used FROM file_hashes WHERE path = ?",
+                    (path,),
+                ).fetchone()
+            except sqlite3.Error as exc:
+                self._disable(exc)
+                return None
+
+            if row is None or tuple(row[:3]) != (stat.st_size, stat.st_mtime_ns, stat.st_ino):
+                self.misses += 1
+                return None
+            self.hits += 1
+            now = time.time()
+            if now - row[5] > LAST_USED_RESOLUTION:
+                # Keep the entry from expiring, but don't rewrite every entry on every run
+                self._pending.append((path, *row[:5], now))
+            return CachedFileHashes(sha256_hex=row[3], md5_base64=row[4])
+
+    def put(self, filename: str, stat: os.stat_result, sha256_hex: str, md5_base64: Optional[str] = None):
+        now = time.time()
+        if now - stat.st_mtime < RACY_MTIME_INTERVAL:
+            return
+        path = os.path.abspath(filename)
+        with self._lock:
+            self._pending.append((path, stat.st_size, stat.st_mtime_ns, stat.st_ino, sha256_hex, md5_base64, now))
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, []
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                with conn:
+                    conn.executemany("INSERT OR REPLACE INTO file_hashes VALUES (?, ?, ?, ?, ?, ?, ?)", pending)
+                    conn.execute("DELETE FROM file_hashes WHERE last_used < ?", (time.time() - ENTRY_TTL,))
+            except sqlite3.Error as exc:
+                self._disable(exc)
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
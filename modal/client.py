@@ -14,7 +14,7 @@ from modal_proto import api_grpc, api_pb2
 from modal_utils import async_utils
 from modal_utils.async_utils import synchronize_apis
 from modal_utils.grpc_utils import create_channel, retry_transient_errors
-from modal_utils.http_utils import http_client_with_tls
+from modal_utils.http_utils import acquire_shared_http_session, http_client_with_tls, release_shared_http_session
 from modal_version import __version__
 
 from ._tracing import inject_tracing_context
@@ -105,6 +105,7 @@ class _Client:
             inject_tracing_context=inject_tracing_context,
         )
         self._stub = api_grpc.ModalClientStub(self._channel)  # type: ignore
+        acquire_shared_http_session()
 
     async def _close(self):
         if self._pre_stop is not None:
@@ -113,6 +114,7 @@ class _Client:
 
         if self._channel is not None:
             self._channel.close()
+            await release_shared_http_session()
 
     def set_pre_stop(self, pre_stop: Callable[[], None]):
         """mdmd:hidden"""
@@ -153,7 +155,11 @@ class _Client:
     async def __aenter__(self):
         await self._open()
         if not self.no_verify:
-            await self._verify()
+            try:
+                await self._verify()
+            except BaseException:
+                await self._close()
+                raise
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
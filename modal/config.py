@@ -59,6 +59,11 @@ Other possible configuration options are:
 * ``server_url`` (in the .toml file) / ``MODAL_SERVER_URL`` (as an env var).
   Defaults to ``https://api.modal.com``.
   Not typically meant to be used.
+* ``cache_dir`` (in the .toml file) / ``MODAL_CACHE_DIR`` (as an env var).
+  Defaults to ``~/.cache/modal``.
+  Directory where Modal keeps local state that speeds up repeated runs,
+  such as recently transferred blobs and the progress of interrupted uploads.
+  It's always safe to delete.
 
 Meta-configuration
 ------------------
@@ -148,6 +153,9 @@ _SETTINGS = {
     "tracing_enabled": _Setting(False, transform=lambda x: x not in ("", "0")),
     "profiling_enabled": _Setting(False, transform=lambda x: x not in ("", "0")),
     "heartbeat_interval": _Setting(15, float),
+    "cache_dir": _Setting(
+        os.path.expanduser(os.path.join(os.environ.get("XDG_CACHE_HOME") or "~/.cache", "modal")), os.path.expanduser
+    ),
 }
 
 
@@ -4,29 +4,49 @@ import asyncio
 import concurrent.futures
 import dataclasses
 from datetime import date
+import hashlib
+import io
 import os
+import tarfile
 import time
 import typing
 from pathlib import Path, PurePosixPath
 from typing import AsyncGenerator, Callable, Collection, List, Optional, Union, Tuple
 
 import aiostream
+from grpclib import GRPCError, Status
 
 import modal.exception
 from modal_proto import api_pb2
-from modal_utils.async_utils import synchronize_apis
+from modal_utils.async_utils import asyncify, synchronize_apis
 from modal_utils.grpc_utils import retry_transient_errors
 from modal_utils.package_utils import get_module_mount_info, module_mount_condition
 from modal_version import __version__
 
-from ._blob_utils import FileUploadSpec, blob_upload_file, get_file_upload_spec
+from ._blob_cache import mount_manifest_cache
+from ._blob_utils import (
+    LARGE_FILE_LIMIT,
+    FileUploadSpec,
+    blob_upload,
+    blob_upload_file,
+    get_file_upload_spec,
+    load_content,
+)
+from ._file_hash_cache import FileHashCache
 from ._resolver import Resolver
+from .client import _Client
 from .config import config, logger
 from .exception import InvalidError, NotFoundError, deprecation_warning
 from .object import Handle, Provider
 
 
 MOUNT_PUT_FILE_CLIENT_TIMEOUT = 10 * 60  # 10 min max for transferring files
+MOUNT_GET_MISSING_FILES_BATCH_SIZE = 1000
+MOUNT_GET_MISSING_FILES_PARALLELISM = 4
+# Missing files that are small enough to not be uploaded as blobs are packed into archives
+MOUNT_ARCHIVE_MIN_FILES = 2
+MOUNT_ARCHIVE_MAX_BYTES = 64 * 1024 * 1024
+MOUNT_ARCHIVE_COMPRESS_LEVEL = 1  # source files compress well even at the fastest level
 
 
 def client_mount_name():
@@ -244,18 +264,25 @@ class _Mount(Provider[_MountHandle]):
             all_files += list(entry.get_files_to_upload())
 
         loop = asyncio.get_event_loop()
-        with concurrent.futures.ThreadPoolExecutor() as exe:
-            futs = []
-            for local_filename, remote_filename in all_files:
-                futs.append(loop.run_in_executor(exe, get_file_upload_spec, local_filename, remote_filename))
+        hash_cache = FileHashCache()
+        try:
+            with concurrent.futures.ThreadPoolExecutor() as exe:
+                futs = []
+                for local_filename, remote_filename in all_files:
+                    futs.append(
+                        loop.run_in_executor(exe, get_file_upload_spec, local_filename, remote_filename, hash_cache)
+                    )
 
-            logger.debug(f"Computing checksums for {len(futs)} files using {exe._max_workers} workers")
-            for i, fut in enumerate(asyncio.as_completed(futs)):
-                try:
-                    yield await fut
-                except FileNotFoundError as exc:
-                    # Can happen with temporary files (e.g. emacs will write temp files and delete them quickly)
-                    logger.info(f"Ignoring file not found: {exc}")
+                logger.debug(f"Computing checksums for {len(futs)} files using {exe._max_workers} workers")
+                for i, fut in enumerate(asyncio.as_completed(futs)):
+                    try:
+                        yield await fut
+                    except FileNotFoundError as exc:
+                        # Can happen with temporary files (e.g. emacs will write temp files and delete them quickly)
+                        logger.info(f"Ignoring file not found: {exc}")
+        finally:
+            logger.debug(f"File hash cache: {hash_cache.hits} hits, {hash_cache.misses} misses")
+            await loop.run_in_executor(None, hash_cache.close)
 
     async def _load(self, resolver: Resolver, existing_object_id: str):
         # Run a threadpool to compute hash values, and use concurrent coroutines to register files.
@@ -268,61 +295,188 @@ class _Mount(Provider[_MountHandle]):
         message_label = self._description()
         status_row = resolver.add_status_row()
 
-        async def _put_file(file_spec: FileUploadSpec) -> api_pb2.MountFile:
-            nonlocal n_files, uploaded_hashes, total_bytes
+        upload_semaphore = asyncio.Semaphore(n_concurrent_uploads)
+        batch_check_supported = True
+        archive_supported = True
+
+        def _update_status():
             status_row.message(
                 f"Creating mount {message_label}: Uploaded {len(uploaded_hashes)}/{n_files} inspected files"
             )
 
+        async def _upload_file(file_spec: FileUploadSpec) -> api_pb2.MountFile:
+            nonlocal total_bytes
+            if not file_spec.use_blob and file_spec.content is None:
+                # The hash came from the local cache, so the file hasn't been read yet
+                new_spec = await asyncify(load_content)(file_spec)
+                if new_spec.sha256_hex != file_spec.sha256_hex:
+                    file_spec = new_spec
+                    if file_spec.sha256_hex in uploaded_hashes:
+                        return api_pb2.MountFile(filename=file_spec.mount_filename, sha256_hex=file_spec.sha256_hex)
+                else:
+                    file_spec = new_spec
+
             remote_filename = file_spec.mount_filename
             mount_file = api_pb2.MountFile(filename=remote_filename, sha256_hex=file_spec.sha256_hex)
-
-            if file_spec.sha256_hex in uploaded_hashes:
-                return mount_file
-
-            request = api_pb2.MountPutFileRequest(sha256_hex=file_spec.sha256_hex)
-            response = await retry_transient_errors(resolver.client.stub.MountPutFile, request, base_delay=1)
-
-            n_files += 1
-            if response.exists:
-                return mount_file
-
             uploaded_hashes.add(file_spec.sha256_hex)
             total_bytes += file_spec.size
+            _update_status()
 
             if file_spec.use_blob:
                 logger.debug(f"Creating blob file for {file_spec.filename} ({file_spec.size} bytes)")
                 with open(file_spec.filename, "rb") as fp:
-                    blob_id = await blob_upload_file(fp, resolver.client.stub)
+                    blob_id = await blob_upload_file(fp, resolver.client.stub, file_spec.upload_hashes)
                 logger.debug(f"Uploading blob file {file_spec.filename} as {remote_filename}")
-                request2 = api_pb2.MountPutFileRequest(data_blob_id=blob_id, sha256_hex=file_spec.sha256_hex)
+                request = api_pb2.MountPutFileRequest(data_blob_id=blob_id, sha256_hex=file_spec.sha256_hex)
             else:
                 logger.debug(f"Uploading file {file_spec.filename} to {remote_filename} ({file_spec.size} bytes)")
-                request2 = api_pb2.MountPutFileRequest(data=file_spec.content, sha256_hex=file_spec.sha256_hex)
+                request = api_pb2.MountPutFileRequest(data=file_spec.content, sha256_hex=file_spec.sha256_hex)
 
             start_time = time.monotonic()
             while time.monotonic() - start_time < MOUNT_PUT_FILE_CLIENT_TIMEOUT:
-                response = await retry_transient_errors(resolver.client.stub.MountPutFile, request2, base_delay=1)
+                response = await retry_transient_errors(resolver.client.stub.MountPutFile, request, base_delay=1)
                 if response.exists:
                     return mount_file
 
             raise modal.exception.TimeoutError(f"Mounting of {file_spec.filename} timed out")
 
+        async def _put_file(file_spec: FileUploadSpec) -> api_pb2.MountFile:
+            # Fallback for servers without MountGetMissingFiles: check each file for existence separately
+            mount_file = api_pb2.MountFile(filename=file_spec.mount_filename, sha256_hex=file_spec.sha256_hex)
+            if file_spec.sha256_hex in uploaded_hashes:
+                return mount_file
+
+            async with upload_semaphore:
+                request = api_pb2.MountPutFileRequest(sha256_hex=file_spec.sha256_hex)
+                response = await retry_transient_errors(resolver.client.stub.MountPutFile, request, base_delay=1)
+                if response.exists or file_spec.sha256_hex in uploaded_hashes:
+                    return mount_file
+                return await _upload_file(file_spec)
+
+        async def _upload_missing_file(file_spec: FileUploadSpec) -> api_pb2.MountFile:
+            async with upload_semaphore:
+                return await _upload_file(file_spec)
+
+        async def _put_archive(file_specs: List[FileUploadSpec]) -> Optional[List[api_pb2.MountFile]]:
+            # Returns None if the server doesn't support archives
+            nonlocal archive_supported, total_bytes
+            async with upload_semaphore:
+                if not archive_supported:
+                    return None
+                archive, file_specs = await asyncify(_make_archive)(file_specs)
+                logger.debug(f"Uploading {len(file_specs)} files as a {len(archive)} byte archive")
+                if len(archive) > LARGE_FILE_LIMIT:
+                    blob_id = await blob_upload(archive, resolver.client.stub)
+                    request = api_pb2.MountPutArchiveRequest(data_blob_id=blob_id)
+                else:
+                    request = api_pb2.MountPutArchiveRequest(data=archive)
+                try:
+                    await retry_transient_errors(resolver.client.stub.MountPutArchive, request, base_delay=1)
+                except GRPCError as exc:
+                    if exc.status != Status.UNIMPLEMENTED:
+                        raise
+                    logger.debug("Server doesn't support mount archives, uploading files one by one")
+                    archive_supported = False
+                    return None
+
+            for file_spec in file_specs:
+                if file_spec.sha256_hex not in uploaded_hashes:
+                    uploaded_hashes.add(file_spec.sha256_hex)
+                    total_bytes += file_spec.size
+            _update_status()
+            return [
+                api_pb2.MountFile(filename=file_spec.mount_filename, sha256_hex=file_spec.sha256_hex)
+                for file_spec in file_specs
+            ]
+
+        async def _put_files(file_specs: List[FileUploadSpec]) -> List[api_pb2.MountFile]:
+            nonlocal n_files, batch_check_supported
+            n_files += len(file_specs)
+            _update_status()
+
+            if batch_check_supported:
+                sha256_hexes = list({file_spec.sha256_hex for file_spec in file_specs} - uploaded_hashes)
+                request = api_pb2.MountGetMissingFilesRequest(sha256_hexes=sha256_hexes)
+                try:
+                    response = await retry_transient_errors(
+                        resolver.client.stub.MountGetMissingFiles, request, base_delay=1
+                    )
+                except GRPCError as exc:
+                    if exc.status != Status.UNIMPLEMENTED:
+                        raise
+                    logger.debug("Server doesn't support batched existence checks, checking mount files one by one")
+                    batch_check_supported = False
+
+            if not batch_check_supported:
+                return await asyncio.gather(*(_put_file(file_spec) for file_spec in file_specs))
+
+            missing = set(response.missing_sha256_hexes) - uploaded_hashes
+            mount_files: List[Optional[api_pb2.MountFile]] = [None] * len(file_specs)
+            upload_indices: List[int] = []
+            for i, file_spec in enumerate(file_specs):
+                if file_spec.sha256_hex in missing:
+                    missing.remove(file_spec.sha256_hex)  # identical files are only uploaded once
+                    upload_indices.append(i)
+                else:
+                    mount_files[i] = api_pb2.MountFile(
+                        filename=file_spec.mount_filename, sha256_hex=file_spec.sha256_hex
+                    )
+
+            # Pack small files into archives, so they don't take one round trip each
+            small_indices = [i for i in upload_indices if not file_specs[i].use_blob]
+            if archive_supported and len(small_indices) >= MOUNT_ARCHIVE_MIN_FILES:
+                archives = _split_archive_indices(file_specs, small_indices)
+                results = await asyncio.gather(
+                    *(_put_archive([file_specs[i] for i in indices]) for indices in archives)
+                )
+                for indices, archive_mount_files in zip(archives, results):
+                    if archive_mount_files is not None:
+                        for i, mount_file in zip(indices, archive_mount_files):
+                            mount_files[i] = mount_file
+                upload_indices = [i for i in upload_indices if mount_files[i] is None]
+
+            uploads = [_upload_missing_file(file_specs[i]) for i in upload_indices]
+            for i, mount_file in zip(upload_indices, await asyncio.gather(*uploads)):
+                mount_files[i] = mount_file
+            return typing.cast(List[api_pb2.MountFile], mount_files)
+
         logger.debug(f"Uploading mount using {n_concurrent_uploads} uploads")
 
         # Create async generator
         files_stream = aiostream.stream.iterate(self._get_files())
 
-        # Upload files
-        uploads_stream = aiostream.stream.map(files_stream, _put_file, task_limit=n_concurrent_uploads)
-        files: List[api_pb2.MountFile] = await aiostream.stream.list(uploads_stream)
+        # Check for existing files in batches, and upload the missing ones
+        batches_stream = aiostream.stream.chunks(files_stream, MOUNT_GET_MISSING_FILES_BATCH_SIZE)
+        uploads_stream = aiostream.stream.map(
+            batches_stream, _put_files, task_limit=MOUNT_GET_MISSING_FILES_PARALLELISM
+        )
+        files: List[api_pb2.MountFile] = [
+            mount_file for batch in await aiostream.stream.list(uploads_stream) for mount_file in batch
+        ]
         if not files:
             logger.warning(f"Mount of '{message_label}' is empty.")
 
+        # Reuse the mount from a previous run if the contents are unchanged
+        manifest_sha256_hex = get_manifest_sha256_hex(files)
+        cache_key = _get_manifest_cache_key(resolver.client, manifest_sha256_hex)
+        cached_mount_id = mount_manifest_cache.get(cache_key)
+        mount_id = cached_mount_id.decode() if cached_mount_id is not None else None
+        if mount_id and (not existing_object_id or existing_object_id == mount_id):
+            if await _reuse_mount(resolver, mount_id, manifest_sha256_hex):
+                status_row.finish(f"Created mount {message_label}")
+                logger.debug(f"Reused mount {mount_id} with {len(files)} files in {time.time() - t0}s")
+                return _MountHandle._from_id(mount_id, resolver.client, None)
+
         # Build mounts
         status_row.message(f"Creating mount {message_label}: Building mount")
-        req = api_pb2.MountBuildRequest(app_id=resolver.app_id, existing_mount_id=existing_object_id, files=files)
+        req = api_pb2.MountBuildRequest(
+            app_id=resolver.app_id,
+            existing_mount_id=existing_object_id,
+            files=files,
+            manifest_sha256_hex=manifest_sha256_hex,
+        )
         resp = await retry_transient_errors(resolver.client.stub.MountBuild, req, base_delay=1)
+        mount_manifest_cache.put(cache_key, resp.mount_id.encode())
         status_row.finish(f"Created mount {message_label}")
 
         logger.debug(f"Uploaded {len(uploaded_hashes)}/{n_files} files and {total_bytes} bytes in {time.time() - t0}s")
@@ -332,6 +486,67 @@ class _Mount(Provider[_MountHandle]):
 Mount, AioMount = synchronize_apis(_Mount)
 
 
+def _split_archive_indices(file_specs: List[FileUploadSpec], indices: List[int]) -> List[List[int]]:
+    archives: List[List[int]] = [[]]
+    archive_size = 0
+    for i in indices:
+        if archives[-1] and archive_size + file_specs[i].size > MOUNT_ARCHIVE_MAX_BYTES:
+            archives.append([])
+            archive_size = 0
+        archives[-1].append(i)
+        archive_size += file_specs[i].size
+    return archives
+
+
+def _make_archive(file_specs: List[FileUploadSpec]) -> Tuple[bytes, List[FileUploadSpec]]:
+    """Packs small files into a gzipped tar archive with members named by their sha256_hex.
+
+    Returns the archive along with the specs of the files in it, which are reloaded if their
+    hash came from the local cache and turned out to be stale.
+    """
+    file_specs = [load_content(file_spec) if file_spec.content is None else file_spec for file_spec in file_specs]
+    buf = io.BytesIO()
+    added = set()
+    with tarfile.open(fileobj=buf, mode="w:gz", compresslevel=MOUNT_ARCHIVE_COMPRESS_LEVEL) as tar:
+        for file_spec in file_specs:
+            if file_spec.sha256_hex in added:
+                continue
+            added.add(file_spec.sha256_hex)
+            info = tarfile.TarInfo(file_spec.sha256_hex)
+            info.size = len(file_spec.content)
+            tar.addfile(info, io.BytesIO(file_spec.content))
+    return buf.getvalue(), file_specs
+
+
+def get_manifest_sha256_hex(files: Collection[api_pb2.MountFile]) -> str:
+    """Digest of the contents of a mount, independent of the order its files were found in."""
+    h = hashlib.sha256()
+    for filename, sha256_hex in sorted((file.filename, file.sha256_hex) for file in files):
+        h.update(f"{filename}\0{sha256_hex}\n".encode())
+    return h.hexdigest()
+
+
+def _get_manifest_cache_key(client: _Client, manifest_sha256_hex: str) -> str:
+    # Mount ids are only valid on the server and workspace they were created in
+    token_id = client.credentials[0] if client.credentials else ""
+    return hashlib.sha256(f"{client.server_url}\0{token_id}\0{manifest_sha256_hex}".encode()).hexdigest()
+
+
+async def _reuse_mount(resolver: Resolver, mount_id: str, manifest_sha256_hex: str) -> bool:
+    request = api_pb2.MountReuseRequest(
+        app_id=resolver.app_id, mount_id=mount_id, manifest_sha256_hex=manifest_sha256_hex
+    )
+    try:
+        response = await retry_transient_errors(resolver.client.stub.MountReuse, request, base_delay=1)
+    except GRPCError as exc:
+        if exc.status != Status.UNIMPLEMENTED:
+            raise
+        return False
+    if not response.reused:
+        logger.debug(f"Mount {mount_id} can't be reused, building a new one")
+    return response.reused
+
+
 def _create_client_mount():
     # TODO(erikbern): make this a static method on the Mount class
     import modal
@@ -4,9 +4,9 @@ from pathlib import Path, PurePosixPath
 from typing import AsyncIterator, BinaryIO, List, Optional, Union
 
 from modal_proto import api_pb2
-from modal_utils.async_utils import synchronize_apis, ConcurrencyPool
+from modal_utils.async_utils import asyncify, synchronize_apis, ConcurrencyPool
 from modal_utils.grpc_utils import retry_transient_errors, unary_stream
-from modal_utils.hash_utils import get_sha256_hex
+from modal_utils.hash_utils import get_upload_hashes
 
 from ._blob_utils import LARGE_FILE_LIMIT, blob_iter, blob_upload_file
 from ._resolver import Resolver
@@ -40,14 +40,18 @@ class _SharedVolumeHandle(Handle, type_prefix="sv"):
         If remote_path ends with `/` it's assumed to be a directory and the
         file will be uploaded with its current name to that directory.
         """
-        sha_hash = get_sha256_hex(fp)
         fp.seek(0, os.SEEK_END)
         data_size = fp.tell()
         fp.seek(0)
         if data_size > LARGE_FILE_LIMIT:
-            blob_id = await blob_upload_file(fp, self._client.stub)
+            # Hash once for both the blob upload and the volume entry
+            upload_hashes = await asyncify(get_upload_hashes)(fp)
+            blob_id = await blob_upload_file(fp, self._client.stub, upload_hashes)
             req = api_pb2.SharedVolumePutFileRequest(
-                shared_volume_id=self._object_id, path=remote_path, data_blob_id=blob_id, sha256_hex=sha_hash
+                shared_volume_id=self._object_id,
+                path=remote_path,
+                data_blob_id=blob_id,
+                sha256_hex=upload_hashes.sha256_hex(),
             )
         else:
             data = fp.read()
@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: modal_proto/api.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x15modal_proto/api.proto\x12\x0cmodal.client\x1a\x1bgoogle/protobuf/empty.proto\",\n\x1a\x41ppClientDisconnectRequest\x12\x0e\n\x06\x61pp_id\x18\x01 \x01(\t\"`\n\x10\x41ppCreateRequest\x12\x11\n\tclient_id\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x0e\n\x06\x64\x65tach\x18\x03 \x01(\x08\x12\x14\n\x0cinitializing\x18\x04 \x01(\x08\"9\n\x11\x41ppCreateResponse\x12\x0e\n\x06\x61pp_id\x18\x01 \x01(\t\x12\x14\n\x0c\x61pp_logs_url\x18\x02 \x01(\t\" \n\x0e\x41ppStopRequest\x12\x0e\n\x06\x61pp_id\x18\x01 \x01(\t\"}\n\x10\x41ppDeployRequest\x12\x0e\n\x06\x61pp_id\x18\x01 \x01(\t\x12\x34\n\tnamespace\x18\x02 \x01(\x0e\x32!.modal.client.DeploymentNamespace\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x15\n\robject_entity\x18\x04 \x01(\t\" \n\x11\x41ppDeployResponse\x12\x0b\n\x03url\x18\x01 \x01(\t\"z\n\x1d\x41ppGetByDeploymentNameRequest\x12\x34\n\tnamespace\x18\x01 \x01(\x0e\x32!.modal.client.DeploymentNamespace\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x15\n\tclient_id\x18\x03 \x01(\tB\x02\x18\x01\"K\n\x1e\x41ppGetByDeploymentNameResponse\x12\x0e\n\x06\x61pp_id\x18\x01 \x01(\t\x12\x19\n\x11last_log_entry_id\x18\x02 \x01(\t\"\x83\x01\n\x11\x41ppGetLogsRequest\x12\x0e\n\x06\x61pp_id\x18\x01 \x01(\t\x12\x0f\n\x07timeout\x18\x02 \x01(\x02\x12\x15\n\rlast_entry_id\x18\x04 \x01(\t\x12\x13\n\x0b\x66unction_id\x18\x05 \x01(\t\x12\x10\n\x08input_id\x18\x06 \x01(\t\x12\x0f\n\x07task_id\x18\x07 \x01(\t\"&\n\x14\x41ppGetObjectsRequest\x12\x0e\n\x06\x61pp_id\x18\x01 \x01(\t\"o\n\x11\x41ppGetObjectsItem\x12\x0b\n\x03tag\x18\x01 \x01(\t\x12\x11\n\tobject_id\x18\x02 \x01(\t\x12*\n\x08\x66unction\x18\x03 \x01(\x0b\x32\x16.modal.client.FunctionH\x00\x42\x0e\n\x0cobject_oneof\"\xc5\x01\n\x15\x41ppGetObjectsResponse\x12J\n\nobject_ids\x18\x01 \x03(\x0b\x32\x32.modal.client.AppGetObjectsResponse.ObjectIdsEntryB\x02\x18\x01\x12.\n\x05items\x18\x02 \x03(\x0b\x32\x1f.modal.client.AppGetObjectsItem\x1a\x30\n\x0eObjectIdsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xbc\x01\n\x08\x41ppStats\x12\x0e\n\x06\x61pp_id\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12%\n\x05state\x18\x04 \x01(\x0e\x32\x16.modal.client.AppState\x12\x12\n\ncreated_at\x18\x05 \x01(\x01\x12\x12\n\nstopped_at\x18\x06 \x01(\x01\x12\x17\n\x0fn_running_tasks\x18\x08 \x01(\x05\x12\x15\n\robject_entity\x18\t \x01(\t\x12\x0c\n\x04name\x18\n \x01(\t\"7\n\x0f\x41ppListResponse\x12$\n\x04\x61pps\x18\x01 \x03(\x0b\x32\x16.modal.client.AppStats\"\x9e\x01\n\x16\x41ppLookupObjectRequest\x12\x34\n\tnamespace\x18\x02 \x01(\x0e\x32!.modal.client.DeploymentNamespace\x12\x10\n\x08\x61pp_name\x18\x03 \x01(\t\x12\x12\n\nobject_tag\x18\x04 \x01(\t\x12\x11\n\tobject_id\x18\x05 \x01(\t\x12\x15\n\robject_entity\x18\x06 \x01(\t\"\x7f\n\x17\x41ppLookupObjectResponse\x12\x11\n\tobject_id\x18\x01 \x01(\t\x12\x15\n\rerror_message\x18\x02 \x01(\t\x12*\n\x08\x66unction\x18\x03 \x01(\x0b\x32\x16.modal.client.FunctionH\x00\x42\x0e\n\x0cobject_oneof\"\x95\x02\n\x14\x41ppSetObjectsRequest\x12\x0e\n\x06\x61pp_id\x18\x01 \x01(\t\x12T\n\x12indexed_object_ids\x18\x02 \x03(\x0b\x32\x38.modal.client.AppSetObjectsRequest.IndexedObjectIdsEntry\x12\x11\n\tclient_id\x18\x03 \x01(\t\x12\x1c\n\x14unindexed_object_ids\x18\x04 \x03(\t\x12-\n\rnew_app_state\x18\x05 \x01(\x0e\x32\x16.modal.client.AppState\x1a\x37\n\x15IndexedObjectIdsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"%\n\x13\x41ppHeartbeatRequest\x12\x0e\n\x06\x61pp_id\x18\x01 \x01(\t\"[\n\x13ImageRegistryConfig\x12\x31\n\rregistry_type\x18\x01 \x01(\x0e\x32\x1a.modal.client.RegistryType\x12\x11\n\tsecret_id\x18\x02 \x01(\t\"1\n\tBaseImage\x12\x10\n\x08image_id\x18\x01 \x01(\t\x12\x12\n\ndocker_tag\x18\x02 \x01(\t\"_\n\x11\x42lobCreateRequest\x12\x13\n\x0b\x63ontent_md5\x18\x01 \x01(\t\x12\x1d\n\x15\x63ontent_sha256_base64\x18\x02 \x01(\t\x12\x16\n\x0e\x63ontent_length\x18\x03 \x01(\x03\"S\n\x0fMultiPartUpload\x12\x13\n\x0bpart_length\x18\x01 \x01(\x03\x12\x13\n\x0bupload_urls\x18\x02 \x03(\t\x12\x16\n\x0e\x63ompletion_url\x18\x03 \x01(\t\"\x84\x01\n\x12\x42lobCreateResponse\x12\x0f\n\x07\x62lob_id\x18\x02 \x01(\t\x12\x14\n\nupload_url\x18\x01 \x01(\tH\x00\x12\x32\n\tmultipart\x18\x03 \x01(\x0b\x32\x1d.modal.client.MultiPartUploadH\x00\x42\x13\n\x11upload_type_oneof\"!\n\x0e\x42lobGetRequest\x12\x0f\n\x07\x62lob_id\x18\x01 \x01(\t\"\'\n\x0f\x42lobGetResponse\x12\x14\n\x0c\x64ownload_url\x18\x01 \x01(\t\"U\n\x13\x43lientCreateRequest\x12-\n\x0b\x63lient_type\x18\x01 \x01(\x0e\x32\x18.modal.client.ClientType\x12\x0f\n\x07version\x18\x02 \x01(\t\"U\n\x14\x43lientCreateResponse\x12\x11\n\tclient_id\x18\x01 \x01(\t\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x1b\n\x13\x64\x65precation_warning\x18\x03 \x01(\t\"&\n\x13\x43lientHelloResponse\x12\x0f\n\x07warning\x18\x01 \x01(\t\"g\n\x16\x43lientHeartbeatRequest\x12\x11\n\tclient_id\x18\x01 \x01(\t\x12\x18\n\x10\x63urrent_input_id\x18\x03 \x01(\t\x12 \n\x18\x63urrent_input_started_at\x18\x04 \x01(\x01\"\xab\x02\n\x12\x43ontainerArguments\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12\x13\n\x0b\x66unction_id\x18\x02 \x01(\t\x12\x0e\n\x06\x61pp_id\x18\x04 \x01(\t\x12,\n\x0c\x66unction_def\x18\x07 \x01(\x0b\x32\x16.modal.client.Function\x12+\n\nproxy_info\x18\x08 \x01(\x0b\x32\x17.modal.client.ProxyInfo\x12M\n\x0ftracing_context\x18\t \x03(\x0b\x32\x34.modal.client.ContainerArguments.TracingContextEntry\x1a\x35\n\x13TracingContextEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"W\n\x19\x43ontainerHeartbeatRequest\x12\x18\n\x10\x63urrent_input_id\x18\x01 \x01(\t\x12 \n\x18\x63urrent_input_started_at\x18\x02 \x01(\x01\"3\n\x13\x44ictContainsRequest\x12\x0f\n\x07\x64ict_id\x18\x01 \x01(\t\x12\x0b\n\x03key\x18\x02 \x01(\x0c\"%\n\x14\x44ictContainsResponse\x12\r\n\x05\x66ound\x18\x01 \x01(\x08\"d\n\x11\x44ictCreateRequest\x12%\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32\x17.modal.client.DictEntry\x12\x0e\n\x06\x61pp_id\x18\x02 \x01(\t\x12\x18\n\x10\x65xisting_dict_id\x18\x03 \x01(\t\"%\n\x12\x44ictCreateResponse\x12\x0f\n\x07\x64ict_id\x18\x01 \x01(\t\"\'\n\tDictEntry\x12\x0b\n\x03key\x18\x01 \x01(\x0c\x12\r\n\x05value\x18\x02 \x01(\x0c\".\n\x0e\x44ictGetRequest\x12\x0f\n\x07\x64ict_id\x18\x01 \x01(\t\x12\x0b\n\x03key\x18\x02 \x01(\x0c\">\n\x0f\x44ictGetResponse\x12\r\n\x05\x66ound\x18\x01 \x01(\x08\x12\x12\n\x05value\x18\x02 \x01(\x0cH\x00\x88\x01\x01\x42\x08\n\x06_value\"!\n\x0e\x44ictLenRequest\x12\x0f\n\x07\x64ict_id\x18\x01 \x01(\t\"\x1e\n\x0f\x44ictLenResponse\x12\x0b\n\x03len\x18\x01 \x01(\x05\".\n\x0e\x44ictPopRequest\x12\x0f\n\x07\x64ict_id\x18\x01 \x01(\t\x12\x0b\n\x03key\x18\x02 \x01(\x0c\">\n\x0f\x44ictPopResponse\x12\r\n\x05\x66ound\x18\x01 \x01(\x08\x12\x12\n\x05value\x18\x02 \x01(\x0cH\x00\x88\x01\x01\x42\x08\n\x06_value\"N\n\x11\x44ictUpdateRequest\x12\x0f\n\x07\x64ict_id\x18\x01 \x01(\t\x12(\n\x07updates\x18\x02 \x03(\x0b\x32\x17.modal.client.DictEntry\"\x14\n\x12\x44ictUpdateResponse\"\x85\x01\n\x07PTYInfo\x12\x0f\n\x07\x65nabled\x18\x01 \x01(\x08\x12\x12\n\nwinsz_rows\x18\x02 \x01(\r\x12\x12\n\nwinsz_cols\x18\x03 \x01(\r\x12\x10\n\x08\x65nv_term\x18\x04 \x01(\t\x12\x15\n\renv_colorterm\x18\x05 \x01(\t\x12\x18\n\x10\x65nv_term_program\x18\x06 \x01(\t\"\xbc\x08\n\x08\x46unction\x12\x13\n\x0bmodule_name\x18\x01 \x01(\t\x12\x15\n\rfunction_name\x18\x02 \x01(\t\x12\x11\n\tmount_ids\x18\x03 \x03(\t\x12\x10\n\x08image_id\x18\x04 \x01(\t\x12\x1b\n\x13\x66unction_serialized\x18\x06 \x01(\x0c\x12>\n\x0f\x64\x65\x66inition_type\x18\x07 \x01(\x0e\x32%.modal.client.Function.DefinitionType\x12:\n\rfunction_type\x18\x08 \x01(\x0e\x32#.modal.client.Function.FunctionType\x12*\n\tresources\x18\t \x01(\x0b\x32\x17.modal.client.Resources\x12\x12\n\nsecret_ids\x18\n \x03(\t\x12+\n\nrate_limit\x18\x0b \x01(\x0b\x32\x17.modal.client.RateLimit\x12\x33\n\x0ewebhook_config\x18\x0f \x01(\x0b\x32\x1b.modal.client.WebhookConfig\x12=\n\x14shared_volume_mounts\x18\x10 \x03(\x0b\x32\x1f.modal.client.SharedVolumeMount\x12\x15\n\x08proxy_id\x18\x11 \x01(\tH\x00\x88\x01\x01\x12\x37\n\x0cretry_policy\x18\x12 \x01(\x0b\x32!.modal.client.FunctionRetryPolicy\x12\x19\n\x11\x63oncurrency_limit\x18\x13 \x01(\r\x12\x11\n\tkeep_warm\x18\x14 \x01(\x08\x12\x14\n\x0ctimeout_secs\x18\x15 \x01(\r\x12\'\n\x08pty_info\x18\x16 \x01(\x0b\x32\x15.modal.client.PTYInfo\x12\x18\n\x10\x63lass_serialized\x18\x17 \x01(\x0c\x12\x1e\n\x16task_idle_timeout_secs\x18\x19 \x01(\r\x12\x33\n\x0e\x63loud_provider\x18\x1a \x01(\x0e\x32\x1b.modal.client.CloudProvider\x12\x16\n\x0ewarm_pool_size\x18\x1b \x01(\r\x12\x0f\n\x07web_url\x18\x1c \x01(\t\x12.\n\x0cweb_url_info\x18\x1d \x01(\x0b\x32\x18.modal.client.WebUrlInfo\"k\n\x0e\x44\x65\x66initionType\x12\x1f\n\x1b\x44\x45\x46INITION_TYPE_UNSPECIFIED\x10\x00\x12\x1e\n\x1a\x44\x45\x46INITION_TYPE_SERIALIZED\x10\x01\x12\x18\n\x14\x44\x45\x46INITION_TYPE_FILE\x10\x02\"f\n\x0c\x46unctionType\x12\x1d\n\x19\x46UNCTION_TYPE_UNSPECIFIED\x10\x00\x12\x1b\n\x17\x46UNCTION_TYPE_GENERATOR\x10\x01\x12\x1a\n\x16\x46UNCTION_TYPE_FUNCTION\x10\x02\x42\x0b\n\t_proxy_id\"\x99\x01\n\x15\x46unctionCreateRequest\x12(\n\x08\x66unction\x18\x01 \x01(\x0b\x32\x16.modal.client.Function\x12\x0e\n\x06\x61pp_id\x18\x02 \x01(\t\x12(\n\x08schedule\x18\x06 \x01(\x0b\x32\x16.modal.client.Schedule\x12\x1c\n\x14\x65xisting_function_id\x18\x07 \x01(\t\"\x98\x01\n\x16\x46unctionCreateResponse\x12\x13\n\x0b\x66unction_id\x18\x01 \x01(\t\x12\x0f\n\x07web_url\x18\x02 \x01(\t\x12.\n\x0cweb_url_info\x18\x03 \x01(\x0b\x32\x18.modal.client.WebUrlInfo\x12(\n\x08\x66unction\x18\x04 \x01(\x0b\x32\x16.modal.client.Function\"p\n\x15\x46unctionGetInputsItem\x12\x10\n\x08input_id\x18\x01 \x01(\t\x12*\n\x05input\x18\x02 \x01(\x0b\x32\x1b.modal.client.FunctionInput\x12\x13\n\x0bkill_switch\x18\x03 \x01(\x08J\x04\x08\x04\x10\x05\"^\n\x18\x46unctionGetInputsRequest\x12\x13\n\x0b\x66unction_id\x18\x01 \x01(\t\x12\x12\n\nmax_values\x18\x03 \x01(\x05\x12\x19\n\x11\x61verage_call_time\x18\x05 \x01(\x02\"s\n\x19\x46unctionGetInputsResponse\x12\x33\n\x06inputs\x18\x03 \x03(\x0b\x32#.modal.client.FunctionGetInputsItem\x12!\n\x19rate_limit_sleep_duration\x18\x04 \x01(\x02\"w\n\x16\x46unctionGetOutputsItem\x12+\n\x06result\x18\x01 \x01(\x0b\x32\x1b.modal.client.GenericResult\x12\x0b\n\x03idx\x18\x02 \x01(\x05\x12\x10\n\x08input_id\x18\x03 \x01(\t\x12\x11\n\tgen_index\x18\x04 \x01(\x05\"\x8b\x01\n\x19\x46unctionGetOutputsRequest\x12\x18\n\x10\x66unction_call_id\x18\x01 \x01(\t\x12\x12\n\nmax_values\x18\x02 \x01(\x05\x12\x0f\n\x07timeout\x18\x03 \x01(\x02\x12\x15\n\rlast_entry_id\x18\x06 \x01(\t\x12\x18\n\x10\x63lear_on_success\x18\x07 \x01(\x08\"x\n\x1a\x46unctionGetOutputsResponse\x12\x0c\n\x04idxs\x18\x03 \x03(\x05\x12\x35\n\x07outputs\x18\x04 \x03(\x0b\x32$.modal.client.FunctionGetOutputsItem\x12\x15\n\rlast_entry_id\x18\x05 \x01(\t\"3\n\x1c\x46unctionGetSerializedRequest\x12\x13\n\x0b\x66unction_id\x18\x01 \x01(\t\"V\n\x1d\x46unctionGetSerializedResponse\x12\x1b\n\x13\x66unction_serialized\x18\x01 \x01(\x0c\x12\x18\n\x10\x63lass_serialized\x18\x02 \x01(\x0c\"Z\n\rFunctionInput\x12\x0e\n\x04\x61rgs\x18\x01 \x01(\x0cH\x00\x12\x16\n\x0c\x61rgs_blob_id\x18\x07 \x01(\tH\x00\x12\x13\n\x0b\x66inal_input\x18\t \x01(\x08\x42\x0c\n\nargs_oneof\"B\n\x12\x46unctionMapRequest\x12\x13\n\x0b\x66unction_id\x18\x01 \x01(\t\x12\x17\n\x0fparent_input_id\x18\x02 \x01(\t\"/\n\x13\x46unctionMapResponse\x12\x18\n\x10\x66unction_call_id\x18\x01 \x01(\t\"P\n\x15\x46unctionPutInputsItem\x12\x0b\n\x03idx\x18\x01 \x01(\x05\x12*\n\x05input\x18\x02 \x01(\x0b\x32\x1b.modal.client.FunctionInput\"~\n\x18\x46unctionPutInputsRequest\x12\x13\n\x0b\x66unction_id\x18\x01 \x01(\t\x12\x18\n\x10\x66unction_call_id\x18\x03 \x01(\t\x12\x33\n\x06inputs\x18\x04 \x03(\x0b\x32#.modal.client.FunctionPutInputsItem\">\n\x1d\x46unctionPutInputsResponseItem\x12\x0b\n\x03idx\x18\x01 \x01(\x05\x12\x10\n\x08input_id\x18\x02 \x01(\t\"X\n\x19\x46unctionPutInputsResponse\x12;\n\x06inputs\x18\x01 \x03(\x0b\x32+.modal.client.FunctionPutInputsResponseItem\"\x9f\x01\n\x16\x46unctionPutOutputsItem\x12\x10\n\x08input_id\x18\x01 \x01(\t\x12+\n\x06result\x18\x02 \x01(\x0b\x32\x1b.modal.client.GenericResult\x12\x18\n\x10input_started_at\x18\x03 \x01(\x01\x12\x19\n\x11output_created_at\x18\x04 \x01(\x01\x12\x11\n\tgen_index\x18\x06 \x01(\x05\"R\n\x19\x46unctionPutOutputsRequest\x12\x35\n\x07outputs\x18\x04 \x03(\x0b\x32$.modal.client.FunctionPutOutputsItem\"s\n\x13\x46unctionRetryPolicy\x12\x1b\n\x13\x62\x61\x63koff_coefficient\x18\x01 \x01(\x02\x12\x18\n\x10initial_delay_ms\x18\x02 \x01(\r\x12\x14\n\x0cmax_delay_ms\x18\x03 \x01(\r\x12\x0f\n\x07retries\x18\x12 \x01(\r\"7\n\x1b\x46unctionGetCallGraphRequest\x12\x18\n\x10\x66unction_call_id\x18\x02 \x01(\t\"\x8c\x01\n\x12InputCallGraphInfo\x12\x10\n\x08input_id\x18\x01 \x01(\t\x12\x39\n\x06status\x18\x02 \x01(\x0e\x32).modal.client.GenericResult.GenericStatus\x12\x18\n\x10\x66unction_call_id\x18\x03 \x01(\t\x12\x0f\n\x07task_id\x18\x04 \x01(\t\"z\n\x19\x46unctionCallCallGraphInfo\x12\x18\n\x10\x66unction_call_id\x18\x01 \x01(\t\x12\x17\n\x0fparent_input_id\x18\x02 \x01(\t\x12\x15\n\rfunction_name\x18\x03 \x01(\t\x12\x13\n\x0bmodule_name\x18\x04 \x01(\t\"\x91\x01\n\x1c\x46unctionGetCallGraphResponse\x12\x30\n\x06inputs\x18\x01 \x03(\x0b\x32 .modal.client.InputCallGraphInfo\x12?\n\x0e\x66unction_calls\x18\x02 \x03(\x0b\x32\'.modal.client.FunctionCallCallGraphInfo\"5\n\x19\x46unctionCallCancelRequest\x12\x18\n\x10\x66unction_call_id\x18\x01 \x01(\t\"5\n\x1e\x46unctionGetCurrentStatsRequest\x12\x13\n\x0b\x66unction_id\x18\x01 \x01(\t\"S\n\rFunctionStats\x12\x0f\n\x07\x62\x61\x63klog\x18\x01 \x01(\r\x12\x18\n\x10num_active_tasks\x18\x02 \x01(\r\x12\x17\n\x0fnum_total_tasks\x18\x03 \x01(\r\"\xc1\x04\n\rGenericResult\x12\x39\n\x06status\x18\x01 \x01(\x0e\x32).modal.client.GenericResult.GenericStatus\x12\x11\n\texception\x18\x02 \x01(\t\x12\x10\n\x08\x65xitcode\x18\x03 \x01(\x05\x12\x11\n\ttraceback\x18\x04 \x01(\t\x12\x0e\n\x04\x64\x61ta\x18\x05 \x01(\x0cH\x00\x12\x16\n\x0c\x64\x61ta_blob_id\x18\n \x01(\tH\x00\x12?\n\ngen_status\x18\x07 \x01(\x0e\x32+.modal.client.GenericResult.GeneratorStatus\x12\x15\n\rserialized_tb\x18\x0b \x01(\x0c\x12\x15\n\rtb_line_cache\x18\x0c \x01(\x0c\"\xa2\x01\n\rGenericStatus\x12\x1e\n\x1aGENERIC_STATUS_UNSPECIFIED\x10\x00\x12\x1a\n\x16GENERIC_STATUS_SUCCESS\x10\x01\x12\x1a\n\x16GENERIC_STATUS_FAILURE\x10\x02\x12\x1d\n\x19GENERIC_STATUS_TERMINATED\x10\x03\x12\x1a\n\x16GENERIC_STATUS_TIMEOUT\x10\x04\"s\n\x0fGeneratorStatus\x12 \n\x1cGENERATOR_STATUS_UNSPECIFIED\x10\x00\x12\x1f\n\x1bGENERATOR_STATUS_INCOMPLETE\x10\x01\x12\x1d\n\x19GENERATOR_STATUS_COMPLETE\x10\x02\x42\x0c\n\ndata_oneof\"\xe0\x02\n\x05Image\x12,\n\x0b\x62\x61se_images\x18\x05 \x03(\x0b\x32\x17.modal.client.BaseImage\x12\x1b\n\x13\x64ockerfile_commands\x18\x06 \x03(\t\x12\x35\n\rcontext_files\x18\x07 \x03(\x0b\x32\x1e.modal.client.ImageContextFile\x12\x0f\n\x07version\x18\x0b \x01(\t\x12\x12\n\nsecret_ids\x18\x0c \x03(\t\x12\x0b\n\x03gpu\x18\r \x01(\x08\x12\x1a\n\x12\x62uild_function_def\x18\x0e \x01(\t\x12\x18\n\x10\x63ontext_mount_id\x18\x0f \x01(\t\x12+\n\ngpu_config\x18\x10 \x01(\x0b\x32\x17.modal.client.GPUConfig\x12@\n\x15image_registry_config\x18\x11 \x01(\x0b\x32!.modal.client.ImageRegistryConfig\"2\n\x10ImageContextFile\x12\x10\n\x08\x66ilename\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\x0c\"\x83\x01\n\x17ImageGetOrCreateRequest\x12\"\n\x05image\x18\x02 \x01(\x0b\x32\x13.modal.client.Image\x12\x0e\n\x06\x61pp_id\x18\x04 \x01(\t\x12\x19\n\x11\x65xisting_image_id\x18\x05 \x01(\t\x12\x19\n\x11\x62uild_function_id\x18\x06 \x01(\t\",\n\x18ImageGetOrCreateResponse\x12\x10\n\x08image_id\x18\x01 \x01(\t\"5\n\x10ImageJoinRequest\x12\x10\n\x08image_id\x18\x01 \x01(\t\x12\x0f\n\x07timeout\x18\x02 \x01(\x02\"@\n\x11ImageJoinResponse\x12+\n\x06result\x18\x01 \x01(\x0b\x32\x1b.modal.client.GenericResult\"\x83\x01\n\x11MountBuildRequest\x12\x0e\n\x06\x61pp_id\x18\x02 \x01(\t\x12\x19\n\x11\x65xisting_mount_id\x18\x03 \x01(\t\x12&\n\x05\x66iles\x18\x04 \x03(\x0b\x32\x17.modal.client.MountFile\x12\x1b\n\x13manifest_sha256_hex\x18\x05 \x01(\t\"&\n\x12MountBuildResponse\x12\x10\n\x08mount_id\x18\x01 \x01(\t\"1\n\tMountFile\x12\x10\n\x08\x66ilename\x18\x01 \x01(\t\x12\x12\n\nsha256_hex\x18\x03 \x01(\t\"3\n\x1bMountGetMissingFilesRequest\x12\x14\n\x0csha256_hexes\x18\x01 \x03(\t\"<\n\x1cMountGetMissingFilesResponse\x12\x1c\n\x14missing_sha256_hexes\x18\x01 \x03(\t\"R\n\x11MountReuseRequest\x12\x0e\n\x06\x61pp_id\x18\x01 \x01(\t\x12\x10\n\x08mount_id\x18\x02 \x01(\t\x12\x1b\n\x13manifest_sha256_hex\x18\x03 \x01(\t\"$\n\x12MountReuseResponse\x12\x0e\n\x06reused\x18\x01 \x01(\x08\"N\n\x16MountPutArchiveRequest\x12\x0e\n\x04\x64\x61ta\x18\x01 \x01(\x0cH\x00\x12\x16\n\x0c\x64\x61ta_blob_id\x18\x02 \x01(\tH\x00\x42\x0c\n\ndata_oneof\"\x19\n\x17MountPutArchiveResponse\"_\n\x13MountPutFileRequest\x12\x12\n\nsha256_hex\x18\x02 \x01(\t\x12\x0e\n\x04\x64\x61ta\x18\x03 \x01(\x0cH\x00\x12\x16\n\x0c\x64\x61ta_blob_id\x18\x05 \x01(\tH\x00\x42\x0c\n\ndata_oneof\"&\n\x14MountPutFileResponse\x12\x0e\n\x06\x65xists\x18\x02 \x01(\x08\"\\\n\tProxyInfo\x12\x12\n\nelastic_ip\x18\x01 \x01(\t\x12\x11\n\tproxy_key\x18\x02 \x01(\t\x12\x13\n\x0bremote_addr\x18\x03 \x01(\t\x12\x13\n\x0bremote_port\x18\x04 \x01(\x05\"?\n\x12QueueCreateRequest\x12\x0e\n\x06\x61pp_id\x18\x01 \x01(\t\x12\x19\n\x11\x65xisting_queue_id\x18\x02 \x01(\t\"\'\n\x13QueueCreateResponse\x12\x10\n\x08queue_id\x18\x01 \x01(\t\"F\n\x0fQueueGetRequest\x12\x10\n\x08queue_id\x18\x01 \x01(\t\x12\x0f\n\x07timeout\x18\x03 \x01(\x02\x12\x10\n\x08n_values\x18\x04 \x01(\x05\"\"\n\x10QueueGetResponse\x12\x0e\n\x06values\x18\x02 \x03(\x0c\"3\n\x0fQueuePutRequest\x12\x10\n\x08queue_id\x18\x01 \x01(\t\x12\x0e\n\x06values\x18\x04 \x03(\x0c\"M\n\tRateLimit\x12\r\n\x05limit\x18\x01 \x01(\x05\x12\x31\n\x08interval\x18\x02 \x01(\x0e\x32\x1f.modal.client.RateLimitInterval\"O\n\tGPUConfig\x12#\n\x04type\x18\x01 \x01(\x0e\x32\x15.modal.client.GPUType\x12\r\n\x05\x63ount\x18\x02 \x01(\r\x12\x0e\n\x06memory\x18\x03 \x01(\r\"k\n\tResources\x12\x0b\n\x03gpu\x18\x01 \x01(\x08\x12\x11\n\tmemory_mb\x18\x02 \x01(\r\x12\x11\n\tmilli_cpu\x18\x03 \x01(\r\x12+\n\ngpu_config\x18\x04 \x01(\x0b\x32\x17.modal.client.GPUConfig\"\x8e\x02\n\x08Schedule\x12+\n\x04\x63ron\x18\x01 \x01(\x0b\x32\x1b.modal.client.Schedule.CronH\x00\x12/\n\x06period\x18\x02 \x01(\x0b\x32\x1d.modal.client.Schedule.PeriodH\x00\x1a\x1b\n\x04\x43ron\x12\x13\n\x0b\x63ron_string\x18\x01 \x01(\t\x1au\n\x06Period\x12\r\n\x05years\x18\x01 \x01(\x05\x12\x0e\n\x06months\x18\x02 \x01(\x05\x12\r\n\x05weeks\x18\x03 \x01(\x05\x12\x0c\n\x04\x64\x61ys\x18\x04 \x01(\x05\x12\r\n\x05hours\x18\x05 \x01(\x05\x12\x0f\n\x07minutes\x18\x06 \x01(\x05\x12\x0f\n\x07seconds\x18\x07 \x01(\x02\x42\x10\n\x0eschedule_oneof\"\xca\x01\n\x13SecretCreateRequest\x12@\n\x08\x65nv_dict\x18\x01 \x03(\x0b\x32..modal.client.SecretCreateRequest.EnvDictEntry\x12\x0e\n\x06\x61pp_id\x18\x02 \x01(\t\x12\x15\n\rtemplate_type\x18\x03 \x01(\t\x12\x1a\n\x12\x65xisting_secret_id\x18\x04 \x01(\t\x1a.\n\x0c\x45nvDictEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\")\n\x14SecretCreateResponse\x12\x11\n\tsecret_id\x18\x01 \x01(\t\"I\n\x0eSecretListItem\x12\r\n\x05label\x18\x01 \x01(\t\x12\x12\n\ncreated_at\x18\x02 \x01(\x01\x12\x14\n\x0clast_used_at\x18\x03 \x01(\x01\"A\n\x12SecretListResponse\x12+\n\x05items\x18\x01 \x03(\x0b\x32\x1c.modal.client.SecretListItem\"`\n\x19SharedVolumeCreateRequest\x12\x0e\n\x06\x61pp_id\x18\x01 \x01(\t\x12\x33\n\x0e\x63loud_provider\x18\x02 \x01(\x0e\x32\x1b.modal.client.CloudProvider\"6\n\x1aSharedVolumeCreateResponse\x12\x18\n\x10shared_volume_id\x18\x01 \x01(\t\"\x88\x01\n\x14SharedVolumeListItem\x12\r\n\x05label\x18\x01 \x01(\t\x12\x18\n\x10shared_volume_id\x18\x02 \x01(\t\x12\x12\n\ncreated_at\x18\x03 \x01(\x01\x12\x33\n\x0e\x63loud_provider\x18\x04 \x01(\x0e\x32\x1b.modal.client.CloudProvider\"M\n\x18SharedVolumeListResponse\x12\x31\n\x05items\x18\x01 \x03(\x0b\x32\".modal.client.SharedVolumeListItem\"F\n\x1cSharedVolumeListFilesRequest\x12\x18\n\x10shared_volume_id\x18\x01 \x01(\t\x12\x0c\n\x04path\x18\x02 \x01(\t\"\x8e\x01\n\x1aSharedVolumePutFileRequest\x12\x18\n\x10shared_volume_id\x18\x01 \x01(\t\x12\x0c\n\x04path\x18\x02 \x01(\t\x12\x12\n\nsha256_hex\x18\x03 \x01(\t\x12\x0e\n\x04\x64\x61ta\x18\x04 \x01(\x0cH\x00\x12\x16\n\x0c\x64\x61ta_blob_id\x18\x05 \x01(\tH\x00\x42\x0c\n\ndata_oneof\"D\n\x1aSharedVolumeGetFileRequest\x12\x18\n\x10shared_volume_id\x18\x01 \x01(\t\x12\x0c\n\x04path\x18\x02 \x01(\t\"S\n\x1bSharedVolumeGetFileResponse\x12\x0e\n\x04\x64\x61ta\x18\x01 \x01(\x0cH\x00\x12\x16\n\x0c\x64\x61ta_blob_id\x18\x02 \x01(\tH\x00\x42\x0c\n\ndata_oneof\"Z\n\x1dSharedVolumeRemoveFileRequest\x12\x18\n\x10shared_volume_id\x18\x01 \x01(\t\x12\x0c\n\x04path\x18\x02 \x01(\t\x12\x11\n\trecursive\x18\x03 \x01(\x08\"\xa1\x01\n\x1aSharedVolumeListFilesEntry\x12\x0c\n\x04path\x18\x01 \x01(\t\x12?\n\x04type\x18\x02 \x01(\x0e\x32\x31.modal.client.SharedVolumeListFilesEntry.FileType\"4\n\x08\x46ileType\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\x08\n\x04\x46ILE\x10\x01\x12\r\n\tDIRECTORY\x10\x02\"Z\n\x1dSharedVolumeListFilesResponse\x12\x39\n\x07\x65ntries\x18\x01 \x03(\x0b\x32(.modal.client.SharedVolumeListFilesEntry\"v\n\x11SharedVolumeMount\x12\x12\n\nmount_path\x18\x01 \x01(\t\x12\x18\n\x10shared_volume_id\x18\x02 \x01(\t\x12\x33\n\x0e\x63loud_provider\x18\x03 \x01(\x0e\x32\x1b.modal.client.CloudProvider\"\xee\x01\n\x08TaskLogs\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\t\x12+\n\ntask_state\x18\x06 \x01(\x0e\x32\x17.modal.client.TaskState\x12\x11\n\ttimestamp\x18\x07 \x01(\x01\x12\x35\n\x0f\x66ile_descriptor\x18\x08 \x01(\x0e\x32\x1c.modal.client.FileDescriptor\x12\x31\n\rtask_progress\x18\t \x01(\x0b\x32\x1a.modal.client.TaskProgress\x12\x18\n\x10\x66unction_call_id\x18\n \x01(\t\x12\x10\n\x08input_id\x18\x0b \x01(\t\"p\n\x0cTaskProgress\x12\x0b\n\x03len\x18\x01 \x01(\x04\x12\x0b\n\x03pos\x18\x02 \x01(\x04\x12\x31\n\rprogress_type\x18\x03 \x01(\x0e\x32\x1a.modal.client.ProgressType\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\"\x92\x01\n\rTaskLogsBatch\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12%\n\x05items\x18\x02 \x03(\x0b\x32\x16.modal.client.TaskLogs\x12\x10\n\x08\x65ntry_id\x18\x05 \x01(\t\x12\x10\n\x08\x61pp_done\x18\n \x01(\x08\x12\x13\n\x0b\x66unction_id\x18\x0b \x01(\t\x12\x10\n\x08input_id\x18\x0c \x01(\t\"Q\n\x11TaskResultRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12+\n\x06result\x18\x02 \x01(\x0b\x32\x1b.modal.client.GenericResult\"B\n\x16TokenFlowCreateRequest\x12\x11\n\tnode_name\x18\x01 \x01(\t\x12\x15\n\rplatform_name\x18\x02 \x01(\t\"A\n\x17TokenFlowCreateResponse\x12\x15\n\rtoken_flow_id\x18\x01 \x01(\t\x12\x0f\n\x07web_url\x18\x02 \x01(\t\">\n\x14TokenFlowWaitRequest\x12\x0f\n\x07timeout\x18\x01 \x01(\x02\x12\x15\n\rtoken_flow_id\x18\x02 \x01(\t\"P\n\x15TokenFlowWaitResponse\x12\x10\n\x08token_id\x18\x01 \x01(\t\x12\x14\n\x0ctoken_secret\x18\x02 \x01(\t\x12\x0f\n\x07timeout\x18\x03 \x01(\x08\"\xb5\x01\n\rWebhookConfig\x12\'\n\x04type\x18\x01 \x01(\x0e\x32\x19.modal.client.WebhookType\x12\x0e\n\x06method\x18\x02 \x01(\t\x12\x1d\n\x11wait_for_response\x18\x03 \x01(\x08\x42\x02\x18\x01\x12\x18\n\x10requested_suffix\x18\x04 \x01(\t\x12\x32\n\nasync_mode\x18\x05 \x01(\x0e\x32\x1e.modal.client.WebhookAsyncMode\"N\n\nWebUrlInfo\x12\x11\n\ttruncated\x18\x01 \x01(\x08\x12\x17\n\x0fhas_unique_hash\x18\x02 \x01(\x08\x12\x14\n\x0clabel_stolen\x18\x03 \x01(\x08*\xd1\x01\n\x08\x41ppState\x12\x19\n\x15\x41PP_STATE_UNSPECIFIED\x10\x00\x12\x17\n\x13\x41PP_STATE_EPHEMERAL\x10\x01\x12\x16\n\x12\x41PP_STATE_DETACHED\x10\x02\x12\x16\n\x12\x41PP_STATE_DEPLOYED\x10\x03\x12\x16\n\x12\x41PP_STATE_STOPPING\x10\x04\x12\x15\n\x11\x41PP_STATE_STOPPED\x10\x05\x12\x1a\n\x16\x41PP_STATE_INITIALIZING\x10\x06\x12\x16\n\x12\x41PP_STATE_DISABLED\x10\x07*\xa8\x01\n\nClientType\x12\x1b\n\x17\x43LIENT_TYPE_UNSPECIFIED\x10\x00\x12\x16\n\x12\x43LIENT_TYPE_CLIENT\x10\x01\x12\x16\n\x12\x43LIENT_TYPE_WORKER\x10\x02\x12\x19\n\x15\x43LIENT_TYPE_CONTAINER\x10\x03\x12\x16\n\x12\x43LIENT_TYPE_SERVER\x10\x04\x12\x1a\n\x16\x43LIENT_TYPE_WEB_SERVER\x10\x05*\x80\x01\n\x13\x44\x65ploymentNamespace\x12$\n DEPLOYMENT_NAMESPACE_UNSPECIFIED\x10\x00\x12\"\n\x1e\x44\x45PLOYMENT_NAMESPACE_WORKSPACE\x10\x01\x12\x1f\n\x1b\x44\x45PLOYMENT_NAMESPACE_GLOBAL\x10\x03*\x83\x01\n\x0e\x46ileDescriptor\x12\x1f\n\x1b\x46ILE_DESCRIPTOR_UNSPECIFIED\x10\x00\x12\x1a\n\x16\x46ILE_DESCRIPTOR_STDOUT\x10\x01\x12\x1a\n\x16\x46ILE_DESCRIPTOR_STDERR\x10\x02\x12\x18\n\x14\x46ILE_DESCRIPTOR_INFO\x10\x03*x\n\x11RateLimitInterval\x12#\n\x1fRATE_LIMIT_INTERVAL_UNSPECIFIED\x10\x00\x12\x1e\n\x1aRATE_LIMIT_INTERVAL_SECOND\x10\x01\x12\x1e\n\x1aRATE_LIMIT_INTERVAL_MINUTE\x10\x02*\xfd\x01\n\tTaskState\x12\x1a\n\x16TASK_STATE_UNSPECIFIED\x10\x00\x12\x16\n\x12TASK_STATE_CREATED\x10\x06\x12\x15\n\x11TASK_STATE_QUEUED\x10\x01\x12\x1e\n\x1aTASK_STATE_WORKER_ASSIGNED\x10\x02\x12\x1c\n\x18TASK_STATE_LOADING_IMAGE\x10\x03\x12\x15\n\x11TASK_STATE_ACTIVE\x10\x04\x12\x18\n\x14TASK_STATE_COMPLETED\x10\x05\x12!\n\x1dTASK_STATE_CREATING_CONTAINER\x10\x07\x12\x13\n\x0fTASK_STATE_IDLE\x10\x08*|\n\x0bWebhookType\x12\x1c\n\x18WEBHOOK_TYPE_UNSPECIFIED\x10\x00\x12\x19\n\x15WEBHOOK_TYPE_ASGI_APP\x10\x01\x12\x19\n\x15WEBHOOK_TYPE_FUNCTION\x10\x02\x12\x19\n\x15WEBHOOK_TYPE_WSGI_APP\x10\x03*\x9a\x01\n\x10WebhookAsyncMode\x12\"\n\x1eWEBHOOK_ASYNC_MODE_UNSPECIFIED\x10\x00\x12\x1f\n\x1bWEBHOOK_ASYNC_MODE_DISABLED\x10\x02\x12\x1e\n\x1aWEBHOOK_ASYNC_MODE_TRIGGER\x10\x03\x12\x1b\n\x17WEBHOOK_ASYNC_MODE_AUTO\x10\x04\"\x04\x08\x01\x10\x01*&\n\x0cRegistryType\x12\r\n\tDOCKERHUB\x10\x00\x12\x07\n\x03\x45\x43R\x10\x01*\x83\x01\n\x07GPUType\x12\x18\n\x14GPU_TYPE_UNSPECIFIED\x10\x00\x12\x0f\n\x0bGPU_TYPE_T4\x10\x01\x12\x11\n\rGPU_TYPE_A100\x10\x02\x12\x11\n\rGPU_TYPE_A10G\x10\x03\x12\x10\n\x0cGPU_TYPE_ANY\x10\x04\x12\x15\n\x11GPU_TYPE_A100_20G\x10\x05*x\n\rCloudProvider\x12\x1e\n\x1a\x43LOUD_PROVIDER_UNSPECIFIED\x10\x00\x12\x16\n\x12\x43LOUD_PROVIDER_AWS\x10\x01\x12\x16\n\x12\x43LOUD_PROVIDER_GCP\x10\x02\x12\x17\n\x13\x43LOUD_PROVIDER_AUTO\x10\x03*>\n\x0cProgressType\x12\x19\n\x15IMAGE_SNAPSHOT_UPLOAD\x10\x00\x12\x13\n\x0f\x46UNCTION_QUEUED\x10\x01\x32\xf0%\n\x0bModalClient\x12L\n\tAppCreate\x12\x1e.modal.client.AppCreateRequest\x1a\x1f.modal.client.AppCreateResponse\x12W\n\x13\x41ppClientDisconnect\x12(.modal.client.AppClientDisconnectRequest\x1a\x16.google.protobuf.Empty\x12L\n\nAppGetLogs\x12\x1f.modal.client.AppGetLogsRequest\x1a\x1b.modal.client.TaskLogsBatch0\x01\x12K\n\rAppSetObjects\x12\".modal.client.AppSetObjectsRequest\x1a\x16.google.protobuf.Empty\x12X\n\rAppGetObjects\x12\".modal.client.AppGetObjectsRequest\x1a#.modal.client.AppGetObjectsResponse\x12@\n\x07\x41ppList\x12\x16.google.protobuf.Empty\x1a\x1d.modal.client.AppListResponse\x12^\n\x0f\x41ppLookupObject\x12$.modal.client.AppLookupObjectRequest\x1a%.modal.client.AppLookupObjectResponse\x12L\n\tAppDeploy\x12\x1e.modal.client.AppDeployRequest\x1a\x1f.modal.client.AppDeployResponse\x12s\n\x16\x41ppGetByDeploymentName\x12+.modal.client.AppGetByDeploymentNameRequest\x1a,.modal.client.AppGetByDeploymentNameResponse\x12?\n\x07\x41ppStop\x12\x1c.modal.client.AppStopRequest\x1a\x16.google.protobuf.Empty\x12I\n\x0c\x41ppHeartbeat\x12!.modal.client.AppHeartbeatRequest\x1a\x16.google.protobuf.Empty\x12O\n\nBlobCreate\x12\x1f.modal.client.BlobCreateRequest\x1a .modal.client.BlobCreateResponse\x12\x46\n\x07\x42lobGet\x12\x1c.modal.client.BlobGetRequest\x1a\x1d.modal.client.BlobGetResponse\x12U\n\x0c\x43lientCreate\x12!.modal.client.ClientCreateRequest\x1a\".modal.client.ClientCreateResponse\x12H\n\x0b\x43lientHello\x12\x16.google.protobuf.Empty\x1a!.modal.client.ClientHelloResponse\x12O\n\x0f\x43lientHeartbeat\x12$.modal.client.ClientHeartbeatRequest\x1a\x16.google.protobuf.Empty\x12U\n\x12\x43ontainerHeartbeat\x12\'.modal.client.ContainerHeartbeatRequest\x1a\x16.google.protobuf.Empty\x12O\n\nDictCreate\x12\x1f.modal.client.DictCreateRequest\x1a .modal.client.DictCreateResponse\x12O\n\nDictUpdate\x12\x1f.modal.client.DictUpdateRequest\x1a .modal.client.DictUpdateResponse\x12\x46\n\x07\x44ictGet\x12\x1c.modal.client.DictGetRequest\x1a\x1d.modal.client.DictGetResponse\x12\x46\n\x07\x44ictPop\x12\x1c.modal.client.DictPopRequest\x1a\x1d.modal.client.DictPopResponse\x12U\n\x0c\x44ictContains\x12!.modal.client.DictContainsRequest\x1a\".modal.client.DictContainsResponse\x12\x46\n\x07\x44ictLen\x12\x1c.modal.client.DictLenRequest\x1a\x1d.modal.client.DictLenResponse\x12[\n\x0e\x46unctionCreate\x12#.modal.client.FunctionCreateRequest\x1a$.modal.client.FunctionCreateResponse\x12p\n\x15\x46unctionGetSerialized\x12*.modal.client.FunctionGetSerializedRequest\x1a+.modal.client.FunctionGetSerializedResponse\x12R\n\x0b\x46unctionMap\x12 .modal.client.FunctionMapRequest\x1a!.modal.client.FunctionMapResponse\x12\x64\n\x11\x46unctionPutInputs\x12&.modal.client.FunctionPutInputsRequest\x1a\'.modal.client.FunctionPutInputsResponse\x12U\n\x12\x46unctionPutOutputs\x12\'.modal.client.FunctionPutOutputsRequest\x1a\x16.google.protobuf.Empty\x12\x64\n\x11\x46unctionGetInputs\x12&.modal.client.FunctionGetInputsRequest\x1a\'.modal.client.FunctionGetInputsResponse\x12g\n\x12\x46unctionGetOutputs\x12\'.modal.client.FunctionGetOutputsRequest\x1a(.modal.client.FunctionGetOutputsResponse\x12m\n\x14\x46unctionGetCallGraph\x12).modal.client.FunctionGetCallGraphRequest\x1a*.modal.client.FunctionGetCallGraphResponse\x12U\n\x12\x46unctionCallCancel\x12\'.modal.client.FunctionCallCancelRequest\x1a\x16.google.protobuf.Empty\x12\x64\n\x17\x46unctionGetCurrentStats\x12,.modal.client.FunctionGetCurrentStatsRequest\x1a\x1b.modal.client.FunctionStats\x12\x61\n\x10ImageGetOrCreate\x12%.modal.client.ImageGetOrCreateRequest\x1a&.modal.client.ImageGetOrCreateResponse\x12L\n\tImageJoin\x12\x1e.modal.client.ImageJoinRequest\x1a\x1f.modal.client.ImageJoinResponse\x12m\n\x14MountGetMissingFiles\x12).modal.client.MountGetMissingFilesRequest\x1a*.modal.client.MountGetMissingFilesResponse\x12^\n\x0fMountPutArchive\x12$.modal.client.MountPutArchiveRequest\x1a%.modal.client.MountPutArchiveResponse\x12U\n\x0cMountPutFile\x12!.modal.client.MountPutFileRequest\x1a\".modal.client.MountPutFileResponse\x12O\n\nMountBuild\x12\x1f.modal.client.MountBuildRequest\x1a .modal.client.MountBuildResponse\x12O\n\nMountReuse\x12\x1f.modal.client.MountReuseRequest\x1a .modal.client.MountReuseResponse\x12R\n\x0bQueueCreate\x12 .modal.client.QueueCreateRequest\x1a!.modal.client.QueueCreateResponse\x12I\n\x08QueueGet\x12\x1d.modal.client.QueueGetRequest\x1a\x1e.modal.client.QueueGetResponse\x12\x41\n\x08QueuePut\x12\x1d.modal.client.QueuePutRequest\x1a\x16.google.protobuf.Empty\x12U\n\x0cSecretCreate\x12!.modal.client.SecretCreateRequest\x1a\".modal.client.SecretCreateResponse\x12\x46\n\nSecretList\x12\x16.google.protobuf.Empty\x1a .modal.client.SecretListResponse\x12g\n\x12SharedVolumeCreate\x12\'.modal.client.SharedVolumeCreateRequest\x1a(.modal.client.SharedVolumeCreateResponse\x12R\n\x10SharedVolumeList\x12\x16.google.protobuf.Empty\x1a&.modal.client.SharedVolumeListResponse\x12p\n\x15SharedVolumeListFiles\x12*.modal.client.SharedVolumeListFilesRequest\x1a+.modal.client.SharedVolumeListFilesResponse\x12x\n\x1bSharedVolumeListFilesStream\x12*.modal.client.SharedVolumeListFilesRequest\x1a+.modal.client.SharedVolumeListFilesResponse0\x01\x12W\n\x13SharedVolumePutFile\x12(.modal.client.SharedVolumePutFileRequest\x1a\x16.google.protobuf.Empty\x12j\n\x13SharedVolumeGetFile\x12(.modal.client.SharedVolumeGetFileRequest\x1a).modal.client.SharedVolumeGetFileResponse\x12]\n\x16SharedVolumeRemoveFile\x12+.modal.client.SharedVolumeRemoveFileRequest\x1a\x16.google.protobuf.Empty\x12\x45\n\nTaskResult\x12\x1f.modal.client.TaskResultRequest\x1a\x16.google.protobuf.Empty\x12^\n\x0fTokenFlowCreate\x12$.modal.client.TokenFlowCreateRequest\x1a%.modal.client.TokenFlowCreateResponse\x12X\n\rTokenFlowWait\x12\".modal.client.TokenFlowWaitRequest\x1a#.modal.client.TokenFlowWaitResponseb\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'modal_proto.api_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _APPGETBYDEPLOYMENTNAMEREQUEST.fields_by_name['client_id']._options = None
+  _APPGETBYDEPLOYMENTNAMEREQUEST.fields_by_name['client_id']._serialized_options = b'\030\001'
+  _APPGETOBJECTSRESPONSE_OBJECTIDSENTRY._options = None
+  _APPGETOBJECTSRESPONSE_OBJECTIDSENTRY._serialized_options = b'8\001'
+  _APPGETOBJECTSRESPONSE.fields_by_name['object_ids']._options = None
+  _APPGETOBJECTSRESPONSE.fields_by_name['object_ids']._serialized_options = b'\030\001'
+  _APPSETOBJECTSREQUEST_INDEXEDOBJECTIDSENTRY._options = None
+  _APPSETOBJECTSREQUEST_INDEXEDOBJECTIDSENTRY._serialized_options = b'8\001'
+  _CONTAINERARGUMENTS_TRACINGCONTEXTENTRY._options = None
+  _CONTAINERARGUMENTS_TRACINGCONTEXTENTRY._serialized_options = b'8\001'
+  _SECRETCREATEREQUEST_ENVDICTENTRY._options = None
+  _SECRETCREATEREQUEST_ENVDICTENTRY._serialized_options = b'8\001'
+  _WEBHOOKCONFIG.fields_by_name['wait_for_response']._options = None
+  _WEBHOOKCONFIG.fields_by_name['wait_for_response']._serialized_options = b'\030\001'
+  _APPSTATE._serialized_start=13547
+  _APPSTATE._serialized_end=13756
+  _CLIENTTYPE._serialized_start=13759
+  _CLIENTTYPE._serialized_end=13927
+  _DEPLOYMENTNAMESPACE._serialized_start=13930
+  _DEPLOYMENTNAMESPACE._serialized_end=14058
+  _FILEDESCRIPTOR._serialized_start=14061
+  _FILEDESCRIPTOR._serialized_end=14192
+  _RATELIMITINTERVAL._serialized_start=14194
+  _RATELIMITINTERVAL._serialized_end=14314
+  _TASKSTATE._serialized_start=14317
+  _TASKSTATE._serialized_end=14570
+  _WEBHOOKTYPE._serialized_start=14572
+  _WEBHOOKTYPE._serialized_end=14696
+  _WEBHOOKASYNCMODE._serialized_start=14699
+  _WEBHOOKASYNCMODE._serialized_end=14853
+  _REGISTRYTYPE._serialized_start=14855
+  _REGISTRYTYPE._serialized_end=14893
+  _GPUTYPE._serialized_start=14896
+  _GPUTYPE._serialized_end=15027
+  _CLOUDPROVIDER._serialized_start=15029
+  _CLOUDPROVIDER._serialized_end=15149
+  _PROGRESSTYPE._serialized_start=15151
+  _PROGRESSTYPE._serialized_end=15213
+  _APPCLIENTDISCONNECTREQUEST._serialized_start=68
+  _APPCLIENTDISCONNECTREQUEST._serialized_end=112
+  _APPCREATEREQUEST._serialized_start=114
+  _APPCREATEREQUEST._serialized_end=210
+  _APPCREATERESPONSE._serialized_start=212
+  _APPCREATERESPONSE._serialized_end=269
+  _APPSTOPREQUEST._serialized_start=271
+  _APPSTOPREQUEST._serialized_end=303
+  _APPDEPLOYREQUEST._serialized_start=305
+  _APPDEPLOYREQUEST._serialized_end=430
+  _APPDEPLOYRESPONSE._serialized_start=432
+  _APPDEPLOYRESPONSE._serialized_end=464
+  _APPGETBYDEPLOYMENTNAMEREQUEST._serialized_start=466
+  _APPGETBYDEPLOYMENTNAMEREQUEST._serialized_end=588
+  _APPGETBYDEPLOYMENTNAMERESPONSE._serialized_start=590
+  _APPGETBYDEPLOYMENTNAMERESPONSE._serialized_end=665
+  _APPGETLOGSREQUEST._serialized_start=668
+  _APPGETLOGSREQUEST._serialized_end=799
+  _APPGETOBJECTSREQUEST._serialized_start=801
+  _APPGETOBJECTSREQUEST._serialized_end=839
+  _APPGETOBJECTSITEM._serialized_start=841
+  _APPGETOBJECTSITEM._serialized_end=952
+  _APPGETOBJECTSRESPONSE._serialized_start=955
+  _APPGETOBJECTSRESPONSE._serialized_end=1152
+  _APPGETOBJECTSRESPONSE_OBJECTIDSENTRY._serialized_start=1104
+  _APPGETOBJECTSRESPONSE_OBJECTIDSENTRY._serialized_end=1152
+  _APPSTATS._serialized_start=1155
+  _APPSTATS._serialized_end=1343
+  _APPLISTRESPONSE._serialized_start=1345
+  _APPLISTRESPONSE._serialized_end=1400
+  _APPLOOKUPOBJECTREQUEST._serialized_start=1403
+  _APPLOOKUPOBJECTREQUEST._serialized_end=1561
+  _APPLOOKUPOBJECTRESPONSE._serialized_start=1563
+  _APPLOOKUPOBJECTRESPONSE._serialized_end=1690
+  _APPSETOBJECTSREQUEST._serialized_start=1693
+  _APPSETOBJECTSREQUEST._serialized_end=1970
+  _APPSETOBJECTSREQUEST_INDEXEDOBJECTIDSENTRY._serialized_start=1915
+  _APPSETOBJECTSREQUEST_INDEXEDOBJECTIDSENTRY._serialized_end=1970
+  _APPHEARTBEATREQUEST._serialized_start=1972
+  _APPHEARTBEATREQUEST._serialized_end=2009
+  _IMAGEREGISTRYCONFIG._serialized_start=2011
+  _IMAGEREGISTRYCONFIG._serialized_end=2102
+  _BASEIMAGE._serialized_start=2104
+  _BASEIMAGE._serialized_end=2153
+  _BLOBCREATEREQUEST._serialized_start=2155
+  _BLOBCREATEREQUEST._serialized_end=2250
+  _MULTIPARTUPLOAD._serialized_start=2252
+  _MULTIPARTUPLOAD._serialized_end=2335
+  _BLOBCREATERESPONSE._serialized_start=2338
+  _BLOBCREATERESPONSE._serialized_end=2470
+  _BLOBGETREQUEST._serialized_start=2472
+  _BLOBGETREQUEST._serialized_end=2505
+  _BLOBGETRESPONSE._serialized_start=2507
+  _BLOBGETRESPONSE._serialized_end=2546
+  _CLIENTCREATEREQUEST._serialized_start=2548
+  _CLIENTCREATEREQUEST._serialized_end=2633
+  _CLIENTCREATERESPONSE._serialized_start=2635
+  _CLIENTCREATERESPONSE._serialized_end=2720
+  _CLIENTHELLORESPONSE._serialized_start=2722
+  _CLIENTHELLORESPONSE._serialized_end=2760
+  _CLIENTHEARTBEATREQUEST._serialized_start=2762
+  _CLIENTHEARTBEATREQUEST._serialized_end=2865
+  _CONTAINERARGUMENTS._serialized_start=2868
+  _CONTAINERARGUMENTS._serialized_end=3167
+  _CONTAINERARGUMENTS_TRACINGCONTEXTENTRY._serialized_start=3114
+  _CONTAINERARGUMENTS_TRACINGCONTEXTENTRY._serialized_end=3167
+  _CONTAINERHEARTBEATREQUEST._serialized_start=3169
+  _CONTAINERHEARTBEATREQUEST._serialized_end=3256
+  _DICTCONTAINSREQUEST._serialized_start=3258
+  _DICTCONTAINSREQUEST._serialized_end=3309
+  _DICTCONTAINSRESPONSE._serialized_start=3311
+  _DICTCONTAINSRESPONSE._serialized_end=3348
+  _DICTCREATEREQUEST._serialized_start=3350
+  _DICTCREATEREQUEST._serialized_end=3450
+  _DICTCREATERESPONSE._serialized_start=3452
+  _DICTCREATERESPONSE._serialized_end=3489
+  _DICTENTRY._serialized_start=3491
+  _DICTENTRY._serialized_end=3530
+  _DICTGETREQUEST._serialized_start=3532
+  _DICTGETREQUEST._serialized_end=3578
+  _DICTGETRESPONSE._serialized_start=3580
+  _DICTGETRESPONSE._serialized_end=3642
+  _DICTLENREQUEST._serialized_start=3644
+  _DICTLENREQUEST._serialized_end=3677
+  _DICTLENRESPONSE._serialized_start=3679
+  _DICTLENRESPONSE._serialized_end=3709
+  _DICTPOPREQUEST._serialized_start=3711
+  _DICTPOPREQUEST._serialized_end=3757
+  _DICTPOPRESPONSE._serialized_start=3759
+  _DICTPOPRESPONSE._serialized_end=3821
+  _DICTUPDATEREQUEST._serialized_start=3823
+  _DICTUPDATEREQUEST._serialized_end=3901
+  _DICTUPDATERESPONSE._serialized_start=3903
+  _DICTUPDATERESPONSE._serialized_end=3923
+  _PTYINFO._serialized_start=3926
+  _PTYINFO._serialized_end=4059
+  _FUNCTION._serialized_start=4062
+  _FUNCTION._serialized_end=5146
+  _FUNCTION_DEFINITIONTYPE._serialized_start=4922
+  _FUNCTION_DEFINITIONTYPE._serialized_end=5029
+  _FUNCTION_FUNCTIONTYPE._serialized_start=5031
+  _FUNCTION_FUNCTIONTYPE._serialized_end=5133
+  _FUNCTIONCREATEREQUEST._serialized_start=5149
+  _FUNCTIONCREATEREQUEST._serialized_end=5302
+  _FUNCTIONCREATERESPONSE._serialized_start=5305
+  _FUNCTIONCREATERESPONSE._serialized_end=5457
+  _FUNCTIONGETINPUTSITEM._serialized_start=5459
+  _FUNCTIONGETINPUTSITEM._serialized_end=5571
+  _FUNCTIONGETINPUTSREQUEST._serialized_start=5573
+  _FUNCTIONGETINPUTSREQUEST._serialized_end=5667
+  _FUNCTIONGETINPUTSRESPONSE._serialized_start=5669
+  _FUNCTIONGETINPUTSRESPONSE._serialized_end=5784
+  _FUNCTIONGETOUTPUTSITEM._serialized_start=5786
+  _FUNCTIONGETOUTPUTSITEM._serialized_end=5905
+  _FUNCTIONGETOUTPUTSREQUEST._serialized_start=5908
+  _FUNCTIONGETOUTPUTSREQUEST._serialized_end=6047
+  _FUNCTIONGETOUTPUTSRESPONSE._serialized_start=6049
+  _FUNCTIONGETOUTPUTSRESPONSE._serialized_end=6169
+  _FUNCTIONGETSERIALIZEDREQUEST._serialized_start=6171
+  _FUNCTIONGETSERIALIZEDREQUEST._serialized_end=6222
+  _FUNCTIONGETSERIALIZEDRESPONSE._serialized_start=6224
+  _FUNCTIONGETSERIALIZEDRESPONSE._serialized_end=6310
+  _FUNCTIONINPUT._serialized_start=6312
+  _FUNCTIONINPUT._serialized_end=6402
+  _FUNCTIONMAPREQUEST._serialized_start=6404
+  _FUNCTIONMAPREQUEST._serialized_end=6470
+  _FUNCTIONMAPRESPONSE._serialized_start=6472
+  _FUNCTIONMAPRESPONSE._serialized_end=6519
+  _FUNCTIONPUTINPUTSITEM._serialized_start=6521
+  _FUNCTIONPUTINPUTSITEM._serialized_end=6601
+  _FUNCTIONPUTINPUTSREQUEST._serialized_start=6603
+  _FUNCTIONPUTINPUTSREQUEST._serialized_end=6729
+  _FUNCTIONPUTINPUTSRESPONSEITEM._serialized_start=6731
+  _FUNCTIONPUTINPUTSRESPONSEITEM._serialized_end=6793
+  _FUNCTIONPUTINPUTSRESPONSE._serialized_start=6795
+  _FUNCTIONPUTINPUTSRESPONSE._serialized_end=6883
+  _FUNCTIONPUTOUTPUTSITEM._serialized_start=6886
+  _FUNCTIONPUTOUTPUTSITEM._serialized_end=7045
+  _FUNCTIONPUTOUTPUTSREQUEST._serialized_start=7047
+  _FUNCTIONPUTOUTPUTSREQUEST._serialized_end=7129
+  _FUNCTIONRETRYPOLICY._serialized_start=7131
+  _FUNCTIONRETRYPOLICY._serialized_end=7246
+  _FUNCTIONGETCALLGRAPHREQUEST._serialized_start=7248
+  _FUNCTIONGETCALLGRAPHREQUEST._serialized_end=7303
+  _INPUTCALLGRAPHINFO._serialized_start=7306
+  _INPUTCALLGRAPHINFO._serialized_end=7446
+  _FUNCTIONCALLCALLGRAPHINFO._serialized_start=7448
+  _FUNCTIONCALLCALLGRAPHINFO._serialized_end=7570
+  _FUNCTIONGETCALLGRAPHRESPONSE._serialized_start=7573
+  _FUNCTIONGETCALLGRAPHRESPONSE._serialized_end=7718
+  _FUNCTIONCALLCANCELREQUEST._serialized_start=7720
+  _FUNCTIONCALLCANCELREQUEST._serialized_end=7773
+  _FUNCTIONGETCURRENTSTATSREQUEST._serialized_start=7775
+  _FUNCTIONGETCURRENTSTATSREQUEST._serialized_end=7828
+  _FUNCTIONSTATS._serialized_start=7830
+  _FUNCTIONSTATS._serialized_end=7913
+  _GENERICRESULT._serialized_start=7916
+  _GENERICRESULT._serialized_end=8493
+  _GENERICRESULT_GENERICSTATUS._serialized_start=8200
+  _GENERICRESULT_GENERICSTATUS._serialized_end=8362
+  _GENERICRESULT_GENERATORSTATUS._serialized_start=8364
+  _GENERICRESULT_GENERATORSTATUS._serialized_end=8479
+  _IMAGE._serialized_start=8496
+  _IMAGE._serialized_end=8848
+  _IMAGECONTEXTFILE._serialized_start=8850
+  _IMAGECONTEXTFILE._serialized_end=8900
+  _IMAGEGETORCREATEREQUEST._serialized_start=8903
+  _IMAGEGETORCREATEREQUEST._serialized_end=9034
+  _IMAGEGETORCREATERESPONSE._serialized_start=9036
+  _IMAGEGETORCREATERESPONSE._serialized_end=9080
+  _IMAGEJOINREQUEST._serialized_start=9082
+  _IMAGEJOINREQUEST._serialized_end=9135
+  _IMAGEJOINRESPONSE._serialized_start=9137
+  _IMAGEJOINRESPONSE._serialized_end=9201
+  _MOUNTBUILDREQUEST._serialized_start=9204
+  _MOUNTBUILDREQUEST._serialized_end=9335
+  _MOUNTBUILDRESPONSE._serialized_start=9337
+  _MOUNTBUILDRESPONSE._serialized_end=9375
+  _MOUNTFILE._serialized_start=9377
+  _MOUNTFILE._serialized_end=9426
+  _MOUNTGETMISSINGFILESREQUEST._serialized_start=9428
+  _MOUNTGETMISSINGFILESREQUEST._serialized_end=9479
+  _MOUNTGETMISSINGFILESRESPONSE._serialized_start=9481
+  _MOUNTGETMISSINGFILESRESPONSE._serialized_end=9541
+  _MOUNTREUSEREQUEST._serialized_start=9543
+  _MOUNTREUSEREQUEST._serialized_end=9625
+  _MOUNTREUSERESPONSE._serialized_start=9627
+  _MOUNTREUSERESPONSE._serialized_end=9663
+  _MOUNTPUTARCHIVEREQUEST._serialized_start=9665
+  _MOUNTPUTARCHIVEREQUEST._serialized_end=9743
+  _MOUNTPUTARCHIVERESPONSE._serialized_start=9745
+  _MOUNTPUTARCHIVERESPONSE._serialized_end=9770
+  _MOUNTPUTFILEREQUEST._serialized_start=9772
+  _MOUNTPUTFILEREQUEST._serialized_end=9867
+  _MOUNTPUTFILERESPONSE._serialized_start=9869
+  _MOUNTPUTFILERESPONSE._serialized_end=9907
+  _PROXYINFO._serialized_start=9909
+  _PROXYINFO._serialized_end=10001
+  _QUEUECREATEREQUEST._serialized_start=10003
+  _QUEUECREATEREQUEST._serialized_end=10066
+  _QUEUECREATERESPONSE._serialized_start=10068
+  _QUEUECREATERESPONSE._serialized_end=10107
+  _QUEUEGETREQUEST._serialized_start=10109
+  _QUEUEGETREQUEST._serialized_end=10179
+  _QUEUEGETRESPONSE._serialized_start=10181
+  _QUEUEGETRESPONSE._serialized_end=10215
+  _QUEUEPUTREQUEST._serialized_start=10217
+  _QUEUEPUTREQUEST._serialized_end=10268
+  _RATELIMIT._serialized_start=10270
+  _RATELIMIT._serialized_end=10347
+  _GPUCONFIG._serialized_start=10349
+  _GPUCONFIG._serialized_end=10428
+  _RESOURCES._serialized_start=10430
+  _RESOURCES._serialized_end=10537
+  _SCHEDULE._serialized_start=10540
+  _SCHEDULE._serialized_end=10810
+  _SCHEDULE_CRON._serialized_start=10646
+  _SCHEDULE_CRON._serialized_end=10673
+  _SCHEDULE_PERIOD._serialized_start=10675
+  _SCHEDULE_PERIOD._serialized_end=10792
+  _SECRETCREATEREQUEST._serialized_start=10813
+  _SECRETCREATEREQUEST._serialized_end=11015
+  _SECRETCREATEREQUEST_ENVDICTENTRY._serialized_start=10969
+  _SECRETCREATEREQUEST_ENVDICTENTRY._serialized_end=11015
+  _SECRETCREATERESPONSE._serialized_start=11017
+  _SECRETCREATERESPONSE._serialized_end=11058
+  _SECRETLISTITEM._serialized_start=11060
+  _SECRETLISTITEM._serialized_end=11133
+  _SECRETLISTRESPONSE._serialized_start=11135
+  _SECRETLISTRESPONSE._serialized_end=11200
+  _SHAREDVOLUMECREATEREQUEST._serialized_start=11202
+  _SHAREDVOLUMECREATEREQUEST._serialized_end=11298
+  _SHAREDVOLUMECREATERESPONSE._serialized_start=11300
+  _SHAREDVOLUMECREATERESPONSE._serialized_end=11354
+  _SHAREDVOLUMELISTITEM._serialized_start=11357
+  _SHAREDVOLUMELISTITEM._serialized_end=11493
+  _SHAREDVOLUMELISTRESPONSE._serialized_start=11495
+  _SHAREDVOLUMELISTRESPONSE._serialized_end=11572
+  _SHAREDVOLUMELISTFILESREQUEST._serialized_start=11574
+  _SHAREDVOLUMELISTFILESREQUEST._serialized_end=11644
+  _SHAREDVOLUMEPUTFILEREQUEST._serialized_start=11647
+  _SHAREDVOLUMEPUTFILEREQUEST._serialized_end=11789
+  _SHAREDVOLUMEGETFILEREQUEST._serialized_start=11791
+  _SHAREDVOLUMEGETFILEREQUEST._serialized_end=11859
+  _SHAREDVOLUMEGETFILERESPONSE._serialized_start=11861
+  _SHAREDVOLUMEGETFILERESPONSE._serialized_end=11944
+  _SHAREDVOLUMEREMOVEFILEREQUEST._serialized_start=11946
+  _SHAREDVOLUMEREMOVEFILEREQUEST._serialized_end=12036
+  _SHAREDVOLUMELISTFILESENTRY._serialized_start=12039
+  _SHAREDVOLUMELISTFILESENTRY._serialized_end=12200
+  _SHAREDVOLUMELISTFILESENTRY_FILETYPE._serialized_start=12148
+  _SHAREDVOLUMELISTFILESENTRY_FILETYPE._serialized_end=12200
+  _SHAREDVOLUMELISTFILESRESPONSE._serialized_start=12202
+  _SHAREDVOLUMELISTFILESRESPONSE._serialized_end=12292
+  _SHAREDVOLUMEMOUNT._serialized_start=12294
+  _SHAREDVOLUMEMOUNT._serialized_end=12412
+  _TASKLOGS._serialized_start=12415
+  _TASKLOGS._serialized_end=12653
+  _TASKPROGRESS._serialized_start=12655
+  _TASKPROGRESS._serialized_end=12767
+  _TASKLOGSBATCH._serialized_start=12770
+  _TASKLOGSBATCH._serialized_end=12916
+  _TASKRESULTREQUEST._serialized_start=12918
+  _TASKRESULTREQUEST._serialized_end=12999
+  _TOKENFLOWCREATEREQUEST._serialized_start=13001
+  _TOKENFLOWCREATEREQUEST._serialized_end=13067
+  _TOKENFLOWCREATERESPONSE._serialized_start=13069
+  _TOKENFLOWCREATERESPONSE._serialized_end=13134
+  _TOKENFLOWWAITREQUEST._serialized_start=13136
+  _TOKENFLOWWAITREQUEST._serialized_end=13198
+  _TOKENFLOWWAITRESPONSE._serialized_start=13200
+  _TOKENFLOWWAITRESPONSE._serialized_end=13280
+  _WEBHOOKCONFIG._serialized_start=13283
+  _WEBHOOKCONFIG._serialized_end=13464
+  _WEBURLINFO._serialized_start=13466
+  _WEBURLINFO._serialized_end=13544
+  _MODALCLIENT._serialized_start=15216
+  _MODALCLIENT._serialized_end=20064
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,2698 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+"""
+import builtins
+import google.protobuf.descriptor
+import google.protobuf.internal.containers
+import google.protobuf.internal.enum_type_wrapper
+import google.protobuf.message
+import typing
+import typing_extensions
+
+DESCRIPTOR: google.protobuf.descriptor.FileDescriptor
+
+class _AppState:
+    ValueType = typing.NewType('ValueType', builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+class _AppStateEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_AppState.ValueType], builtins.type):
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    APP_STATE_UNSPECIFIED: _AppState.ValueType  # 0
+    APP_STATE_EPHEMERAL: _AppState.ValueType  # 1
+    """Will be discharged when the client disconnects"""
+
+    APP_STATE_DETACHED: _AppState.ValueType  # 2
+    APP_STATE_DEPLOYED: _AppState.ValueType  # 3
+    """Will be discharged when overwritten"""
+
+    APP_STATE_STOPPING: _AppState.ValueType  # 4
+    """Winding down app due to user termination."""
+
+    APP_STATE_STOPPED: _AppState.ValueType  # 5
+    """Stopped"""
+
+    APP_STATE_INITIALIZING: _AppState.ValueType  # 6
+    """App is created and in process of deployment."""
+
+    APP_STATE_DISABLED: _AppState.ValueType  # 7
+    """Same as stopped but prevented from being garbage collected"""
+
+class AppState(_AppState, metaclass=_AppStateEnumTypeWrapper):
+    pass
+
+APP_STATE_UNSPECIFIED: AppState.ValueType  # 0
+APP_STATE_EPHEMERAL: AppState.ValueType  # 1
+"""Will be discharged when the client disconnects"""
+
+APP_STATE_DETACHED: AppState.ValueType  # 2
+APP_STATE_DEPLOYED: AppState.ValueType  # 3
+"""Will be discharged when overwritten"""
+
+APP_STATE_STOPPING: AppState.ValueType  # 4
+"""Winding down app due to user termination."""
+
+APP_STATE_STOPPED: AppState.ValueType  # 5
+"""Stopped"""
+
+APP_STATE_INITIALIZING: AppState.ValueType  # 6
+"""App is created and in process of deployment."""
+
+APP_STATE_DISABLED: AppState.ValueType  # 7
+"""Same as stopped but prevented from being garbage collected"""
+
+global___AppState = AppState
+
+
+class _ClientType:
+    ValueType = typing.NewType('ValueType', builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+class _ClientTypeEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_ClientType.ValueType], builtins.type):
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    CLIENT_TYPE_UNSPECIFIED: _ClientType.ValueType  # 0
+    CLIENT_TYPE_CLIENT: _ClientType.ValueType  # 1
+    CLIENT_TYPE_WORKER: _ClientType.ValueType  # 2
+    CLIENT_TYPE_CONTAINER: _ClientType.ValueType  # 3
+    CLIENT_TYPE_SERVER: _ClientType.ValueType  # 4
+    CLIENT_TYPE_WEB_SERVER: _ClientType.ValueType  # 5
+class ClientType(_ClientType, metaclass=_ClientTypeEnumTypeWrapper):
+    pass
+
+CLIENT_TYPE_UNSPECIFIED: ClientType.ValueType  # 0
+CLIENT_TYPE_CLIENT: ClientType.ValueType  # 1
+CLIENT_TYPE_WORKER: ClientType.ValueType  # 2
+CLIENT_TYPE_CONTAINER: ClientType.ValueType  # 3
+CLIENT_TYPE_SERVER: ClientType.ValueType  # 4
+CLIENT_TYPE_WEB_SERVER: ClientType.ValueType  # 5
+global___ClientType = ClientType
+
+
+class _DeploymentNamespace:
+    ValueType = typing.NewType('ValueType', builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+class _DeploymentNamespaceEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_DeploymentNamespace.ValueType], builtins.type):
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    DEPLOYMENT_NAMESPACE_UNSPECIFIED: _DeploymentNamespace.ValueType  # 0
+    DEPLOYMENT_NAMESPACE_WORKSPACE: _DeploymentNamespace.ValueType  # 1
+    DEPLOYMENT_NAMESPACE_GLOBAL: _DeploymentNamespace.ValueType  # 3
+class DeploymentNamespace(_DeploymentNamespace, metaclass=_DeploymentNamespaceEnumTypeWrapper):
+    pass
+
+DEPLOYMENT_NAMESPACE_UNSPECIFIED: DeploymentNamespace.ValueType  # 0
+DEPLOYMENT_NAMESPACE_WORKSPACE: DeploymentNamespace.ValueType  # 1
+DEPLOYMENT_NAMESPACE_GLOBAL: DeploymentNamespace.ValueType  # 3
+global___DeploymentNamespace = DeploymentNamespace
+
+
+class _FileDescriptor:
+    ValueType = typing.NewType('ValueType', builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+class _FileDescriptorEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_FileDescriptor.ValueType], builtins.type):
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    FILE_DESCRIPTOR_UNSPECIFIED: _FileDescriptor.ValueType  # 0
+    FILE_DESCRIPTOR_STDOUT: _FileDescriptor.ValueType  # 1
+    FILE_DESCRIPTOR_STDERR: _FileDescriptor.ValueType  # 2
+    FILE_DESCRIPTOR_INFO: _FileDescriptor.ValueType  # 3
+class FileDescriptor(_FileDescriptor, metaclass=_FileDescriptorEnumTypeWrapper):
+    pass
+
+FILE_DESCRIPTOR_UNSPECIFIED: FileDescriptor.ValueType  # 0
+FILE_DESCRIPTOR_STDOUT: FileDescriptor.ValueType  # 1
+FILE_DESCRIPTOR_STDERR: FileDescriptor.ValueType  # 2
+FILE_DESCRIPTOR_INFO: FileDescriptor.ValueType  # 3
+global___FileDescriptor = FileDescriptor
+
+
+class _RateLimitInterval:
+    ValueType = typing.NewType('ValueType', builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+class _RateLimitIntervalEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_RateLimitInterval.ValueType], builtins.type):
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    RATE_LIMIT_INTERVAL_UNSPECIFIED: _RateLimitInterval.ValueType  # 0
+    RATE_LIMIT_INTERVAL_SECOND: _RateLimitInterval.ValueType  # 1
+    RATE_LIMIT_INTERVAL_MINUTE: _RateLimitInterval.ValueType  # 2
+class RateLimitInterval(_RateLimitInterval, metaclass=_RateLimitIntervalEnumTypeWrapper):
+    pass
+
+RATE_LIMIT_INTERVAL_UNSPECIFIED: RateLimitInterval.ValueType  # 0
+RATE_LIMIT_INTERVAL_SECOND: RateLimitInterval.ValueType  # 1
+RATE_LIMIT_INTERVAL_MINUTE: RateLimitInterval.ValueType  # 2
+global___RateLimitInterval = RateLimitInterval
+
+
+class _TaskState:
+    ValueType = typing.NewType('ValueType', builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+class _TaskStateEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_TaskState.ValueType], builtins.type):
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    TASK_STATE_UNSPECIFIED: _TaskState.ValueType  # 0
+    TASK_STATE_CREATED: _TaskState.ValueType  # 6
+    TASK_STATE_QUEUED: _TaskState.ValueType  # 1
+    TASK_STATE_WORKER_ASSIGNED: _TaskState.ValueType  # 2
+    TASK_STATE_LOADING_IMAGE: _TaskState.ValueType  # 3
+    TASK_STATE_ACTIVE: _TaskState.ValueType  # 4
+    TASK_STATE_COMPLETED: _TaskState.ValueType  # 5
+    TASK_STATE_CREATING_CONTAINER: _TaskState.ValueType  # 7
+    TASK_STATE_IDLE: _TaskState.ValueType  # 8
+class TaskState(_TaskState, metaclass=_TaskStateEnumTypeWrapper):
+    pass
+
+TASK_STATE_UNSPECIFIED: TaskState.ValueType  # 0
+TASK_STATE_CREATED: TaskState.ValueType  # 6
+TASK_STATE_QUEUED: TaskState.ValueType  # 1
+TASK_STATE_WORKER_ASSIGNED: TaskState.ValueType  # 2
+TASK_STATE_LOADING_IMAGE: TaskState.ValueType  # 3
+TASK_STATE_ACTIVE: TaskState.ValueType  # 4
+TASK_STATE_COMPLETED: TaskState.ValueType  # 5
+TASK_STATE_CREATING_CONTAINER: TaskState.ValueType  # 7
+TASK_STATE_IDLE: TaskState.ValueType  # 8
+global___TaskState = TaskState
+
+
+class _WebhookType:
+    ValueType = typing.NewType('ValueType', builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+class _WebhookTypeEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_WebhookType.ValueType], builtins.type):
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    WEBHOOK_TYPE_UNSPECIFIED: _WebhookType.ValueType  # 0
+    WEBHOOK_TYPE_ASGI_APP: _WebhookType.ValueType  # 1
+    WEBHOOK_TYPE_FUNCTION: _WebhookType.ValueType  # 2
+    WEBHOOK_TYPE_WSGI_APP: _WebhookType.ValueType  # 3
+class WebhookType(_WebhookType, metaclass=_WebhookTypeEnumTypeWrapper):
+    pass
+
+WEBHOOK_TYPE_UNSPECIFIED: WebhookType.ValueType  # 0
+WEBHOOK_TYPE_ASGI_APP: WebhookType.ValueType  # 1
+WEBHOOK_TYPE_FUNCTION: WebhookType.ValueType  # 2
+WEBHOOK_TYPE_WSGI_APP: WebhookType.ValueType  # 3
+global___WebhookType = WebhookType
+
+
+class _WebhookAsyncMode:
+    ValueType = typing.NewType('ValueType', builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+class _WebhookAsyncModeEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_WebhookAsyncMode.ValueType], builtins.type):
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    WEBHOOK_ASYNC_MODE_UNSPECIFIED: _WebhookAsyncMode.ValueType  # 0
+    WEBHOOK_ASYNC_MODE_DISABLED: _WebhookAsyncMode.ValueType  # 2
+    """no redirect, fail after timeout"""
+
+    WEBHOOK_ASYNC_MODE_TRIGGER: _WebhookAsyncMode.ValueType  # 3
+    """return immediately, roughly same as old wait_for_response=False"""
+
+    WEBHOOK_ASYNC_MODE_AUTO: _WebhookAsyncMode.ValueType  # 4
+    """redirect to polling endpoint if execution time nears the http timeout"""
+
+class WebhookAsyncMode(_WebhookAsyncMode, metaclass=_WebhookAsyncModeEnumTypeWrapper):
+    pass
+
+WEBHOOK_ASYNC_MODE_UNSPECIFIED: WebhookAsyncMode.ValueType  # 0
+WEBHOOK_ASYNC_MODE_DISABLED: WebhookAsyncMode.ValueType  # 2
+"""no redirect, fail after timeout"""
+
+WEBHOOK_ASYNC_MODE_TRIGGER: WebhookAsyncMode.ValueType  # 3
+"""return immediately, roughly same as old wait_for_response=False"""
+
+WEBHOOK_ASYNC_MODE_AUTO: WebhookAsyncMode.ValueType  # 4
+"""redirect to polling endpoint if execution time nears the http timeout"""
+
+global___WebhookAsyncMode = WebhookAsyncMode
+
+
+class _RegistryType:
+    ValueType = typing.NewType('ValueType', builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+class _RegistryTypeEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_RegistryType.ValueType], builtins.type):
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    DOCKERHUB: _RegistryType.ValueType  # 0
+    ECR: _RegistryType.ValueType  # 1
+class RegistryType(_RegistryType, metaclass=_RegistryTypeEnumTypeWrapper):
+    pass
+
+DOCKERHUB: RegistryType.ValueType  # 0
+ECR: RegistryType.ValueType  # 1
+global___RegistryType = RegistryType
+
+
+class _GPUType:
+    ValueType = typing.NewType('ValueType', builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+class _GPUTypeEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_GPUType.ValueType], builtins.type):
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    GPU_TYPE_UNSPECIFIED: _GPUType.ValueType  # 0
+    GPU_TYPE_T4: _GPUType.ValueType  # 1
+    GPU_TYPE_A100: _GPUType.ValueType  # 2
+    GPU_TYPE_A10G: _GPUType.ValueType  # 3
+    GPU_TYPE_ANY: _GPUType.ValueType  # 4
+    GPU_TYPE_A100_20G: _GPUType.ValueType  # 5
+class GPUType(_GPUType, metaclass=_GPUTypeEnumTypeWrapper):
+    pass
+
+GPU_TYPE_UNSPECIFIED: GPUType.ValueType  # 0
+GPU_TYPE_T4: GPUType.ValueType  # 1
+GPU_TYPE_A100: GPUType.ValueType  # 2
+GPU_TYPE_A10G: GPUType.ValueType  # 3
+GPU_TYPE_ANY: GPUType.ValueType  # 4
+GPU_TYPE_A100_20G: GPUType.ValueType  # 5
+global___GPUType = GPUType
+
+
+class _CloudProvider:
+    ValueType = typing.NewType('ValueType', builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+class _CloudProviderEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_CloudProvider.ValueType], builtins.type):
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    CLOUD_PROVIDER_UNSPECIFIED: _CloudProvider.ValueType  # 0
+    CLOUD_PROVIDER_AWS: _CloudProvider.ValueType  # 1
+    CLOUD_PROVIDER_GCP: _CloudProvider.ValueType  # 2
+    CLOUD_PROVIDER_AUTO: _CloudProvider.ValueType  # 3
+class CloudProvider(_CloudProvider, metaclass=_CloudProviderEnumTypeWrapper):
+    pass
+
+CLOUD_PROVIDER_UNSPECIFIED: CloudProvider.ValueType  # 0
+CLOUD_PROVIDER_AWS: CloudProvider.ValueType  # 1
+CLOUD_PROVIDER_GCP: CloudProvider.ValueType  # 2
+CLOUD_PROVIDER_AUTO: CloudProvider.ValueType  # 3
+global___CloudProvider = CloudProvider
+
+
+class _ProgressType:
+    ValueType = typing.NewType('ValueType', builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+class _ProgressTypeEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_ProgressType.ValueType], builtins.type):
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    IMAGE_SNAPSHOT_UPLOAD: _ProgressType.ValueType  # 0
+    FUNCTION_QUEUED: _ProgressType.ValueType  # 1
+class ProgressType(_ProgressType, metaclass=_ProgressTypeEnumTypeWrapper):
+    pass
+
+IMAGE_SNAPSHOT_UPLOAD: ProgressType.ValueType  # 0
+FUNCTION_QUEUED: ProgressType.ValueType  # 1
+global___ProgressType = ProgressType
+
+
+class AppClientDisconnectRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    APP_ID_FIELD_NUMBER: builtins.int
+    app_id: typing.Text
+    def __init__(self,
+        *,
+        app_id: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id",b"app_id"]) -> None: ...
+global___AppClientDisconnectRequest = AppClientDisconnectRequest
+
+class AppCreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    CLIENT_ID_FIELD_NUMBER: builtins.int
+    DESCRIPTION_FIELD_NUMBER: builtins.int
+    DETACH_FIELD_NUMBER: builtins.int
+    INITIALIZING_FIELD_NUMBER: builtins.int
+    client_id: typing.Text
+    description: typing.Text
+    """Human readable label for the website"""
+
+    detach: builtins.bool
+    """TODO: deprecate in 0.43, remove when 0.42 is unsupported"""
+
+    initializing: builtins.bool
+    """TODO: remove and make default=True when client 0.42 is unsupported"""
+
+    def __init__(self,
+        *,
+        client_id: typing.Text = ...,
+        description: typing.Text = ...,
+        detach: builtins.bool = ...,
+        initializing: builtins.bool = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["client_id",b"client_id","description",b"description","detach",b"detach","initializing",b"initializing"]) -> None: ...
+global___AppCreateRequest = AppCreateRequest
+
+class AppCreateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    APP_ID_FIELD_NUMBER: builtins.int
+    APP_LOGS_URL_FIELD_NUMBER: builtins.int
+    app_id: typing.Text
+    app_logs_url: typing.Text
+    def __init__(self,
+        *,
+        app_id: typing.Text = ...,
+        app_logs_url: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id",b"app_id","app_logs_url",b"app_logs_url"]) -> None: ...
+global___AppCreateResponse = AppCreateResponse
+
+class AppStopRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    APP_ID_FIELD_NUMBER: builtins.int
+    app_id: typing.Text
+    def __init__(self,
+        *,
+        app_id: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id",b"app_id"]) -> None: ...
+global___AppStopRequest = AppStopRequest
+
+class AppDeployRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    APP_ID_FIELD_NUMBER: builtins.int
+    NAMESPACE_FIELD_NUMBER: builtins.int
+    NAME_FIELD_NUMBER: builtins.int
+    OBJECT_ENTITY_FIELD_NUMBER: builtins.int
+    app_id: typing.Text
+    namespace: global___DeploymentNamespace.ValueType
+    name: typing.Text
+    object_entity: typing.Text
+    def __init__(self,
+        *,
+        app_id: typing.Text = ...,
+        namespace: global___DeploymentNamespace.ValueType = ...,
+        name: typing.Text = ...,
+        object_entity: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id",b"app_id","name",b"name","namespace",b"namespace","object_entity",b"object_entity"]) -> None: ...
+global___AppDeployRequest = AppDeployRequest
+
+class AppDeployResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    URL_FIELD_NUMBER: builtins.int
+    url: typing.Text
+    def __init__(self,
+        *,
+        url: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["url",b"url"]) -> None: ...
+global___AppDeployResponse = AppDeployResponse
+
+class AppGetByDeploymentNameRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    NAMESPACE_FIELD_NUMBER: builtins.int
+    NAME_FIELD_NUMBER: builtins.int
+    CLIENT_ID_FIELD_NUMBER: builtins.int
+    namespace: global___DeploymentNamespace.ValueType
+    name: typing.Text
+    client_id: typing.Text
+    def __init__(self,
+        *,
+        namespace: global___DeploymentNamespace.ValueType = ...,
+        name: typing.Text = ...,
+        client_id: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["client_id",b"client_id","name",b"name","namespace",b"namespace"]) -> None: ...
+global___AppGetByDeploymentNameRequest = AppGetByDeploymentNameRequest
+
+class AppGetByDeploymentNameResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    APP_ID_FIELD_NUMBER: builtins.int
+    LAST_LOG_ENTRY_ID_FIELD_NUMBER: builtins.int
+    app_id: typing.Text
+    last_log_entry_id: typing.Text
+    """Last log entry as a starting point for the client."""
+
+    def __init__(self,
+        *,
+        app_id: typing.Text = ...,
+        last_log_entry_id: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id",b"app_id","last_log_entry_id",b"last_log_entry_id"]) -> None: ...
+global___AppGetByDeploymentNameResponse = AppGetByDeploymentNameResponse
+
+class AppGetLogsRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    APP_ID_FIELD_NUMBER: builtins.int
+    TIMEOUT_FIELD_NUMBER: builtins.int
+    LAST_ENTRY_ID_FIELD_NUMBER: builtins.int
+    FUNCTION_ID_FIELD_NUMBER: builtins.int
+    INPUT_ID_FIELD_NUMBER: builtins.int
+    TASK_ID_FIELD_NUMBER: builtins.int
+    app_id: typing.Text
+    timeout: builtins.float
+    last_entry_id: typing.Text
+    function_id: typing.Text
+    input_id: typing.Text
+    task_id: typing.Text
+    def __init__(self,
+        *,
+        app_id: typing.Text = ...,
+        timeout: builtins.float = ...,
+        last_entry_id: typing.Text = ...,
+        function_id: typing.Text = ...,
+        input_id: typing.Text = ...,
+        task_id: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id",b"app_id","function_id",b"function_id","input_id",b"input_id","last_entry_id",b"last_entry_id","task_id",b"task_id","timeout",b"timeout"]) -> None: ...
+global___AppGetLogsRequest = AppGetLogsRequest
+
+class AppGetObjectsRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    APP_ID_FIELD_NUMBER: builtins.int
+    app_id: typing.Text
+    def __init__(self,
+        *,
+        app_id: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id",b"app_id"]) -> None: ...
+global___AppGetObjectsRequest = AppGetObjectsRequest
+
+class AppGetObjectsItem(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    TAG_FIELD_NUMBER: builtins.int
+    OBJECT_ID_FIELD_NUMBER: builtins.int
+    FUNCTION_FIELD_NUMBER: builtins.int
+    tag: typing.Text
+    object_id: typing.Text
+    @property
+    def function(self) -> global___Function: ...
+    def __init__(self,
+        *,
+        tag: typing.Text = ...,
+        object_id: typing.Text = ...,
+        function: typing.Optional[global___Function] = ...,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["function",b"function","object_oneof",b"object_oneof"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function",b"function","object_id",b"object_id","object_oneof",b"object_oneof","tag",b"tag"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["object_oneof",b"object_oneof"]) -> typing.Optional[typing_extensions.Literal["function"]]: ...
+global___AppGetObjectsItem = AppGetObjectsItem
+
+class AppGetObjectsResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    class ObjectIdsEntry(google.protobuf.message.Message):
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+        KEY_FIELD_NUMBER: builtins.int
+        VALUE_FIELD_NUMBER: builtins.int
+        key: typing.Text
+        value: typing.Text
+        def __init__(self,
+            *,
+            key: typing.Text = ...,
+            value: typing.Text = ...,
+            ) -> None: ...
+        def ClearField(self, field_name: typing_extensions.Literal["key",b"key","value",b"value"]) -> None: ...
+
+    OBJECT_IDS_FIELD_NUMBER: builtins.int
+    ITEMS_FIELD_NUMBER: builtins.int
+    @property
+    def object_ids(self) -> google.protobuf.internal.containers.ScalarMap[typing.Text, typing.Text]:
+        """remove once support for 0.43.0 is dropped"""
+        pass
+    @property
+    def items(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___AppGetObjectsItem]: ...
+    def __init__(self,
+        *,
+        object_ids: typing.Optional[typing.Mapping[typing.Text, typing.Text]] = ...,
+        items: typing.Optional[typing.Iterable[global___AppGetObjectsItem]] = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["items",b"items","object_ids",b"object_ids"]) -> None: ...
+global___AppGetObjectsResponse = AppGetObjectsResponse
+
+class AppStats(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    APP_ID_FIELD_NUMBER: builtins.int
+    DESCRIPTION_FIELD_NUMBER: builtins.int
+    STATE_FIELD_NUMBER: builtins.int
+    CREATED_AT_FIELD_NUMBER: builtins.int
+    STOPPED_AT_FIELD_NUMBER: builtins.int
+    N_RUNNING_TASKS_FIELD_NUMBER: builtins.int
+    OBJECT_ENTITY_FIELD_NUMBER: builtins.int
+    NAME_FIELD_NUMBER: builtins.int
+    app_id: typing.Text
+    description: typing.Text
+    state: global___AppState.ValueType
+    created_at: builtins.float
+    stopped_at: builtins.float
+    n_running_tasks: builtins.int
+    object_entity: typing.Text
+    name: typing.Text
+    def __init__(self,
+        *,
+        app_id: typing.Text = ...,
+        description: typing.Text = ...,
+        state: global___AppState.ValueType = ...,
+        created_at: builtins.float = ...,
+        stopped_at: builtins.float = ...,
+        n_running_tasks: builtins.int = ...,
+        object_entity: typing.Text = ...,
+        name: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id",b"app_id","created_at",b"created_at","description",b"description","n_running_tasks",b"n_running_tasks","name",b"name","object_entity",b"object_entity","state",b"state","stopped_at",b"stopped_at"]) -> None: ...
+global___AppStats = AppStats
+
+class AppListResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    APPS_FIELD_NUMBER: builtins.int
+    @property
+    def apps(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___AppStats]: ...
+    def __init__(self,
+        *,
+        apps: typing.Optional[typing.Iterable[global___AppStats]] = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["apps",b"apps"]) -> None: ...
+global___AppListResponse = AppListResponse
+
+class AppLookupObjectRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    NAMESPACE_FIELD_NUMBER: builtins.int
+    APP_NAME_FIELD_NUMBER: builtins.int
+    OBJECT_TAG_FIELD_NUMBER: builtins.int
+    OBJECT_ID_FIELD_NUMBER: builtins.int
+    OBJECT_ENTITY_FIELD_NUMBER: builtins.int
+    namespace: global___DeploymentNamespace.ValueType
+    app_name: typing.Text
+    object_tag: typing.Text
+    object_id: typing.Text
+    object_entity: typing.Text
+    def __init__(self,
+        *,
+        namespace: global___DeploymentNamespace.ValueType = ...,
+        app_name: typing.Text = ...,
+        object_tag: typing.Text = ...,
+        object_id: typing.Text = ...,
+        object_entity: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_name",b"app_name","namespace",b"namespace","object_entity",b"object_entity","object_id",b"object_id","object_tag",b"object_tag"]) -> None: ...
+global___AppLookupObjectRequest = AppLookupObjectRequest
+
+class AppLookupObjectResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    OBJECT_ID_FIELD_NUMBER: builtins.int
+    ERROR_MESSAGE_FIELD_NUMBER: builtins.int
+    FUNCTION_FIELD_NUMBER: builtins.int
+    object_id: typing.Text
+    error_message: typing.Text
+    @property
+    def function(self) -> global___Function: ...
+    def __init__(self,
+        *,
+        object_id: typing.Text = ...,
+        error_message: typing.Text = ...,
+        function: typing.Optional[global___Function] = ...,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["function",b"function","object_oneof",b"object_oneof"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["error_message",b"error_message","function",b"function","object_id",b"object_id","object_oneof",b"object_oneof"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["object_oneof",b"object_oneof"]) -> typing.Optional[typing_extensions.Literal["function"]]: ...
+global___AppLookupObjectResponse = AppLookupObjectResponse
+
+class AppSetObjectsRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    class IndexedObjectIdsEntry(google.protobuf.message.Message):
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+        KEY_FIELD_NUMBER: builtins.int
+        VALUE_FIELD_NUMBER: builtins.int
+        key: typing.Text
+        value: typing.Text
+        def __init__(self,
+            *,
+            key: typing.Text = ...,
+            value: typing.Text = ...,
+            ) -> None: ...
+        def ClearField(self, field_name: typing_extensions.Literal["key",b"key","value",b"value"]) -> None: ...
+
+    APP_ID_FIELD_NUMBER: builtins.int
+    INDEXED_OBJECT_IDS_FIELD_NUMBER: builtins.int
+    CLIENT_ID_FIELD_NUMBER: builtins.int
+    UNINDEXED_OBJECT_IDS_FIELD_NUMBER: builtins.int
+    NEW_APP_STATE_FIELD_NUMBER: builtins.int
+    app_id: typing.Text
+    """TODO: this is a bit of a hacky request meant to be somewhat temporary
+    At some point, every object should be assigned to a app/namespace when created,
+    so this method won't be necessary.
+    """
+
+    @property
+    def indexed_object_ids(self) -> google.protobuf.internal.containers.ScalarMap[typing.Text, typing.Text]: ...
+    client_id: typing.Text
+    @property
+    def unindexed_object_ids(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[typing.Text]: ...
+    new_app_state: global___AppState.ValueType
+    """promotes an app from initializing to this new state"""
+
+    def __init__(self,
+        *,
+        app_id: typing.Text = ...,
+        indexed_object_ids: typing.Optional[typing.Mapping[typing.Text, typing.Text]] = ...,
+        client_id: typing.Text = ...,
+        unindexed_object_ids: typing.Optional[typing.Iterable[typing.Text]] = ...,
+        new_app_state: global___AppState.ValueType = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id",b"app_id","client_id",b"client_id","indexed_object_ids",b"indexed_object_ids","new_app_state",b"new_app_state","unindexed_object_ids",b"unindexed_object_ids"]) -> None: ...
+global___AppSetObjectsRequest = AppSetObjectsRequest
+
+class AppHeartbeatRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    APP_ID_FIELD_NUMBER: builtins.int
+    app_id: typing.Text
+    def __init__(self,
+        *,
+        app_id: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id",b"app_id"]) -> None: ...
+global___AppHeartbeatRequest = AppHeartbeatRequest
+
+class ImageRegistryConfig(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    REGISTRY_TYPE_FIELD_NUMBER: builtins.int
+    SECRET_ID_FIELD_NUMBER: builtins.int
+    registry_type: global___RegistryType.ValueType
+    secret_id: typing.Text
+    def __init__(self,
+        *,
+        registry_type: global___RegistryType.ValueType = ...,
+        secret_id: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["registry_type",b"registry_type","secret_id",b"secret_id"]) -> None: ...
+global___ImageRegistryConfig = ImageRegistryConfig
+
+class BaseImage(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    IMAGE_ID_FIELD_NUMBER: builtins.int
+    DOCKER_TAG_FIELD_NUMBER: builtins.int
+    image_id: typing.Text
+    docker_tag: typing.Text
+    """fields 3 and 4 are deprecated"""
+
+    def __init__(self,
+        *,
+        image_id: typing.Text = ...,
+        docker_tag: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["docker_tag",b"docker_tag","image_id",b"image_id"]) -> None: ...
+global___BaseImage = BaseImage
+
+class BlobCreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    CONTENT_MD5_FIELD_NUMBER: builtins.int
+    CONTENT_SHA256_BASE64_FIELD_NUMBER: builtins.int
+    CONTENT_LENGTH_FIELD_NUMBER: builtins.int
+    content_md5: typing.Text
+    """TODO(erikbern): how are these garbage collected?
+    Shouldn't they belong to an app?
+    """
+
+    content_sha256_base64: typing.Text
+    content_length: builtins.int
+    def __init__(self,
+        *,
+        content_md5: typing.Text = ...,
+        content_sha256_base64: typing.Text = ...,
+        content_length: builtins.int = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["content_length",b"content_length","content_md5",b"content_md5","content_sha256_base64",b"content_sha256_base64"]) -> None: ...
+global___BlobCreateRequest = BlobCreateRequest
+
+class MultiPartUpload(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    PART_LENGTH_FIELD_NUMBER: builtins.int
+    UPLOAD_URLS_FIELD_NUMBER: builtins.int
+    COMPLETION_URL_FIELD_NUMBER: builtins.int
+    part_length: builtins.int
+    """split upload based on this part length - all except the last part must have this length"""
+
+    @property
+    def upload_urls(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[typing.Text]: ...
+    completion_url: typing.Text
+    def __init__(self,
+        *,
+        part_length: builtins.int = ...,
+        upload_urls: typing.Optional[typing.Iterable[typing.Text]] = ...,
+        completion_url: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["completion_url",b"completion_url","part_length",b"part_length","upload_urls",b"upload_urls"]) -> None: ...
+global___MultiPartUpload = MultiPartUpload
+
+class BlobCreateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    BLOB_ID_FIELD_NUMBER: builtins.int
+    UPLOAD_URL_FIELD_NUMBER: builtins.int
+    MULTIPART_FIELD_NUMBER: builtins.int
+    blob_id: typing.Text
+    upload_url: typing.Text
+    @property
+    def multipart(self) -> global___MultiPartUpload: ...
+    def __init__(self,
+        *,
+        blob_id: typing.Text = ...,
+        upload_url: typing.Text = ...,
+        multipart: typing.Optional[global___MultiPartUpload] = ...,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["multipart",b"multipart","upload_type_oneof",b"upload_type_oneof","upload_url",b"upload_url"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["blob_id",b"blob_id","multipart",b"multipart","upload_type_oneof",b"upload_type_oneof","upload_url",b"upload_url"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["upload_type_oneof",b"upload_type_oneof"]) -> typing.Optional[typing_extensions.Literal["upload_url","multipart"]]: ...
+global___BlobCreateResponse = BlobCreateResponse
+
+class BlobGetRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    BLOB_ID_FIELD_NUMBER: builtins.int
+    blob_id: typing.Text
+    def __init__(self,
+        *,
+        blob_id: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["blob_id",b"blob_id"]) -> None: ...
+global___BlobGetRequest = BlobGetRequest
+
+class BlobGetResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    DOWNLOAD_URL_FIELD_NUMBER: builtins.int
+    download_url: typing.Text
+    def __init__(self,
+        *,
+        download_url: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["download_url",b"download_url"]) -> None: ...
+global___BlobGetResponse = BlobGetResponse
+
+class ClientCreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    CLIENT_TYPE_FIELD_NUMBER: builtins.int
+    VERSION_FIELD_NUMBER: builtins.int
+    client_type: global___ClientType.ValueType
+    version: typing.Text
+    def __init__(self,
+        *,
+        client_type: global___ClientType.ValueType = ...,
+        version: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["client_type",b"client_type","version",b"version"]) -> None: ...
+global___ClientCreateRequest = ClientCreateRequest
+
+class ClientCreateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    CLIENT_ID_FIELD_NUMBER: builtins.int
+    ERROR_FIELD_NUMBER: builtins.int
+    DEPRECATION_WARNING_FIELD_NUMBER: builtins.int
+    client_id: typing.Text
+    error: typing.Text
+    deprecation_warning: typing.Text
+    def __init__(self,
+        *,
+        client_id: typing.Text = ...,
+        error: typing.Text = ...,
+        deprecation_warning: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["client_id",b"client_id","deprecation_warning",b"deprecation_warning","error",b"error"]) -> None: ...
+global___ClientCreateResponse = ClientCreateResponse
+
+class ClientHelloResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    WARNING_FIELD_NUMBER: builtins.int
+    warning: typing.Text
+    def __init__(self,
+        *,
+        warning: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["warning",b"warning"]) -> None: ...
+global___ClientHelloResponse = ClientHelloResponse
+
+class ClientHeartbeatRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    CLIENT_ID_FIELD_NUMBER: builtins.int
+    CURRENT_INPUT_ID_FIELD_NUMBER: builtins.int
+    CURRENT_INPUT_STARTED_AT_FIELD_NUMBER: builtins.int
+    client_id: typing.Text
+    current_input_id: typing.Text
+    current_input_started_at: builtins.float
+    def __init__(self,
+        *,
+        client_id: typing.Text = ...,
+        current_input_id: typing.Text = ...,
+        current_input_started_at: builtins.float = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["client_id",b"client_id","current_input_id",b"current_input_id","current_input_started_at",b"current_input_started_at"]) -> None: ...
+global___ClientHeartbeatRequest = ClientHeartbeatRequest
+
+class ContainerArguments(google.protobuf.message.Message):
+    """This is used to pass data from the worker to the container"""
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    class TracingContextEntry(google.protobuf.message.Message):
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+        KEY_FIELD_NUMBER: builtins.int
+        VALUE_FIELD_NUMBER: builtins.int
+        key: typing.Text
+        value: typing.Text
+        def __init__(self,
+            *,
+            key: typing.Text = ...,
+            value: typing.Text = ...,
+            ) -> None: ...
+        def ClearField(self, field_name: typing_extensions.Literal["key",b"key","value",b"value"]) -> None: ...
+
+    TASK_ID_FIELD_NUMBER: builtins.int
+    FUNCTION_ID_FIELD_NUMBER: builtins.int
+    APP_ID_FIELD_NUMBER: builtins.int
+    FUNCTION_DEF_FIELD_NUMBER: builtins.int
+    PROXY_INFO_FIELD_NUMBER: builtins.int
+    TRACING_CONTEXT_FIELD_NUMBER: builtins.int
+    task_id: typing.Text
+    function_id: typing.Text
+    app_id: typing.Text
+    @property
+    def function_def(self) -> global___Function: ...
+    @property
+    def proxy_info(self) -> global___ProxyInfo: ...
+    @property
+    def tracing_context(self) -> google.protobuf.internal.containers.ScalarMap[typing.Text, typing.Text]: ...
+    def __init__(self,
+        *,
+        task_id: typing.Text = ...,
+        function_id: typing.Text = ...,
+        app_id: typing.Text = ...,
+        function_def: typing.Optional[global___Function] = ...,
+        proxy_info: typing.Optional[global___ProxyInfo] = ...,
+        tracing_context: typing.Optional[typing.Mapping[typing.Text, typing.Text]] = ...,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["function_def",b"function_def","proxy_info",b"proxy_info"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id",b"app_id","function_def",b"function_def","function_id",b"function_id","proxy_info",b"proxy_info","task_id",b"task_id","tracing_context",b"tracing_context"]) -> None: ...
+global___ContainerArguments = ContainerArguments
+
+class ContainerHeartbeatRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    CURRENT_INPUT_ID_FIELD_NUMBER: builtins.int
+    CURRENT_INPUT_STARTED_AT_FIELD_NUMBER: builtins.int
+    current_input_id: typing.Text
+    current_input_started_at: builtins.float
+    def __init__(self,
+        *,
+        current_input_id: typing.Text = ...,
+        current_input_started_at: builtins.float = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["current_input_id",b"current_input_id","current_input_started_at",b"current_input_started_at"]) -> None: ...
+global___ContainerHeartbeatRequest = ContainerHeartbeatRequest
+
+class DictContainsRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    DICT_ID_FIELD_NUMBER: builtins.int
+    KEY_FIELD_NUMBER: builtins.int
+    dict_id: typing.Text
+    key: builtins.bytes
+    def __init__(self,
+        *,
+        dict_id: typing.Text = ...,
+        key: builtins.bytes = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["dict_id",b"dict_id","key",b"key"]) -> None: ...
+global___DictContainsRequest = DictContainsRequest
+
+class DictContainsResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    FOUND_FIELD_NUMBER: builtins.int
+    found: builtins.bool
+    def __init__(self,
+        *,
+        found: builtins.bool = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["found",b"found"]) -> None: ...
+global___DictContainsResponse = DictContainsResponse
+
+class DictCreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    DATA_FIELD_NUMBER: builtins.int
+    APP_ID_FIELD_NUMBER: builtins.int
+    EXISTING_DICT_ID_FIELD_NUMBER: builtins.int
+    @property
+    def data(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___DictEntry]: ...
+    app_id: typing.Text
+    existing_dict_id: typing.Text
+    def __init__(self,
+        *,
+        data: typing.Optional[typing.Iterable[global___DictEntry]] = ...,
+        app_id: typing.Text = ...,
+        existing_dict_id: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id",b"app_id","data",b"data","existing_dict_id",b"existing_dict_id"]) -> None: ...
+global___DictCreateRequest = DictCreateRequest
+
+class DictCreateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    DICT_ID_FIELD_NUMBER: builtins.int
+    dict_id: typing.Text
+    def __init__(self,
+        *,
+        dict_id: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["dict_id",b"dict_id"]) -> None: ...
+global___DictCreateResponse = DictCreateResponse
+
+class DictEntry(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    KEY_FIELD_NUMBER: builtins.int
+    VALUE_FIELD_NUMBER: builtins.int
+    key: builtins.bytes
+    value: builtins.bytes
+    def __init__(self,
+        *,
+        key: builtins.bytes = ...,
+        value: builtins.bytes = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["key",b"key","value",b"value"]) -> None: ...
+global___DictEntry = DictEntry
+
+class DictGetRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    DICT_ID_FIELD_NUMBER: builtins.int
+    KEY_FIELD_NUMBER: builtins.int
+    dict_id: typing.Text
+    key: builtins.bytes
+    def __init__(self,
+        *,
+        dict_id: typing.Text = ...,
+        key: builtins.bytes = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["dict_id",b"dict_id","key",b"key"]) -> None: ...
+global___DictGetRequest = DictGetRequest
+
+class DictGetResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    FOUND_FIELD_NUMBER: builtins.int
+    VALUE_FIELD_NUMBER: builtins.int
+    found: builtins.bool
+    value: builtins.bytes
+    def __init__(self,
+        *,
+        found: builtins.bool = ...,
+        value: typing.Optional[builtins.bytes] = ...,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["_value",b"_value","value",b"value"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["_value",b"_value","found",b"found","value",b"value"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["_value",b"_value"]) -> typing.Optional[typing_extensions.Literal["value"]]: ...
+global___DictGetResponse = DictGetResponse
+
+class DictLenRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    DICT_ID_FIELD_NUMBER: builtins.int
+    dict_id: typing.Text
+    def __init__(self,
+        *,
+        dict_id: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["dict_id",b"dict_id"]) -> None: ...
+global___DictLenRequest = DictLenRequest
+
+class DictLenResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    LEN_FIELD_NUMBER: builtins.int
+    len: builtins.int
+    def __init__(self,
+        *,
+        len: builtins.int = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["len",b"len"]) -> None: ...
+global___DictLenResponse = DictLenResponse
+
+class DictPopRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    DICT_ID_FIELD_NUMBER: builtins.int
+    KEY_FIELD_NUMBER: builtins.int
+    dict_id: typing.Text
+    key: builtins.bytes
+    def __init__(self,
+        *,
+        dict_id: typing.Text = ...,
+        key: builtins.bytes = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["dict_id",b"dict_id","key",b"key"]) -> None: ...
+global___DictPopRequest = DictPopRequest
+
+class DictPopResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    FOUND_FIELD_NUMBER: builtins.int
+    VALUE_FIELD_NUMBER: builtins.int
+    found: builtins.bool
+    value: builtins.bytes
+    def __init__(self,
+        *,
+        found: builtins.bool = ...,
+        value: typing.Optional[builtins.bytes] = ...,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["_value",b"_value","value",b"value"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["_value",b"_value","found",b"found","value",b"value"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["_value",b"_value"]) -> typing.Optional[typing_extensions.Literal["value"]]: ...
+global___DictPopResponse = DictPopResponse
+
+class DictUpdateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    DICT_ID_FIELD_NUMBER: builtins.int
+    UPDATES_FIELD_NUMBER: builtins.int
+    dict_id: typing.Text
+    @property
+    def updates(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___DictEntry]: ...
+    def __init__(self,
+        *,
+        dict_id: typing.Text = ...,
+        updates: typing.Optional[typing.Iterable[global___DictEntry]] = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["dict_id",b"dict_id","updates",b"updates"]) -> None: ...
+global___DictUpdateRequest = DictUpdateRequest
+
+class DictUpdateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    def __init__(self,
+        ) -> None: ...
+global___DictUpdateResponse = DictUpdateResponse
+
+class PTYInfo(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    ENABLED_FIELD_NUMBER: builtins.int
+    WINSZ_ROWS_FIELD_NUMBER: builtins.int
+    WINSZ_COLS_FIELD_NUMBER: builtins.int
+    ENV_TERM_FIELD_NUMBER: builtins.int
+    ENV_COLORTERM_FIELD_NUMBER: builtins.int
+    ENV_TERM_PROGRAM_FIELD_NUMBER: builtins.int
+    enabled: builtins.bool
+    winsz_rows: builtins.int
+    winsz_cols: builtins.int
+    env_term: typing.Text
+    env_colorterm: typing.Text
+    env_term_program: typing.Text
+    def __init__(self,
+        *,
+        enabled: builtins.bool = ...,
+        winsz_rows: builtins.int = ...,
+        winsz_cols: builtins.int = ...,
+        env_term: typing.Text = ...,
+        env_colorterm: typing.Text = ...,
+        env_term_program: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["enabled",b"enabled","env_colorterm",b"env_colorterm","env_term",b"env_term","env_term_program",b"env_term_program","winsz_cols",b"winsz_cols","winsz_rows",b"winsz_rows"]) -> None: ...
+global___PTYInfo = PTYInfo
+
+class Function(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    class _DefinitionType:
+        ValueType = typing.NewType('ValueType', builtins.int)
+        V: typing_extensions.TypeAlias = ValueType
+    class _DefinitionTypeEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[Function._DefinitionType.ValueType], builtins.type):
+        DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+        DEFINITION_TYPE_UNSPECIFIED: Function._DefinitionType.ValueType  # 0
+        DEFINITION_TYPE_SERIALIZED: Function._DefinitionType.ValueType  # 1
+        DEFINITION_TYPE_FILE: Function._DefinitionType.ValueType  # 2
+    class DefinitionType(_DefinitionType, metaclass=_DefinitionTypeEnumTypeWrapper):
+        pass
+
+    DEFINITION_TYPE_UNSPECIFIED: Function.DefinitionType.ValueType  # 0
+    DEFINITION_TYPE_SERIALIZED: Function.DefinitionType.ValueType  # 1
+    DEFINITION_TYPE_FILE: Function.DefinitionType.ValueType  # 2
+
+    class _FunctionType:
+        ValueType = typing.NewType('ValueType', builtins.int)
+        V: typing_extensions.TypeAlias = ValueType
+    class _FunctionTypeEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[Function._FunctionType.ValueType], builtins.type):
+        DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+        FUNCTION_TYPE_UNSPECIFIED: Function._FunctionType.ValueType  # 0
+        FUNCTION_TYPE_GENERATOR: Function._FunctionType.ValueType  # 1
+        FUNCTION_TYPE_FUNCTION: Function._FunctionType.ValueType  # 2
+    class FunctionType(_FunctionType, metaclass=_FunctionTypeEnumTypeWrapper):
+        pass
+
+    FUNCTION_TYPE_UNSPECIFIED: Function.FunctionType.ValueType  # 0
+    FUNCTION_TYPE_GENERATOR: Function.FunctionType.ValueType  # 1
+    FUNCTION_TYPE_FUNCTION: Function.FunctionType.ValueType  # 2
+
+    MODULE_NAME_FIELD_NUMBER: builtins.int
+    FUNCTION_NAME_FIELD_NUMBER: builtins.int
+    MOUNT_IDS_FIELD_NUMBER: builtins.int
+    IMAGE_ID_FIELD_NUMBER: builtins.int
+    FUNCTION_SERIALIZED_FIELD_NUMBER: builtins.int
+    DEFINITION_TYPE_FIELD_NUMBER: builtins.int
+    FUNCTION_TYPE_FIELD_NUMBER: builtins.int
+    RESOURCES_FIELD_NUMBER: builtins.int
+    SECRET_IDS_FIELD_NUMBER: builtins.int
+    RATE_LIMIT_FIELD_NUMBER: builtins.int
+    WEBHOOK_CONFIG_FIELD_NUMBER: builtins.int
+    SHARED_VOLUME_MOUNTS_FIELD_NUMBER: builtins.int
+    PROXY_ID_FIELD_NUMBER: builtins.int
+    RETRY_POLICY_FIELD_NUMBER: builtins.int
+    CONCURRENCY_LIMIT_FIELD_NUMBER: builtins.int
+    KEEP_WARM_FIELD_NUMBER: builtins.int
+    TIMEOUT_SECS_FIELD_NUMBER: builtins.int
+    PTY_INFO_FIELD_NUMBER: builtins.int
+    CLASS_SERIALIZED_FIELD_NUMBER: builtins.int
+    TASK_IDLE_TIMEOUT_SECS_FIELD_NUMBER: builtins.int
+    CLOUD_PROVIDER_FIELD_NUMBER: builtins.int
+    WARM_POOL_SIZE_FIELD_NUMBER: builtins.int
+    WEB_URL_FIELD_NUMBER: builtins.int
+    WEB_URL_INFO_FIELD_NUMBER: builtins.int
+    module_name: typing.Text
+    function_name: typing.Text
+    @property
+    def mount_ids(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[typing.Text]: ...
+    image_id: typing.Text
+    function_serialized: builtins.bytes
+    definition_type: global___Function.DefinitionType.ValueType
+    function_type: global___Function.FunctionType.ValueType
+    @property
+    def resources(self) -> global___Resources: ...
+    @property
+    def secret_ids(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[typing.Text]: ...
+    @property
+    def rate_limit(self) -> global___RateLimit: ...
+    @property
+    def webhook_config(self) -> global___WebhookConfig: ...
+    @property
+    def shared_volume_mounts(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___SharedVolumeMount]: ...
+    proxy_id: typing.Text
+    @property
+    def retry_policy(self) -> global___FunctionRetryPolicy: ...
+    concurrency_limit: builtins.int
+    keep_warm: builtins.bool
+    timeout_secs: builtins.int
+    @property
+    def pty_info(self) -> global___PTYInfo: ...
+    class_serialized: builtins.bytes
+    task_idle_timeout_secs: builtins.int
+    cloud_provider: global___CloudProvider.ValueType
+    warm_pool_size: builtins.int
+    web_url: typing.Text
+    @property
+    def web_url_info(self) -> global___WebUrlInfo: ...
+    def __init__(self,
+        *,
+        module_name: typing.Text = ...,
+        function_name: typing.Text = ...,
+        mount_ids: typing.Optional[typing.Iterable[typing.Text]] = ...,
+        image_id: typing.Text = ...,
+        function_serialized: builtins.bytes = ...,
+        definition_type: global___Function.DefinitionType.ValueType = ...,
+        function_type: global___Function.FunctionType.ValueType = ...,
+        resources: typing.Optional[global___Resources] = ...,
+        secret_ids: typing.Optional[typing.Iterable[typing.Text]] = ...,
+        rate_limit: typing.Optional[global___RateLimit] = ...,
+        webhook_config: typing.Optional[global___WebhookConfig] = ...,
+        shared_volume_mounts: typing.Optional[typing.Iterable[global___SharedVolumeMount]] = ...,
+        proxy_id: typing.Optional[typing.Text] = ...,
+        retry_policy: typing.Optional[global___FunctionRetryPolicy] = ...,
+        concurrency_limit: builtins.int = ...,
+        keep_warm: builtins.bool = ...,
+        timeout_secs: builtins.int = ...,
+        pty_info: typing.Optional[global___PTYInfo] = ...,
+        class_serialized: builtins.bytes = ...,
+        task_idle_timeout_secs: builtins.int = ...,
+        cloud_provider: global___CloudProvider.ValueType = ...,
+        warm_pool_size: builtins.int = ...,
+        web_url: typing.Text = ...,
+        web_url_info: typing.Optional[global___WebUrlInfo] = ...,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["_proxy_id",b"_proxy_id","proxy_id",b"proxy_id","pty_info",b"pty_info","rate_limit",b"rate_limit","resources",b"resources","retry_policy",b"retry_policy","web_url_info",b"web_url_info","webhook_config",b"webhook_config"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["_proxy_id",b"_proxy_id","class_serialized",b"class_serialized","cloud_provider",b"cloud_provider","concurrency_limit",b"concurrency_limit","definition_type",b"definition_type","function_name",b"function_name","function_serialized",b"function_serialized","function_type",b"function_type","image_id",b"image_id","keep_warm",b"keep_warm","module_name",b"module_name","mount_ids",b"mount_ids","proxy_id",b"proxy_id","pty_info",b"pty_info","rate_limit",b"rate_limit","resources",b"resources","retry_policy",b"retry_policy","secret_ids",b"secret_ids","shared_volume_mounts",b"shared_volume_mounts","task_idle_timeout_secs",b"task_idle_timeout_secs","timeout_secs",b"timeout_secs","warm_pool_size",b"warm_pool_size","web_url",b"web_url","web_url_info",b"web_url_info","webhook_config",b"webhook_config"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["_proxy_id",b"_proxy_id"]) -> typing.Optional[typing_extensions.Literal["proxy_id"]]: ...
+global___Function = Function
+
+class FunctionCreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    FUNCTION_FIELD_NUMBER: builtins.int
+    APP_ID_FIELD_NUMBER: builtins.int
+    SCHEDULE_FIELD_NUMBER: builtins.int
+    EXISTING_FUNCTION_ID_FIELD_NUMBER: builtins.int
+    @property
+    def function(self) -> global___Function: ...
+    app_id: typing.Text
+    @property
+    def schedule(self) -> global___Schedule: ...
+    existing_function_id: typing.Text
+    def __init__(self,
+        *,
+        function: typing.Optional[global___Function] = ...,
+        app_id: typing.Text = ...,
+        schedule: typing.Optional[global___Schedule] = ...,
+        existing_function_id: typing.Text = ...,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["function",b"function","schedule",b"schedule"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id",b"app_id","existing_function_id",b"existing_function_id","function",b"function","schedule",b"schedule"]) -> None: ...
+global___FunctionCreateRequest = FunctionCreateRequest
+
+class FunctionCreateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    FUNCTION_ID_FIELD_NUMBER: builtins.int
+    WEB_URL_FIELD_NUMBER: builtins.int
+    WEB_URL_INFO_FIELD_NUMBER: builtins.int
+    FUNCTION_FIELD_NUMBER: builtins.int
+    function_id: typing.Text
+    web_url: typing.Text
+    """TODO(erikbern): deprecated shortly (moving it into Function)"""
+
+    @property
+    def web_url_info(self) -> global___WebUrlInfo:
+        """TODO(erikbern): deprecated shortly (moving it into Function)"""
+        pass
+    @property
+    def function(self) -> global___Function: ...
+    def __init__(self,
+        *,
+        function_id: typing.Text = ...,
+        web_url: typing.Text = ...,
+        web_url_info: typing.Optional[global___WebUrlInfo] = ...,
+        function: typing.Optional[global___Function] = ...,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["function",b"function","web_url_info",b"web_url_info"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function",b"function","function_id",b"function_id","web_url",b"web_url","web_url_info",b"web_url_info"]) -> None: ...
+global___FunctionCreateResponse = FunctionCreateResponse
+
+class FunctionGetInputsItem(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    INPUT_ID_FIELD_NUMBER: builtins.int
+    INPUT_FIELD_NUMBER: builtins.int
+    KILL_SWITCH_FIELD_NUMBER: builtins.int
+    input_id: typing.Text
+    @property
+    def input(self) -> global___FunctionInput: ...
+    kill_switch: builtins.bool
+    def __init__(self,
+        *,
+        input_id: typing.Text = ...,
+        input: typing.Optional[global___FunctionInput] = ...,
+        kill_switch: builtins.bool = ...,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["input",b"input"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["input",b"input","input_id",b"input_id","kill_switch",b"kill_switch"]) -> None: ...
+global___FunctionGetInputsItem = FunctionGetInputsItem
+
+class FunctionGetInputsRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    FUNCTION_ID_FIELD_NUMBER: builtins.int
+    MAX_VALUES_FIELD_NUMBER: builtins.int
+    AVERAGE_CALL_TIME_FIELD_NUMBER: builtins.int
+    function_id: typing.Text
+    max_values: builtins.int
+    average_call_time: builtins.float
+    def __init__(self,
+        *,
+        function_id: typing.Text = ...,
+        max_values: builtins.int = ...,
+        average_call_time: builtins.float = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["average_call_time",b"average_call_time","function_id",b"function_id","max_values",b"max_values"]) -> None: ...
+global___FunctionGetInputsRequest = FunctionGetInputsRequest
+
+class FunctionGetInputsResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    INPUTS_FIELD_NUMBER: builtins.int
+    RATE_LIMIT_SLEEP_DURATION_FIELD_NUMBER: builtins.int
+    @property
+    def inputs(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___FunctionGetInputsItem]: ...
+    rate_limit_sleep_duration: builtins.float
+    """How long to sleep before requesting another input."""
+
+    def __init__(self,
+        *,
+        inputs: typing.Optional[typing.Iterable[global___FunctionGetInputsItem]] = ...,
+        rate_limit_sleep_duration: builtins.float = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["inputs",b"inputs","rate_limit_sleep_duration",b"rate_limit_sleep_duration"]) -> None: ...
+global___FunctionGetInputsResponse = FunctionGetInputsResponse
+
+class FunctionGetOutputsItem(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    RESULT_FIELD_NUMBER: builtins.int
+    IDX_FIELD_NUMBER: builtins.int
+    INPUT_ID_FIELD_NUMBER: builtins.int
+    GEN_INDEX_FIELD_NUMBER: builtins.int
+    @property
+    def result(self) -> global___GenericResult: ...
+    idx: builtins.int
+    input_id: typing.Text
+    gen_index: builtins.int
+    def __init__(self,
+        *,
+        result: typing.Optional[global___GenericResult] = ...,
+        idx: builtins.int = ...,
+        input_id: typing.Text = ...,
+        gen_index: builtins.int = ...,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["result",b"result"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["gen_index",b"gen_index","idx",b"idx","input_id",b"input_id","result",b"result"]) -> None: ...
+global___FunctionGetOutputsItem = FunctionGetOutputsItem
+
+class FunctionGetOutputsRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    FUNCTION_CALL_ID_FIELD_NUMBER: builtins.int
+    MAX_VALUES_FIELD_NUMBER: builtins.int
+    TIMEOUT_FIELD_NUMBER: builtins.int
+    LAST_ENTRY_ID_FIELD_NUMBER: builtins.int
+    CLEAR_ON_SUCCESS_FIELD_NUMBER: builtins.int
+    function_call_id: typing.Text
+    max_values: builtins.int
+    timeout: builtins.float
+    last_entry_id: typing.Text
+    clear_on_success: builtins.bool
+    """expires *any* remaining outputs soon after this call, not just the returned ones"""
+
+    def __init__(self,
+        *,
+        function_call_id: typing.Text = ...,
+        max_values: builtins.int = ...,
+        timeout: builtins.float = ...,
+        last_entry_id: typing.Text = ...,
+        clear_on_success: builtins.bool = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["clear_on_success",b"clear_on_success","function_call_id",b"function_call_id","last_entry_id",b"last_entry_id","max_values",b"max_values","timeout",b"timeout"]) -> None: ...
+global___FunctionGetOutputsRequest = FunctionGetOutputsRequest
+
+class FunctionGetOutputsResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    IDXS_FIELD_NUMBER: builtins.int
+    OUTPUTS_FIELD_NUMBER: builtins.int
+    LAST_ENTRY_ID_FIELD_NUMBER: builtins.int
+    @property
+    def idxs(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.int]: ...
+    @property
+    def outputs(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___FunctionGetOutputsItem]: ...
+    last_entry_id: typing.Text
+    def __init__(self,
+        *,
+        idxs: typing.Optional[typing.Iterable[builtins.int]] = ...,
+        outputs: typing.Optional[typing.Iterable[global___FunctionGetOutputsItem]] = ...,
+        last_entry_id: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["idxs",b"idxs","last_entry_id",b"last_entry_id","outputs",b"outputs"]) -> None: ...
+global___FunctionGetOutputsResponse = FunctionGetOutputsResponse
+
+class FunctionGetSerializedRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    FUNCTION_ID_FIELD_NUMBER: builtins.int
+    function_id: typing.Text
+    def __init__(self,
+        *,
+        function_id: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function_id",b"function_id"]) -> None: ...
+global___FunctionGetSerializedRequest = FunctionGetSerializedRequest
+
+class FunctionGetSerializedResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    FUNCTION_SERIALIZED_FIELD_NUMBER: builtins.int
+    CLASS_SERIALIZED_FIELD_NUMBER: builtins.int
+    function_serialized: builtins.bytes
+    class_serialized: builtins.bytes
+    def __init__(self,
+        *,
+        function_serialized: builtins.bytes = ...,
+        class_serialized: builtins.bytes = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["class_serialized",b"class_serialized","function_serialized",b"function_serialized"]) -> None: ...
+global___FunctionGetSerializedResponse = FunctionGetSerializedResponse
+
+class FunctionInput(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    ARGS_FIELD_NUMBER: builtins.int
+    ARGS_BLOB_ID_FIELD_NUMBER: builtins.int
+    FINAL_INPUT_FIELD_NUMBER: builtins.int
+    args: builtins.bytes
+    args_blob_id: typing.Text
+    final_input: builtins.bool
+    """TODO(erikbern): deprecate?"""
+
+    def __init__(self,
+        *,
+        args: builtins.bytes = ...,
+        args_blob_id: typing.Text = ...,
+        final_input: builtins.bool = ...,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["args",b"args","args_blob_id",b"args_blob_id","args_oneof",b"args_oneof"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["args",b"args","args_blob_id",b"args_blob_id","args_oneof",b"args_oneof","final_input",b"final_input"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["args_oneof",b"args_oneof"]) -> typing.Optional[typing_extensions.Literal["args","args_blob_id"]]: ...
+global___FunctionInput = FunctionInput
+
+class FunctionMapRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    FUNCTION_ID_FIELD_NUMBER: builtins.int
+    PARENT_INPUT_ID_FIELD_NUMBER: builtins.int
+    function_id: typing.Text
+    parent_input_id: typing.Text
+    def __init__(self,
+        *,
+        function_id: typing.Text = ...,
+        parent_input_id: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function_id",b"function_id","parent_input_id",b"parent_input_id"]) -> None: ...
+global___FunctionMapRequest = FunctionMapRequest
+
+class FunctionMapResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    FUNCTION_CALL_ID_FIELD_NUMBER: builtins.int
+    function_call_id: typing.Text
+    def __init__(self,
+        *,
+        function_call_id: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function_call_id",b"function_call_id"]) -> None: ...
+global___FunctionMapResponse = FunctionMapResponse
+
+class FunctionPutInputsItem(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    IDX_FIELD_NUMBER: builtins.int
+    INPUT_FIELD_NUMBER: builtins.int
+    idx: builtins.int
+    @property
+    def input(self) -> global___FunctionInput: ...
+    def __init__(self,
+        *,
+        idx: builtins.int = ...,
+        input: typing.Optional[global___FunctionInput] = ...,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["input",b"input"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["idx",b"idx","input",b"input"]) -> None: ...
+global___FunctionPutInputsItem = FunctionPutInputsItem
+
+class FunctionPutInputsRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    FUNCTION_ID_FIELD_NUMBER: builtins.int
+    FUNCTION_CALL_ID_FIELD_NUMBER: builtins.int
+    INPUTS_FIELD_NUMBER: builtins.int
+    function_id: typing.Text
+    function_call_id: typing.Text
+    @property
+    def inputs(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___FunctionPutInputsItem]: ...
+    def __init__(self,
+        *,
+        function_id: typing.Text = ...,
+        function_call_id: typing.Text = ...,
+        inputs: typing.Optional[typing.Iterable[global___FunctionPutInputsItem]] = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function_call_id",b"function_call_id","function_id",b"function_id","inputs",b"inputs"]) -> None: ...
+global___FunctionPutInputsRequest = FunctionPutInputsRequest
+
+class FunctionPutInputsResponseItem(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    IDX_FIELD_NUMBER: builtins.int
+    INPUT_ID_FIELD_NUMBER: builtins.int
+    idx: builtins.int
+    input_id: typing.Text
+    def __init__(self,
+        *,
+        idx: builtins.int = ...,
+        input_id: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["idx",b"idx","input_id",b"input_id"]) -> None: ...
+global___FunctionPutInputsResponseItem = FunctionPutInputsResponseItem
+
+class FunctionPutInputsResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    INPUTS_FIELD_NUMBER: builtins.int
+    @property
+    def inputs(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___FunctionPutInputsResponseItem]: ...
+    def __init__(self,
+        *,
+        inputs: typing.Optional[typing.Iterable[global___FunctionPutInputsResponseItem]] = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["inputs",b"inputs"]) -> None: ...
+global___FunctionPutInputsResponse = FunctionPutInputsResponse
+
+class FunctionPutOutputsItem(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    INPUT_ID_FIELD_NUMBER: builtins.int
+    RESULT_FIELD_NUMBER: builtins.int
+    INPUT_STARTED_AT_FIELD_NUMBER: builtins.int
+    OUTPUT_CREATED_AT_FIELD_NUMBER: builtins.int
+    GEN_INDEX_FIELD_NUMBER: builtins.int
+    input_id: typing.Text
+    @property
+    def result(self) -> global___GenericResult: ...
+    input_started_at: builtins.float
+    output_created_at: builtins.float
+    gen_index: builtins.int
+    """ordering for generator outputs"""
+
+    def __init__(self,
+        *,
+        input_id: typing.Text = ...,
+        result: typing.Optional[global___GenericResult] = ...,
+        input_started_at: builtins.float = ...,
+        output_created_at: builtins.float = ...,
+        gen_index: builtins.int = ...,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["result",b"result"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["gen_index",b"gen_index","input_id",b"input_id","input_started_at",b"input_started_at","output_created_at",b"output_created_at","result",b"result"]) -> None: ...
+global___FunctionPutOutputsItem = FunctionPutOutputsItem
+
+class FunctionPutOutputsRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    OUTPUTS_FIELD_NUMBER: builtins.int
+    @property
+    def outputs(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___FunctionPutOutputsItem]: ...
+    def __init__(self,
+        *,
+        outputs: typing.Optional[typing.Iterable[global___FunctionPutOutputsItem]] = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["outputs",b"outputs"]) -> None: ...
+global___FunctionPutOutputsRequest = FunctionPutOutputsRequest
+
+class FunctionRetryPolicy(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    BACKOFF_COEFFICIENT_FIELD_NUMBER: builtins.int
+    INITIAL_DELAY_MS_FIELD_NUMBER: builtins.int
+    MAX_DELAY_MS_FIELD_NUMBER: builtins.int
+    RETRIES_FIELD_NUMBER: builtins.int
+    backoff_coefficient: builtins.float
+    initial_delay_ms: builtins.int
+    max_delay_ms: builtins.int
+    retries: builtins.int
+    """NOTE: two-byte field number not used for special reason. copy-paste error. Ref: PR #2542"""
+
+    def __init__(self,
+        *,
+        backoff_coefficient: builtins.float = ...,
+        initial_delay_ms: builtins.int = ...,
+        max_delay_ms: builtins.int = ...,
+        retries: builtins.int = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["backoff_coefficient",b"backoff_coefficient","initial_delay_ms",b"initial_delay_ms","max_delay_ms",b"max_delay_ms","retries",b"retries"]) -> None: ...
+global___FunctionRetryPolicy = FunctionRetryPolicy
+
+class FunctionGetCallGraphRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    FUNCTION_CALL_ID_FIELD_NUMBER: builtins.int
+    function_call_id: typing.Text
+    """TODO: use input_id once we switch client submit API to return those."""
+
+    def __init__(self,
+        *,
+        function_call_id: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function_call_id",b"function_call_id"]) -> None: ...
+global___FunctionGetCallGraphRequest = FunctionGetCallGraphRequest
+
+class InputCallGraphInfo(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    INPUT_ID_FIELD_NUMBER: builtins.int
+    STATUS_FIELD_NUMBER: builtins.int
+    FUNCTION_CALL_ID_FIELD_NUMBER: builtins.int
+    TASK_ID_FIELD_NUMBER: builtins.int
+    input_id: typing.Text
+    status: global___GenericResult.GenericStatus.ValueType
+    function_call_id: typing.Text
+    task_id: typing.Text
+    def __init__(self,
+        *,
+        input_id: typing.Text = ...,
+        status: global___GenericResult.GenericStatus.ValueType = ...,
+        function_call_id: typing.Text = ...,
+        task_id: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function_call_id",b"function_call_id","input_id",b"input_id","status",b"status","task_id",b"task_id"]) -> None: ...
+global___InputCallGraphInfo = InputCallGraphInfo
+
+class FunctionCallCallGraphInfo(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    FUNCTION_CALL_ID_FIELD_NUMBER: builtins.int
+    PARENT_INPUT_ID_FIELD_NUMBER: builtins.int
+    FUNCTION_NAME_FIELD_NUMBER: builtins.int
+    MODULE_NAME_FIELD_NUMBER: builtins.int
+    function_call_id: typing.Text
+    parent_input_id: typing.Text
+    function_name: typing.Text
+    module_name: typing.Text
+    def __init__(self,
+        *,
+        function_call_id: typing.Text = ...,
+        parent_input_id: typing.Text = ...,
+        function_name: typing.Text = ...,
+        module_name: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function_call_id",b"function_call_id","function_name",b"function_name","module_name",b"module_name","parent_input_id",b"parent_input_id"]) -> None: ...
+global___FunctionCallCallGraphInfo = FunctionCallCallGraphInfo
+
+class FunctionGetCallGraphResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    INPUTS_FIELD_NUMBER: builtins.int
+    FUNCTION_CALLS_FIELD_NUMBER: builtins.int
+    @property
+    def inputs(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___InputCallGraphInfo]: ...
+    @property
+    def function_calls(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___FunctionCallCallGraphInfo]: ...
+    def __init__(self,
+        *,
+        inputs: typing.Optional[typing.Iterable[global___InputCallGraphInfo]] = ...,
+        function_calls: typing.Optional[typing.Iterable[global___FunctionCallCallGraphInfo]] = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function_calls",b"function_calls","inputs",b"inputs"]) -> None: ...
+global___FunctionGetCallGraphResponse = FunctionGetCallGraphResponse
+
+class FunctionCallCancelRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    FUNCTION_CALL_ID_FIELD_NUMBER: builtins.int
+    function_call_id: typing.Text
+    def __init__(self,
+        *,
+        function_call_id: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function_call_id",b"function_call_id"]) -> None: ...
+global___FunctionCallCancelRequest = FunctionCallCancelRequest
+
+class FunctionGetCurrentStatsRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    FUNCTION_ID_FIELD_NUMBER: builtins.int
+    function_id: typing.Text
+    def __init__(self,
+        *,
+        function_id: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function_id",b"function_id"]) -> None: ...
+global___FunctionGetCurrentStatsRequest = FunctionGetCurrentStatsRequest
+
+class FunctionStats(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    BACKLOG_FIELD_NUMBER: builtins.int
+    NUM_ACTIVE_TASKS_FIELD_NUMBER: builtins.int
+    NUM_TOTAL_TASKS_FIELD_NUMBER: builtins.int
+    backlog: builtins.int
+    num_active_tasks: builtins.int
+    num_total_tasks: builtins.int
+    def __init__(self,
+        *,
+        backlog: builtins.int = ...,
+        num_active_tasks: builtins.int = ...,
+        num_total_tasks: builtins.int = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["backlog",b"backlog","num_active_tasks",b"num_active_tasks","num_total_tasks",b"num_total_tasks"]) -> None: ...
+global___FunctionStats = FunctionStats
+
+class GenericResult(google.protobuf.message.Message):
+    """Used for both tasks and function outputs"""
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    class _GenericStatus:
+        ValueType = typing.NewType('ValueType', builtins.int)
+        V: typing_extensions.TypeAlias = ValueType
+    class _GenericStatusEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[GenericResult._GenericStatus.ValueType], builtins.type):
+        DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+        GENERIC_STATUS_UNSPECIFIED: GenericResult._GenericStatus.ValueType  # 0
+        GENERIC_STATUS_SUCCESS: GenericResult._GenericStatus.ValueType  # 1
+        GENERIC_STATUS_FAILURE: GenericResult._GenericStatus.ValueType  # 2
+        GENERIC_STATUS_TERMINATED: GenericResult._GenericStatus.ValueType  # 3
+        """Used when a task was killed using an external signal."""
+
+        GENERIC_STATUS_TIMEOUT: GenericResult._GenericStatus.ValueType  # 4
+    class GenericStatus(_GenericStatus, metaclass=_GenericStatusEnumTypeWrapper):
+        pass
+
+    GENERIC_STATUS_UNSPECIFIED: GenericResult.GenericStatus.ValueType  # 0
+    GENERIC_STATUS_SUCCESS: GenericResult.GenericStatus.ValueType  # 1
+    GENERIC_STATUS_FAILURE: GenericResult.GenericStatus.ValueType  # 2
+    GENERIC_STATUS_TERMINATED: GenericResult.GenericStatus.ValueType  # 3
+    """Used when a task was killed using an external signal."""
+
+    GENERIC_STATUS_TIMEOUT: GenericResult.GenericStatus.ValueType  # 4
+
+    class _GeneratorStatus:
+        ValueType = typing.NewType('ValueType', builtins.int)
+        V: typing_extensions.TypeAlias = ValueType
+    class _GeneratorStatusEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[GenericResult._GeneratorStatus.ValueType], builtins.type):
+        DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+        GENERATOR_STATUS_UNSPECIFIED: GenericResult._GeneratorStatus.ValueType  # 0
+        GENERATOR_STATUS_INCOMPLETE: GenericResult._GeneratorStatus.ValueType  # 1
+        GENERATOR_STATUS_COMPLETE: GenericResult._GeneratorStatus.ValueType  # 2
+    class GeneratorStatus(_GeneratorStatus, metaclass=_GeneratorStatusEnumTypeWrapper):
+        pass
+
+    GENERATOR_STATUS_UNSPECIFIED: GenericResult.GeneratorStatus.ValueType  # 0
+    GENERATOR_STATUS_INCOMPLETE: GenericResult.GeneratorStatus.ValueType  # 1
+    GENERATOR_STATUS_COMPLETE: GenericResult.GeneratorStatus.ValueType  # 2
+
+    STATUS_FIELD_NUMBER: builtins.int
+    EXCEPTION_FIELD_NUMBER: builtins.int
+    EXITCODE_FIELD_NUMBER: builtins.int
+    TRACEBACK_FIELD_NUMBER: builtins.int
+    DATA_FIELD_NUMBER: builtins.int
+    DATA_BLOB_ID_FIELD_NUMBER: builtins.int
+    GEN_STATUS_FIELD_NUMBER: builtins.int
+    SERIALIZED_TB_FIELD_NUMBER: builtins.int
+    TB_LINE_CACHE_FIELD_NUMBER: builtins.int
+    status: global___GenericResult.GenericStatus.ValueType
+    exception: typing.Text
+    exitcode: builtins.int
+    traceback: typing.Text
+    data: builtins.bytes
+    data_blob_id: typing.Text
+    gen_status: global___GenericResult.GeneratorStatus.ValueType
+    serialized_tb: builtins.bytes
+    tb_line_cache: builtins.bytes
+    def __init__(self,
+        *,
+        status: global___GenericResult.GenericStatus.ValueType = ...,
+        exception: typing.Text = ...,
+        exitcode: builtins.int = ...,
+        traceback: typing.Text = ...,
+        data: builtins.bytes = ...,
+        data_blob_id: typing.Text = ...,
+        gen_status: global___GenericResult.GeneratorStatus.ValueType = ...,
+        serialized_tb: builtins.bytes = ...,
+        tb_line_cache: builtins.bytes = ...,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["data",b"data","data_blob_id",b"data_blob_id","data_oneof",b"data_oneof"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["data",b"data","data_blob_id",b"data_blob_id","data_oneof",b"data_oneof","exception",b"exception","exitcode",b"exitcode","gen_status",b"gen_status","serialized_tb",b"serialized_tb","status",b"status","tb_line_cache",b"tb_line_cache","traceback",b"traceback"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["data_oneof",b"data_oneof"]) -> typing.Optional[typing_extensions.Literal["data","data_blob_id"]]: ...
+global___GenericResult = GenericResult
+
+class Image(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    BASE_IMAGES_FIELD_NUMBER: builtins.int
+    DOCKERFILE_COMMANDS_FIELD_NUMBER: builtins.int
+    CONTEXT_FILES_FIELD_NUMBER: builtins.int
+    VERSION_FIELD_NUMBER: builtins.int
+    SECRET_IDS_FIELD_NUMBER: builtins.int
+    GPU_FIELD_NUMBER: builtins.int
+    BUILD_FUNCTION_DEF_FIELD_NUMBER: builtins.int
+    CONTEXT_MOUNT_ID_FIELD_NUMBER: builtins.int
+    GPU_CONFIG_FIELD_NUMBER: builtins.int
+    IMAGE_REGISTRY_CONFIG_FIELD_NUMBER: builtins.int
+    @property
+    def base_images(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___BaseImage]: ...
+    @property
+    def dockerfile_commands(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[typing.Text]: ...
+    @property
+    def context_files(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___ImageContextFile]: ...
+    version: typing.Text
+    @property
+    def secret_ids(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[typing.Text]: ...
+    gpu: builtins.bool
+    """Part of Image definition, because presence of GPU drivers
+    affects the image that's built.
+    Note: field 13 is getting replaced field 16. The client now sends both fields,
+    but the server still only reads field 13.
+    """
+
+    build_function_def: typing.Text
+    context_mount_id: typing.Text
+    @property
+    def gpu_config(self) -> global___GPUConfig: ...
+    @property
+    def image_registry_config(self) -> global___ImageRegistryConfig: ...
+    def __init__(self,
+        *,
+        base_images: typing.Optional[typing.Iterable[global___BaseImage]] = ...,
+        dockerfile_commands: typing.Optional[typing.Iterable[typing.Text]] = ...,
+        context_files: typing.Optional[typing.Iterable[global___ImageContextFile]] = ...,
+        version: typing.Text = ...,
+        secret_ids: typing.Optional[typing.Iterable[typing.Text]] = ...,
+        gpu: builtins.bool = ...,
+        build_function_def: typing.Text = ...,
+        context_mount_id: typing.Text = ...,
+        gpu_config: typing.Optional[global___GPUConfig] = ...,
+        image_registry_config: typing.Optional[global___ImageRegistryConfig] = ...,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["gpu_config",b"gpu_config","image_registry_config",b"image_registry_config"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["base_images",b"base_images","build_function_def",b"build_function_def","context_files",b"context_files","context_mount_id",b"context_mount_id","dockerfile_commands",b"dockerfile_commands","gpu",b"gpu","gpu_config",b"gpu_config","image_registry_config",b"image_registry_config","secret_ids",b"secret_ids","version",b"version"]) -> None: ...
+global___Image = Image
+
+class ImageContextFile(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    FILENAME_FIELD_NUMBER: builtins.int
+    DATA_FIELD_NUMBER: builtins.int
+    filename: typing.Text
+    data: builtins.bytes
+    def __init__(self,
+        *,
+        filename: typing.Text = ...,
+        data: builtins.bytes = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["data",b"data","filename",b"filename"]) -> None: ...
+global___ImageContextFile = ImageContextFile
+
+class ImageGetOrCreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    IMAGE_FIELD_NUMBER: builtins.int
+    APP_ID_FIELD_NUMBER: builtins.int
+    EXISTING_IMAGE_ID_FIELD_NUMBER: builtins.int
+    BUILD_FUNCTION_ID_FIELD_NUMBER: builtins.int
+    @property
+    def image(self) -> global___Image: ...
+    app_id: typing.Text
+    existing_image_id: typing.Text
+    """ignored"""
+
+    build_function_id: typing.Text
+    def __init__(self,
+        *,
+        image: typing.Optional[global___Image] = ...,
+        app_id: typing.Text = ...,
+        existing_image_id: typing.Text = ...,
+        build_function_id: typing.Text = ...,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["image",b"image"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id",b"app_id","build_function_id",b"build_function_id","existing_image_id",b"existing_image_id","image",b"image"]) -> None: ...
+global___ImageGetOrCreateRequest = ImageGetOrCreateRequest
+
+class ImageGetOrCreateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    IMAGE_ID_FIELD_NUMBER: builtins.int
+    image_id: typing.Text
+    def __init__(self,
+        *,
+        image_id: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["image_id",b"image_id"]) -> None: ...
+global___ImageGetOrCreateResponse = ImageGetOrCreateResponse
+
+class ImageJoinRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    IMAGE_ID_FIELD_NUMBER: builtins.int
+    TIMEOUT_FIELD_NUMBER: builtins.int
+    image_id: typing.Text
+    timeout: builtins.float
+    def __init__(self,
+        *,
+        image_id: typing.Text = ...,
+        timeout: builtins.float = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["image_id",b"image_id","timeout",b"timeout"]) -> None: ...
+global___ImageJoinRequest = ImageJoinRequest
+
+class ImageJoinResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    RESULT_FIELD_NUMBER: builtins.int
+    @property
+    def result(self) -> global___GenericResult: ...
+    def __init__(self,
+        *,
+        result: typing.Optional[global___GenericResult] = ...,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["result",b"result"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["result",b"result"]) -> None: ...
+global___ImageJoinResponse = ImageJoinResponse
+
+class MountBuildRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    APP_ID_FIELD_NUMBER: builtins.int
+    EXISTING_MOUNT_ID_FIELD_NUMBER: builtins.int
+    FILES_FIELD_NUMBER: builtins.int
+    MANIFEST_SHA256_HEX_FIELD_NUMBER: builtins.int
+    app_id: typing.Text
+    existing_mount_id: typing.Text
+    @property
+    def files(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___MountFile]: ...
+    manifest_sha256_hex: typing.Text
+    """digest of the sorted (filename, sha256_hex) pairs, see MountReuse"""
+
+    def __init__(self,
+        *,
+        app_id: typing.Text = ...,
+        existing_mount_id: typing.Text = ...,
+        files: typing.Optional[typing.Iterable[global___MountFile]] = ...,
+        manifest_sha256_hex: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id",b"app_id","existing_mount_id",b"existing_mount_id","files",b"files","manifest_sha256_hex",b"manifest_sha256_hex"]) -> None: ...
+global___MountBuildRequest = MountBuildRequest
+
+class MountBuildResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    MOUNT_ID_FIELD_NUMBER: builtins.int
+    mount_id: typing.Text
+    def __init__(self,
+        *,
+        mount_id: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["mount_id",b"mount_id"]) -> None: ...
+global___MountBuildResponse = MountBuildResponse
+
+class MountFile(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    FILENAME_FIELD_NUMBER: builtins.int
+    SHA256_HEX_FIELD_NUMBER: builtins.int
+    filename: typing.Text
+    sha256_hex: typing.Text
+    def __init__(self,
+        *,
+        filename: typing.Text = ...,
+        sha256_hex: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["filename",b"filename","sha256_hex",b"sha256_hex"]) -> None: ...
+global___MountFile = MountFile
+
+class MountGetMissingFilesRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    SHA256_HEXES_FIELD_NUMBER: builtins.int
+    @property
+    def sha256_hexes(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[typing.Text]: ...
+    def __init__(self,
+        *,
+        sha256_hexes: typing.Optional[typing.Iterable[typing.Text]] = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["sha256_hexes",b"sha256_hexes"]) -> None: ...
+global___MountGetMissingFilesRequest = MountGetMissingFilesRequest
+
+class MountGetMissingFilesResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    MISSING_SHA256_HEXES_FIELD_NUMBER: builtins.int
+    @property
+    def missing_sha256_hexes(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[typing.Text]:
+        """subset of the requested hashes that have to be uploaded"""
+        pass
+    def __init__(self,
+        *,
+        missing_sha256_hexes: typing.Optional[typing.Iterable[typing.Text]] = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["missing_sha256_hexes",b"missing_sha256_hexes"]) -> None: ...
+global___MountGetMissingFilesResponse = MountGetMissingFilesResponse
+
+class MountReuseRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    APP_ID_FIELD_NUMBER: builtins.int
+    MOUNT_ID_FIELD_NUMBER: builtins.int
+    MANIFEST_SHA256_HEX_FIELD_NUMBER: builtins.int
+    app_id: typing.Text
+    mount_id: typing.Text
+    manifest_sha256_hex: typing.Text
+    def __init__(self,
+        *,
+        app_id: typing.Text = ...,
+        mount_id: typing.Text = ...,
+        manifest_sha256_hex: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id",b"app_id","manifest_sha256_hex",b"manifest_sha256_hex","mount_id",b"mount_id"]) -> None: ...
+global___MountReuseRequest = MountReuseRequest
+
+class MountReuseResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    REUSED_FIELD_NUMBER: builtins.int
+    reused: builtins.bool
+    """false if the mount doesn't exist (anymore) or has a different manifest"""
+
+    def __init__(self,
+        *,
+        reused: builtins.bool = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["reused",b"reused"]) -> None: ...
+global___MountReuseResponse = MountReuseResponse
+
+class MountPutArchiveRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    DATA_FIELD_NUMBER: builtins.int
+    DATA_BLOB_ID_FIELD_NUMBER: builtins.int
+    data: builtins.bytes
+    data_blob_id: typing.Text
+    def __init__(self,
+        *,
+        data: builtins.bytes = ...,
+        data_blob_id: typing.Text = ...,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["data",b"data","data_blob_id",b"data_blob_id","data_oneof",b"data_oneof"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["data",b"data","data_blob_id",b"data_blob_id","data_oneof",b"data_oneof"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["data_oneof",b"data_oneof"]) -> typing.Optional[typing_extensions.Literal["data","data_blob_id"]]: ...
+global___MountPutArchiveRequest = MountPutArchiveRequest
+
+class MountPutArchiveResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    def __init__(self,
+        ) -> None: ...
+global___MountPutArchiveResponse = MountPutArchiveResponse
+
+class MountPutFileRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    SHA256_HEX_FIELD_NUMBER: builtins.int
+    DATA_FIELD_NUMBER: builtins.int
+    DATA_BLOB_ID_FIELD_NUMBER: builtins.int
+    sha256_hex: typing.Text
+    data: builtins.bytes
+    data_blob_id: typing.Text
+    def __init__(self,
+        *,
+        sha256_hex: typing.Text = ...,
+        data: builtins.bytes = ...,
+        data_blob_id: typing.Text = ...,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["data",b"data","data_blob_id",b"data_blob_id","data_oneof",b"data_oneof"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["data",b"data","data_blob_id",b"data_blob_id","data_oneof",b"data_oneof","sha256_hex",b"sha256_hex"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["data_oneof",b"data_oneof"]) -> typing.Optional[typing_extensions.Literal["data","data_blob_id"]]: ...
+global___MountPutFileRequest = MountPutFileRequest
+
+class MountPutFileResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    EXISTS_FIELD_NUMBER: builtins.int
+    exists: builtins.bool
+    def __init__(self,
+        *,
+        exists: builtins.bool = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["exists",b"exists"]) -> None: ...
+global___MountPutFileResponse = MountPutFileResponse
+
+class ProxyInfo(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    ELASTIC_IP_FIELD_NUMBER: builtins.int
+    PROXY_KEY_FIELD_NUMBER: builtins.int
+    REMOTE_ADDR_FIELD_NUMBER: builtins.int
+    REMOTE_PORT_FIELD_NUMBER: builtins.int
+    elastic_ip: typing.Text
+    proxy_key: typing.Text
+    remote_addr: typing.Text
+    remote_port: builtins.int
+    def __init__(self,
+        *,
+        elastic_ip: typing.Text = ...,
+        proxy_key: typing.Text = ...,
+        remote_addr: typing.Text = ...,
+        remote_port: builtins.int = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["elastic_ip",b"elastic_ip","proxy_key",b"proxy_key","remote_addr",b"remote_addr","remote_port",b"remote_port"]) -> None: ...
+global___ProxyInfo = ProxyInfo
+
+class QueueCreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    APP_ID_FIELD_NUMBER: builtins.int
+    EXISTING_QUEUE_ID_FIELD_NUMBER: builtins.int
+    app_id: typing.Text
+    existing_queue_id: typing.Text
+    def __init__(self,
+        *,
+        app_id: typing.Text = ...,
+        existing_queue_id: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id",b"app_id","existing_queue_id",b"existing_queue_id"]) -> None: ...
+global___QueueCreateRequest = QueueCreateRequest
+
+class QueueCreateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    QUEUE_ID_FIELD_NUMBER: builtins.int
+    queue_id: typing.Text
+    def __init__(self,
+        *,
+        queue_id: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["queue_id",b"queue_id"]) -> None: ...
+global___QueueCreateResponse = QueueCreateResponse
+
+class QueueGetRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    QUEUE_ID_FIELD_NUMBER: builtins.int
+    TIMEOUT_FIELD_NUMBER: builtins.int
+    N_VALUES_FIELD_NUMBER: builtins.int
+    queue_id: typing.Text
+    timeout: builtins.float
+    n_values: builtins.int
+    def __init__(self,
+        *,
+        queue_id: typing.Text = ...,
+        timeout: builtins.float = ...,
+        n_values: builtins.int = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["n_values",b"n_values","queue_id",b"queue_id","timeout",b"timeout"]) -> None: ...
+global___QueueGetRequest = QueueGetRequest
+
+class QueueGetResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    VALUES_FIELD_NUMBER: builtins.int
+    @property
+    def values(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.bytes]: ...
+    def __init__(self,
+        *,
+        values: typing.Optional[typing.Iterable[builtins.bytes]] = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["values",b"values"]) -> None: ...
+global___QueueGetResponse = QueueGetResponse
+
+class QueuePutRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    QUEUE_ID_FIELD_NUMBER: builtins.int
+    VALUES_FIELD_NUMBER: builtins.int
+    queue_id: typing.Text
+    @property
+    def values(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.bytes]: ...
+    def __init__(self,
+        *,
+        queue_id: typing.Text = ...,
+        values: typing.Optional[typing.Iterable[builtins.bytes]] = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["queue_id",b"queue_id","values",b"values"]) -> None: ...
+global___QueuePutRequest = QueuePutRequest
+
+class RateLimit(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    LIMIT_FIELD_NUMBER: builtins.int
+    INTERVAL_FIELD_NUMBER: builtins.int
+    limit: builtins.int
+    interval: global___RateLimitInterval.ValueType
+    def __init__(self,
+        *,
+        limit: builtins.int = ...,
+        interval: global___RateLimitInterval.ValueType = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["interval",b"interval","limit",b"limit"]) -> None: ...
+global___RateLimit = RateLimit
+
+class GPUConfig(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    TYPE_FIELD_NUMBER: builtins.int
+    COUNT_FIELD_NUMBER: builtins.int
+    MEMORY_FIELD_NUMBER: builtins.int
+    type: global___GPUType.ValueType
+    count: builtins.int
+    memory: builtins.int
+    def __init__(self,
+        *,
+        type: global___GPUType.ValueType = ...,
+        count: builtins.int = ...,
+        memory: builtins.int = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["count",b"count","memory",b"memory","type",b"type"]) -> None: ...
+global___GPUConfig = GPUConfig
+
+class Resources(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    GPU_FIELD_NUMBER: builtins.int
+    MEMORY_MB_FIELD_NUMBER: builtins.int
+    MILLI_CPU_FIELD_NUMBER: builtins.int
+    GPU_CONFIG_FIELD_NUMBER: builtins.int
+    gpu: builtins.bool
+    """Legacy GPU toggle."""
+
+    memory_mb: builtins.int
+    milli_cpu: builtins.int
+    @property
+    def gpu_config(self) -> global___GPUConfig: ...
+    def __init__(self,
+        *,
+        gpu: builtins.bool = ...,
+        memory_mb: builtins.int = ...,
+        milli_cpu: builtins.int = ...,
+        gpu_config: typing.Optional[global___GPUConfig] = ...,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["gpu_config",b"gpu_config"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["gpu",b"gpu","gpu_config",b"gpu_config","memory_mb",b"memory_mb","milli_cpu",b"milli_cpu"]) -> None: ...
+global___Resources = Resources
+
+class Schedule(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    class Cron(google.protobuf.message.Message):
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+        CRON_STRING_FIELD_NUMBER: builtins.int
+        cron_string: typing.Text
+        def __init__(self,
+            *,
+            cron_string: typing.Text = ...,
+            ) -> None: ...
+        def ClearField(self, field_name: typing_extensions.Literal["cron_string",b"cron_string"]) -> None: ...
+
+    class Period(google.protobuf.message.Message):
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+        YEARS_FIELD_NUMBER: builtins.int
+        MONTHS_FIELD_NUMBER: builtins.int
+        WEEKS_FIELD_NUMBER: builtins.int
+        DAYS_FIELD_NUMBER: builtins.int
+        HOURS_FIELD_NUMBER: builtins.int
+        MINUTES_FIELD_NUMBER: builtins.int
+        SECONDS_FIELD_NUMBER: builtins.int
+        years: builtins.int
+        months: builtins.int
+        weeks: builtins.int
+        days: builtins.int
+        hours: builtins.int
+        minutes: builtins.int
+        seconds: builtins.float
+        def __init__(self,
+            *,
+            years: builtins.int = ...,
+            months: builtins.int = ...,
+            weeks: builtins.int = ...,
+            days: builtins.int = ...,
+            hours: builtins.int = ...,
+            minutes: builtins.int = ...,
+            seconds: builtins.float = ...,
+            ) -> None: ...
+        def ClearField(self, field_name: typing_extensions.Literal["days",b"days","hours",b"hours","minutes",b"minutes","months",b"months","seconds",b"seconds","weeks",b"weeks","years",b"years"]) -> None: ...
+
+    CRON_FIELD_NUMBER: builtins.int
+    PERIOD_FIELD_NUMBER: builtins.int
+    @property
+    def cron(self) -> global___Schedule.Cron: ...
+    @property
+    def period(self) -> global___Schedule.Period: ...
+    def __init__(self,
+        *,
+        cron: typing.Optional[global___Schedule.Cron] = ...,
+        period: typing.Optional[global___Schedule.Period] = ...,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["cron",b"cron","period",b"period","schedule_oneof",b"schedule_oneof"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["cron",b"cron","period",b"period","schedule_oneof",b"schedule_oneof"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["schedule_oneof",b"schedule_oneof"]) -> typing.Optional[typing_extensions.Literal["cron","period"]]: ...
+global___Schedule = Schedule
+
+class SecretCreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    class EnvDictEntry(google.protobuf.message.Message):
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+        KEY_FIELD_NUMBER: builtins.int
+        VALUE_FIELD_NUMBER: builtins.int
+        key: typing.Text
+        value: typing.Text
+        def __init__(self,
+            *,
+            key: typing.Text = ...,
+            value: typing.Text = ...,
+            ) -> None: ...
+        def ClearField(self, field_name: typing_extensions.Literal["key",b"key","value",b"value"]) -> None: ...
+
+    ENV_DICT_FIELD_NUMBER: builtins.int
+    APP_ID_FIELD_NUMBER: builtins.int
+    TEMPLATE_TYPE_FIELD_NUMBER: builtins.int
+    EXISTING_SECRET_ID_FIELD_NUMBER: builtins.int
+    @property
+    def env_dict(self) -> google.protobuf.internal.containers.ScalarMap[typing.Text, typing.Text]: ...
+    app_id: typing.Text
+    template_type: typing.Text
+    existing_secret_id: typing.Text
+    def __init__(self,
+        *,
+        env_dict: typing.Optional[typing.Mapping[typing.Text, typing.Text]] = ...,
+        app_id: typing.Text = ...,
+        template_type: typing.Text = ...,
+        existing_secret_id: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id",b"app_id","env_dict",b"env_dict","existing_secret_id",b"existing_secret_id","template_type",b"template_type"]) -> None: ...
+global___SecretCreateRequest = SecretCreateRequest
+
+class SecretCreateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    SECRET_ID_FIELD_NUMBER: builtins.int
+    secret_id: typing.Text
+    def __init__(self,
+        *,
+        secret_id: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["secret_id",b"secret_id"]) -> None: ...
+global___SecretCreateResponse = SecretCreateResponse
+
+class SecretListItem(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    LABEL_FIELD_NUMBER: builtins.int
+    CREATED_AT_FIELD_NUMBER: builtins.int
+    LAST_USED_AT_FIELD_NUMBER: builtins.int
+    label: typing.Text
+    created_at: builtins.float
+    last_used_at: builtins.float
+    def __init__(self,
+        *,
+        label: typing.Text = ...,
+        created_at: builtins.float = ...,
+        last_used_at: builtins.float = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["created_at",b"created_at","label",b"label","last_used_at",b"last_used_at"]) -> None: ...
+global___SecretListItem = SecretListItem
+
+class SecretListResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    ITEMS_FIELD_NUMBER: builtins.int
+    @property
+    def items(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___SecretListItem]: ...
+    def __init__(self,
+        *,
+        items: typing.Optional[typing.Iterable[global___SecretListItem]] = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["items",b"items"]) -> None: ...
+global___SecretListResponse = SecretListResponse
+
+class SharedVolumeCreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    APP_ID_FIELD_NUMBER: builtins.int
+    CLOUD_PROVIDER_FIELD_NUMBER: builtins.int
+    app_id: typing.Text
+    cloud_provider: global___CloudProvider.ValueType
+    def __init__(self,
+        *,
+        app_id: typing.Text = ...,
+        cloud_provider: global___CloudProvider.ValueType = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id",b"app_id","cloud_provider",b"cloud_provider"]) -> None: ...
+global___SharedVolumeCreateRequest = SharedVolumeCreateRequest
+
+class SharedVolumeCreateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    SHARED_VOLUME_ID_FIELD_NUMBER: builtins.int
+    shared_volume_id: typing.Text
+    def __init__(self,
+        *,
+        shared_volume_id: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["shared_volume_id",b"shared_volume_id"]) -> None: ...
+global___SharedVolumeCreateResponse = SharedVolumeCreateResponse
+
+class SharedVolumeListItem(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    LABEL_FIELD_NUMBER: builtins.int
+    SHARED_VOLUME_ID_FIELD_NUMBER: builtins.int
+    CREATED_AT_FIELD_NUMBER: builtins.int
+    CLOUD_PROVIDER_FIELD_NUMBER: builtins.int
+    label: typing.Text
+    """app name of object entity app"""
+
+    shared_volume_id: typing.Text
+    created_at: builtins.float
+    cloud_provider: global___CloudProvider.ValueType
+    def __init__(self,
+        *,
+        label: typing.Text = ...,
+        shared_volume_id: typing.Text = ...,
+        created_at: builtins.float = ...,
+        cloud_provider: global___CloudProvider.ValueType = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["cloud_provider",b"cloud_provider","created_at",b"created_at","label",b"label","shared_volume_id",b"shared_volume_id"]) -> None: ...
+global___SharedVolumeListItem = SharedVolumeListItem
+
+class SharedVolumeListResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    ITEMS_FIELD_NUMBER: builtins.int
+    @property
+    def items(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___SharedVolumeListItem]: ...
+    def __init__(self,
+        *,
+        items: typing.Optional[typing.Iterable[global___SharedVolumeListItem]] = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["items",b"items"]) -> None: ...
+global___SharedVolumeListResponse = SharedVolumeListResponse
+
+class SharedVolumeListFilesRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    SHARED_VOLUME_ID_FIELD_NUMBER: builtins.int
+    PATH_FIELD_NUMBER: builtins.int
+    shared_volume_id: typing.Text
+    path: typing.Text
+    def __init__(self,
+        *,
+        shared_volume_id: typing.Text = ...,
+        path: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["path",b"path","shared_volume_id",b"shared_volume_id"]) -> None: ...
+global___SharedVolumeListFilesRequest = SharedVolumeListFilesRequest
+
+class SharedVolumePutFileRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    SHARED_VOLUME_ID_FIELD_NUMBER: builtins.int
+    PATH_FIELD_NUMBER: builtins.int
+    SHA256_HEX_FIELD_NUMBER: builtins.int
+    DATA_FIELD_NUMBER: builtins.int
+    DATA_BLOB_ID_FIELD_NUMBER: builtins.int
+    shared_volume_id: typing.Text
+    path: typing.Text
+    sha256_hex: typing.Text
+    data: builtins.bytes
+    data_blob_id: typing.Text
+    def __init__(self,
+        *,
+        shared_volume_id: typing.Text = ...,
+        path: typing.Text = ...,
+        sha256_hex: typing.Text = ...,
+        data: builtins.bytes = ...,
+        data_blob_id: typing.Text = ...,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["data",b"data","data_blob_id",b"data_blob_id","data_oneof",b"data_oneof"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["data",b"data","data_blob_id",b"data_blob_id","data_oneof",b"data_oneof","path",b"path","sha256_hex",b"sha256_hex","shared_volume_id",b"shared_volume_id"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["data_oneof",b"data_oneof"]) -> typing.Optional[typing_extensions.Literal["data","data_blob_id"]]: ...
+global___SharedVolumePutFileRequest = SharedVolumePutFileRequest
+
+class SharedVolumeGetFileRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    SHARED_VOLUME_ID_FIELD_NUMBER: builtins.int
+    PATH_FIELD_NUMBER: builtins.int
+    shared_volume_id: typing.Text
+    path: typing.Text
+    def __init__(self,
+        *,
+        shared_volume_id: typing.Text = ...,
+        path: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["path",b"path","shared_volume_id",b"shared_volume_id"]) -> None: ...
+global___SharedVolumeGetFileRequest = SharedVolumeGetFileRequest
+
+class SharedVolumeGetFileResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    DATA_FIELD_NUMBER: builtins.int
+    DATA_BLOB_ID_FIELD_NUMBER: builtins.int
+    data: builtins.bytes
+    data_blob_id: typing.Text
+    def __init__(self,
+        *,
+        data: builtins.bytes = ...,
+        data_blob_id: typing.Text = ...,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["data",b"data","data_blob_id",b"data_blob_id","data_oneof",b"data_oneof"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["data",b"data","data_blob_id",b"data_blob_id","data_oneof",b"data_oneof"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["data_oneof",b"data_oneof"]) -> typing.Optional[typing_extensions.Literal["data","data_blob_id"]]: ...
+global___SharedVolumeGetFileResponse = SharedVolumeGetFileResponse
+
+class SharedVolumeRemoveFileRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    SHARED_VOLUME_ID_FIELD_NUMBER: builtins.int
+    PATH_FIELD_NUMBER: builtins.int
+    RECURSIVE_FIELD_NUMBER: builtins.int
+    shared_volume_id: typing.Text
+    path: typing.Text
+    recursive: builtins.bool
+    def __init__(self,
+        *,
+        shared_volume_id: typing.Text = ...,
+        path: typing.Text = ...,
+        recursive: builtins.bool = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["path",b"path","recursive",b"recursive","shared_volume_id",b"shared_volume_id"]) -> None: ...
+global___SharedVolumeRemoveFileRequest = SharedVolumeRemoveFileRequest
+
+class SharedVolumeListFilesEntry(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    class _FileType:
+        ValueType = typing.NewType('ValueType', builtins.int)
+        V: typing_extensions.TypeAlias = ValueType
+    class _FileTypeEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[SharedVolumeListFilesEntry._FileType.ValueType], builtins.type):
+        DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+        UNSPECIFIED: SharedVolumeListFilesEntry._FileType.ValueType  # 0
+        FILE: SharedVolumeListFilesEntry._FileType.ValueType  # 1
+        DIRECTORY: SharedVolumeListFilesEntry._FileType.ValueType  # 2
+    class FileType(_FileType, metaclass=_FileTypeEnumTypeWrapper):
+        pass
+
+    UNSPECIFIED: SharedVolumeListFilesEntry.FileType.ValueType  # 0
+    FILE: SharedVolumeListFilesEntry.FileType.ValueType  # 1
+    DIRECTORY: SharedVolumeListFilesEntry.FileType.ValueType  # 2
+
+    PATH_FIELD_NUMBER: builtins.int
+    TYPE_FIELD_NUMBER: builtins.int
+    path: typing.Text
+    type: global___SharedVolumeListFilesEntry.FileType.ValueType
+    def __init__(self,
+        *,
+        path: typing.Text = ...,
+        type: global___SharedVolumeListFilesEntry.FileType.ValueType = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["path",b"path","type",b"type"]) -> None: ...
+global___SharedVolumeListFilesEntry = SharedVolumeListFilesEntry
+
+class SharedVolumeListFilesResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    ENTRIES_FIELD_NUMBER: builtins.int
+    @property
+    def entries(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___SharedVolumeListFilesEntry]: ...
+    def __init__(self,
+        *,
+        entries: typing.Optional[typing.Iterable[global___SharedVolumeListFilesEntry]] = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["entries",b"entries"]) -> None: ...
+global___SharedVolumeListFilesResponse = SharedVolumeListFilesResponse
+
+class SharedVolumeMount(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    MOUNT_PATH_FIELD_NUMBER: builtins.int
+    SHARED_VOLUME_ID_FIELD_NUMBER: builtins.int
+    CLOUD_PROVIDER_FIELD_NUMBER: builtins.int
+    mount_path: typing.Text
+    shared_volume_id: typing.Text
+    cloud_provider: global___CloudProvider.ValueType
+    def __init__(self,
+        *,
+        mount_path: typing.Text = ...,
+        shared_volume_id: typing.Text = ...,
+        cloud_provider: global___CloudProvider.ValueType = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["cloud_provider",b"cloud_provider","mount_path",b"mount_path","shared_volume_id",b"shared_volume_id"]) -> None: ...
+global___SharedVolumeMount = SharedVolumeMount
+
+class TaskLogs(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    DATA_FIELD_NUMBER: builtins.int
+    TASK_STATE_FIELD_NUMBER: builtins.int
+    TIMESTAMP_FIELD_NUMBER: builtins.int
+    FILE_DESCRIPTOR_FIELD_NUMBER: builtins.int
+    TASK_PROGRESS_FIELD_NUMBER: builtins.int
+    FUNCTION_CALL_ID_FIELD_NUMBER: builtins.int
+    INPUT_ID_FIELD_NUMBER: builtins.int
+    data: typing.Text
+    task_state: global___TaskState.ValueType
+    timestamp: builtins.float
+    file_descriptor: global___FileDescriptor.ValueType
+    @property
+    def task_progress(self) -> global___TaskProgress: ...
+    function_call_id: typing.Text
+    input_id: typing.Text
+    def __init__(self,
+        *,
+        data: typing.Text = ...,
+        task_state: global___TaskState.ValueType = ...,
+        timestamp: builtins.float = ...,
+        file_descriptor: global___FileDescriptor.ValueType = ...,
+        task_progress: typing.Optional[global___TaskProgress] = ...,
+        function_call_id: typing.Text = ...,
+        input_id: typing.Text = ...,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["task_progress",b"task_progress"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["data",b"data","file_descriptor",b"file_descriptor","function_call_id",b"function_call_id","input_id",b"input_id","task_progress",b"task_progress","task_state",b"task_state","timestamp",b"timestamp"]) -> None: ...
+global___TaskLogs = TaskLogs
+
+class TaskProgress(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    LEN_FIELD_NUMBER: builtins.int
+    POS_FIELD_NUMBER: builtins.int
+    PROGRESS_TYPE_FIELD_NUMBER: builtins.int
+    DESCRIPTION_FIELD_NUMBER: builtins.int
+    len: builtins.int
+    pos: builtins.int
+    progress_type: global___ProgressType.ValueType
+    description: typing.Text
+    def __init__(self,
+        *,
+        len: builtins.int = ...,
+        pos: builtins.int = ...,
+        progress_type: global___ProgressType.ValueType = ...,
+        description: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["description",b"description","len",b"len","pos",b"pos","progress_type",b"progress_type"]) -> None: ...
+global___TaskProgress = TaskProgress
+
+class TaskLogsBatch(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    TASK_ID_FIELD_NUMBER: builtins.int
+    ITEMS_FIELD_NUMBER: builtins.int
+    ENTRY_ID_FIELD_NUMBER: builtins.int
+    APP_DONE_FIELD_NUMBER: builtins.int
+    FUNCTION_ID_FIELD_NUMBER: builtins.int
+    INPUT_ID_FIELD_NUMBER: builtins.int
+    task_id: typing.Text
+    @property
+    def items(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___TaskLogs]: ...
+    entry_id: typing.Text
+    app_done: builtins.bool
+    function_id: typing.Text
+    input_id: typing.Text
+    def __init__(self,
+        *,
+        task_id: typing.Text = ...,
+        items: typing.Optional[typing.Iterable[global___TaskLogs]] = ...,
+        entry_id: typing.Text = ...,
+        app_done: builtins.bool = ...,
+        function_id: typing.Text = ...,
+        input_id: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_done",b"app_done","entry_id",b"entry_id","function_id",b"function_id","input_id",b"input_id","items",b"items","task_id",b"task_id"]) -> None: ...
+global___TaskLogsBatch = TaskLogsBatch
+
+class TaskResultRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    TASK_ID_FIELD_NUMBER: builtins.int
+    RESULT_FIELD_NUMBER: builtins.int
+    task_id: typing.Text
+    """TODO: deprecate once old clients have been flushed."""
+
+    @property
+    def result(self) -> global___GenericResult: ...
+    def __init__(self,
+        *,
+        task_id: typing.Text = ...,
+        result: typing.Optional[global___GenericResult] = ...,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["result",b"result"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["result",b"result","task_id",b"task_id"]) -> None: ...
+global___TaskResultRequest = TaskResultRequest
+
+class TokenFlowCreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    NODE_NAME_FIELD_NUMBER: builtins.int
+    PLATFORM_NAME_FIELD_NUMBER: builtins.int
+    node_name: typing.Text
+    platform_name: typing.Text
+    def __init__(self,
+        *,
+        node_name: typing.Text = ...,
+        platform_name: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["node_name",b"node_name","platform_name",b"platform_name"]) -> None: ...
+global___TokenFlowCreateRequest = TokenFlowCreateRequest
+
+class TokenFlowCreateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    TOKEN_FLOW_ID_FIELD_NUMBER: builtins.int
+    WEB_URL_FIELD_NUMBER: builtins.int
+    token_flow_id: typing.Text
+    web_url: typing.Text
+    def __init__(self,
+        *,
+        token_flow_id: typing.Text = ...,
+        web_url: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["token_flow_id",b"token_flow_id","web_url",b"web_url"]) -> None: ...
+global___TokenFlowCreateResponse = TokenFlowCreateResponse
+
+class TokenFlowWaitRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    TIMEOUT_FIELD_NUMBER: builtins.int
+    TOKEN_FLOW_ID_FIELD_NUMBER: builtins.int
+    timeout: builtins.float
+    token_flow_id: typing.Text
+    def __init__(self,
+        *,
+        timeout: builtins.float = ...,
+        token_flow_id: typing.Text = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["timeout",b"timeout","token_flow_id",b"token_flow_id"]) -> None: ...
+global___TokenFlowWaitRequest = TokenFlowWaitRequest
+
+class TokenFlowWaitResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    TOKEN_ID_FIELD_NUMBER: builtins.int
+    TOKEN_SECRET_FIELD_NUMBER: builtins.int
+    TIMEOUT_FIELD_NUMBER: builtins.int
+    token_id: typing.Text
+    token_secret: typing.Text
+    timeout: builtins.bool
+    def __init__(self,
+        *,
+        token_id: typing.Text = ...,
+        token_secret: typing.Text = ...,
+        timeout: builtins.bool = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["timeout",b"timeout","token_id",b"token_id","token_secret",b"token_secret"]) -> None: ...
+global___TokenFlowWaitResponse = TokenFlowWaitResponse
+
+class WebhookConfig(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    TYPE_FIELD_NUMBER: builtins.int
+    METHOD_FIELD_NUMBER: builtins.int
+    WAIT_FOR_RESPONSE_FIELD_NUMBER: builtins.int
+    REQUESTED_SUFFIX_FIELD_NUMBER: builtins.int
+    ASYNC_MODE_FIELD_NUMBER: builtins.int
+    type: global___WebhookType.ValueType
+    method: typing.Text
+    wait_for_response: builtins.bool
+    """rolled into async_mode - remove when ending support for 0.44"""
+
+    requested_suffix: typing.Text
+    async_mode: global___WebhookAsyncMode.ValueType
+    def __init__(self,
+        *,
+        type: global___WebhookType.ValueType = ...,
+        method: typing.Text = ...,
+        wait_for_response: builtins.bool = ...,
+        requested_suffix: typing.Text = ...,
+        async_mode: global___WebhookAsyncMode.ValueType = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["async_mode",b"async_mode","method",b"method","requested_suffix",b"requested_suffix","type",b"type","wait_for_response",b"wait_for_response"]) -> None: ...
+global___WebhookConfig = WebhookConfig
+
+class WebUrlInfo(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    TRUNCATED_FIELD_NUMBER: builtins.int
+    HAS_UNIQUE_HASH_FIELD_NUMBER: builtins.int
+    LABEL_STOLEN_FIELD_NUMBER: builtins.int
+    truncated: builtins.bool
+    has_unique_hash: builtins.bool
+    label_stolen: builtins.bool
+    def __init__(self,
+        *,
+        truncated: builtins.bool = ...,
+        has_unique_hash: builtins.bool = ...,
+        label_stolen: builtins.bool = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["has_unique_hash",b"has_unique_hash","label_stolen",b"label_stolen","truncated",b"truncated"]) -> None: ...
+global___WebUrlInfo = WebUrlInfo
@@ -4,7 +4,9 @@ import dataclasses
 import hashlib
 from typing import IO, Union
 
-HASH_CHUNK_SIZE = 4096
+# Large reads amortize the per-call overhead, and hashlib releases the GIL
+# while hashing them, so hashing can run in a worker thread
+HASH_CHUNK_SIZE = 2**20  # 1MiB
 
 
 def _update(hashers, data: Union[bytes, IO[bytes]]):
@@ -47,6 +49,9 @@ class UploadHashes:
     md5_base64: str
     sha256_base64: str
 
+    def sha256_hex(self) -> str:
+        return base64.b64decode(self.sha256_base64).hex()
+
 
 def get_upload_hashes(data: Union[bytes, IO[bytes]]) -> UploadHashes:
     md5 = hashlib.md5()
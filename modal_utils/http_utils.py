@@ -1,14 +1,31 @@
 # Copyright Modal Labs 2022
+import asyncio
 import contextlib
+import functools
 import socket
 import ssl
-from typing import Optional
+from typing import Dict, Optional
 
 import certifi
 from aiohttp import ClientSession, ClientTimeout, TCPConnector
 from aiohttp.web import Application
 from aiohttp.web_runner import AppRunner, SockSite
 
+# Connection pool settings for the shared session used by blob transfers
+SHARED_SESSION_LIMIT = 100  # total number of simultaneous connections
+SHARED_SESSION_LIMIT_PER_HOST = 32  # simultaneous connections to the same endpoint
+SHARED_SESSION_KEEPALIVE_TIMEOUT = 30.0  # close idle connections after this many seconds
+SHARED_SESSION_DNS_CACHE_TTL = 300  # seconds to cache resolved host names
+
+_shared_sessions: Dict[asyncio.AbstractEventLoop, ClientSession] = {}
+_shared_session_refs: Dict[asyncio.AbstractEventLoop, int] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _ssl_context() -> ssl.SSLContext:
+    # Loading the certifi bundle takes a few ms, so we only do it once per process
+    return ssl.create_default_context(cafile=certifi.where())
+
 
 def http_client_with_tls(timeout: Optional[float]) -> ClientSession:
     """Create a new HTTP client session with standard, bundled TLS certificates.
@@ -20,11 +37,51 @@ def http_client_with_tls(timeout: Optional[float]) -> ClientSession:
     Specifically: the error "unable to get local issuer certificate" when making
     an aiohttp request.
     """
-    ssl_context = ssl.create_default_context(cafile=certifi.where())
-    connector = TCPConnector(ssl=ssl_context)
+    connector = TCPConnector(ssl=_ssl_context())
     return ClientSession(connector=connector, timeout=ClientTimeout(total=timeout))
 
 
+def shared_http_session() -> ClientSession:
+    """Return the pooled HTTP session for the running event loop, creating it if needed.
+
+    Unlike `http_client_with_tls`, the session keeps connections alive between requests
+    and caches DNS lookups, so repeated blob transfers don't pay for a new TCP connection
+    and TLS handshake every time. Callers must not close the returned session.
+    """
+    loop = asyncio.get_running_loop()
+    session = _shared_sessions.get(loop)
+    if session is None or session.closed:
+        connector = TCPConnector(
+            ssl=_ssl_context(),
+            limit=SHARED_SESSION_LIMIT,
+            limit_per_host=SHARED_SESSION_LIMIT_PER_HOST,
+            keepalive_timeout=SHARED_SESSION_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=SHARED_SESSION_DNS_CACHE_TTL,
+        )
+        session = ClientSession(connector=connector, timeout=ClientTimeout(total=None))
+        _shared_sessions[loop] = session
+    return session
+
+
+def acquire_shared_http_session() -> None:
+    """Register a user (typically a client) of the shared session on the running event loop."""
+    loop = asyncio.get_running_loop()
+    _shared_session_refs[loop] = _shared_session_refs.get(loop, 0) + 1
+
+
+async def release_shared_http_session() -> None:
+    """Unregister a user of the shared session, closing the session once there are no users left."""
+    loop = asyncio.get_running_loop()
+    n_refs = _shared_session_refs.get(loop, 0) - 1
+    if n_refs > 0:
+        _shared_session_refs[loop] = n_refs
+        return
+    _shared_session_refs.pop(loop, None)
+    session = _shared_sessions.pop(loop, None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
 @contextlib.asynccontextmanager
 async def run_temporary_http_server(app: Application):
     # Allocates a random port, runs a server in a context manager